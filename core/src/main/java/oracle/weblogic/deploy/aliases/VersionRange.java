@@ -0,0 +1,125 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * The Universal Permissive License (UPL), Version 1.0
+ */
+package oracle.weblogic.deploy.aliases;
+
+import oracle.weblogic.deploy.exception.ExceptionHelper;
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+import oracle.weblogic.deploy.util.StringUtils;
+
+/**
+ * A parsed Maven-style version range, or a single version, that can be tested against versions
+ * without parsing the range again.  Instances are immutable and are obtained from
+ * VersionUtils.getVersionRange(), which shares one instance for each distinct range string.
+ */
+public final class VersionRange {
+    private static final String CLASS = VersionRange.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.versions");
+
+    private final String range;
+    private final String lowerVersion;
+    private final String upperVersion;
+    private final boolean inclusiveStart;
+    private final boolean inclusiveEnd;
+    private final boolean singleVersion;
+
+    VersionRange(String range, String lowerVersion, String upperVersion) {
+        this.range = range;
+        this.lowerVersion = lowerVersion;
+        this.upperVersion = upperVersion;
+        this.inclusiveStart = range.startsWith("[");
+        this.inclusiveEnd = range.endsWith("]");
+        this.singleVersion = false;
+    }
+
+    VersionRange(String range, String version) {
+        this.range = range;
+        this.lowerVersion = version;
+        this.upperVersion = version;
+        this.inclusiveStart = true;
+        this.inclusiveEnd = true;
+        this.singleVersion = true;
+    }
+
+    /**
+     * Get the lower version of the range, or the version if the range is a single version.
+     *
+     * @return the lower version
+     */
+    public String getLowerVersion() {
+        return lowerVersion;
+    }
+
+    /**
+     * Get the upper version of the range, or the version if the range is a single version.
+     *
+     * @return the upper version, or null if the range has no upper bound
+     */
+    public String getUpperVersion() {
+        return upperVersion;
+    }
+
+    /**
+     * Is this a single version rather than a range of versions?
+     *
+     * @return true if this is a single version, false otherwise
+     */
+    public boolean isSingleVersion() {
+        return singleVersion;
+    }
+
+    /**
+     * Determine if the specified version is included in this version range.
+     *
+     * @param version the version to test
+     * @return true if the specified version falls within this version range, false otherwise
+     * @throws VersionException if a version in the range is not valid
+     * @throws IllegalArgumentException if the version is empty or null
+     */
+    public boolean includes(String version) throws VersionException {
+        final String METHOD = "includes";
+        LOGGER.entering(CLASS, METHOD, version, range);
+
+        if (StringUtils.isEmpty(version)) {
+            String message = ExceptionHelper.getMessage("WLSDPLY-08200");
+            IllegalArgumentException iae = new IllegalArgumentException(message);
+            LOGGER.throwing(CLASS, METHOD, iae);
+            throw iae;
+        }
+
+        boolean result = false;
+        if (singleVersion) {
+            result = (VersionUtils.compareVersions(version, lowerVersion) == 0);
+            LOGGER.finest("WLSDPLY-08205", version, lowerVersion, result);
+        } else {
+            int lowerCompare = VersionUtils.compareVersions(version, lowerVersion);
+            LOGGER.finest("WLSDPLY-08202", version, lowerVersion, lowerCompare);
+            if (lowerCompare > 0 || (lowerCompare == 0 && inclusiveStart)) {
+                if (!StringUtils.isEmpty(upperVersion)) {
+                    int upperCompare = VersionUtils.compareVersions(version, upperVersion);
+                    LOGGER.finest("WLSDPLY-08203", version, upperVersion, upperCompare);
+                    if (upperCompare < 0 || (upperCompare == 0 && inclusiveEnd)) {
+                        result = true;
+                    }
+                } else {
+                    LOGGER.finest("WLSDPLY-08204", range);
+                    result = true;
+                }
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Get the range string that this version range was parsed from.
+     *
+     * @return the range string
+     */
+    @Override
+    public String toString() {
+        return range;
+    }
+}
@@ -5,6 +5,8 @@
 package oracle.weblogic.deploy.aliases;
 
 import java.util.Arrays;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
 import java.util.regex.Matcher;
 import java.util.regex.Pattern;
 
@@ -37,6 +39,9 @@ public final class VersionUtils {
     private static final int VERSION_SIZE = 1;
     private static final int VERSION_INDEX = 0;
 
+    // The parsed version ranges, keyed by range string.  The alias files only use a few dozen distinct ranges.
+    private static final Map<String, VersionRange> VERSION_RANGES = new ConcurrentHashMap<>();
+
     private VersionUtils() {
         // hide the constructor on this utility class
     }
@@ -165,44 +170,43 @@ public final class VersionUtils {
             throw iae;
         }
 
-        String[] versions = getLowerAndUpperVersionStrings(range);
-        LOGGER.finest("WLSDPLY-08201", range, Arrays.asList(versions));
-        boolean result = false;
-        switch (versions.length) {
-            case RANGE_SIZE:
-                String lowerVersion = versions[RANGE_LOW_INDEX];
-                String upperVersion = versions[RANGE_HIGH_INDEX];
-                boolean inclusiveStart = range.startsWith("[");
-                boolean inclusiveEnd = range.endsWith("]");
-
-                int lowerCompare = compareVersions(version, lowerVersion);
-                LOGGER.finest("WLSDPLY-08202", version, lowerVersion, lowerCompare);
-                if (lowerCompare > 0 || (lowerCompare == 0 && inclusiveStart)) {
-                    if (!StringUtils.isEmpty(upperVersion)) {
-                        int upperCompare = compareVersions(version, upperVersion);
-                        LOGGER.finest("WLSDPLY-08203", version, upperVersion, upperCompare);
-                        if (upperCompare < 0 || (upperCompare == 0 && inclusiveEnd)) {
-                            result = true;
-                        }
-                    } else {
-                        LOGGER.finest("WLSDPLY-08204", range);
-                        result = true;
-                    }
-                }
-                break;
+        boolean result = getVersionRange(range).includes(version);
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
 
-            case VERSION_SIZE:
-                String singleVersion = versions[VERSION_INDEX];
-                result = (compareVersions(version, singleVersion) == 0);
-                LOGGER.finest("WLSDPLY-08205", version, singleVersion, result);
-                break;
+    /**
+     * Get the parsed version range for the specified range string.  The parsed range is cached,
+     * so each distinct range string is only parsed once.
+     *
+     * @param range the Maven-style version range, or a single version
+     * @return the parsed version range
+     * @throws VersionException if the range is not a valid version or version range
+     * @throws IllegalArgumentException if the range argument is empty or null
+     */
+    public static VersionRange getVersionRange(String range) throws VersionException {
+        final String METHOD = "getVersionRange";
 
-            default:
-                VersionException ve = new VersionException("WLSDPLY-08206", range, Arrays.asList(versions));
-                LOGGER.throwing(CLASS, METHOD, ve);
-                throw ve;
+        VersionRange result = StringUtils.isEmpty(range) ? null : VERSION_RANGES.get(range);
+        if (result == null) {
+            String[] versions = getLowerAndUpperVersionStrings(range);
+            LOGGER.finest("WLSDPLY-08201", range, Arrays.asList(versions));
+            switch (versions.length) {
+                case RANGE_SIZE:
+                    result = new VersionRange(range, versions[RANGE_LOW_INDEX], versions[RANGE_HIGH_INDEX]);
+                    break;
+
+                case VERSION_SIZE:
+                    result = new VersionRange(range, versions[VERSION_INDEX]);
+                    break;
+
+                default:
+                    VersionException ve = new VersionException("WLSDPLY-08206", range, Arrays.asList(versions));
+                    LOGGER.throwing(CLASS, METHOD, ve);
+                    throw ve;
+            }
+            VERSION_RANGES.put(range, result);
         }
-        LOGGER.exiting(CLASS, METHOD, result);
         return result;
     }
 
@@ -11,13 +11,25 @@ import java.io.FileOutputStream;
 import java.io.FilenameFilter;
 import java.io.IOException;
 import java.io.InputStream;
+import java.net.JarURLConnection;
+import java.net.URISyntaxException;
+import java.net.URL;
+import java.net.URLConnection;
 import java.nio.file.Files;
+import java.nio.file.LinkOption;
+import java.nio.file.Path;
+import java.nio.file.attribute.PosixFileAttributeView;
+import java.nio.file.attribute.PosixFilePermission;
+import java.nio.file.attribute.PosixFilePermissions;
+import java.nio.file.attribute.UserPrincipal;
 import java.security.MessageDigest;
 import java.security.NoSuchAlgorithmException;
 import java.util.ArrayList;
 import java.util.Arrays;
+import java.util.EnumSet;
 import java.util.List;
 import java.util.Locale;
+import java.util.Set;
 
 import javax.xml.bind.DatatypeConverter;
 
@@ -37,6 +49,7 @@ public final class FileUtils {
     private static final int FILE_NAME_POS = 0;
     private static final int FILE_EXT_POS = 1;
     private static final int READ_BUFFER_SIZE = 4096;
+    private static final int HASH_BUFFER_SIZE = 65536;
 
     private FileUtils() {
         // hide the constructor for this utility class
@@ -52,6 +65,33 @@ public final class FileUtils {
         return FileUtils.class.getClassLoader().getResourceAsStream(fileName);
     }
 
+    /**
+     * Get the jar file from which the specified resource is loaded.
+     *
+     * @param fileName the resource to locate
+     * @return the jar file, or null if the resource was not found or was not loaded from a jar file
+     */
+    public static File getResourceJarFile(String fileName) {
+        final String METHOD = "getResourceJarFile";
+
+        LOGGER.entering(CLASS, METHOD, fileName);
+        File result = null;
+        URL resourceUrl = FileUtils.class.getClassLoader().getResource(fileName);
+        if (resourceUrl != null && "jar".equals(resourceUrl.getProtocol())) {
+            try {
+                URLConnection connection = resourceUrl.openConnection();
+                if (connection instanceof JarURLConnection) {
+                    URL jarFileUrl = ((JarURLConnection) connection).getJarFileURL();
+                    result = getCanonicalFile(new File(jarFileUrl.toURI()));
+                }
+            } catch (IOException | URISyntaxException | IllegalArgumentException ex) {
+                LOGGER.fine("WLSDPLY-01118", ex, fileName, ex.getLocalizedMessage());
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
     /**
      * Get the specified file as an InputStream. This method will first
      * resolve the name to an absolute path and then get the InputStream
@@ -520,6 +560,78 @@ public final class FileUtils {
         LOGGER.exiting(directory);
     }
 
+    /**
+     * Create the specified directory, and any missing parent directories, so that only the current user can
+     * access the directories that are created.  On file systems without POSIX permissions, the directories are
+     * created with the default permissions.
+     *
+     * @param directory the directory to create
+     * @return true if the directory exists when this method returns, false otherwise
+     */
+    public static boolean createPrivateDirectory(File directory) {
+        final String METHOD = "createPrivateDirectory";
+
+        LOGGER.entering(CLASS, METHOD, directory);
+        boolean result = directory.isDirectory();
+        if (!result) {
+            File parent = directory.getAbsoluteFile().getParentFile();
+            if (parent == null || createPrivateDirectory(parent)) {
+                Path path = directory.toPath();
+                try {
+                    if (path.getFileSystem().supportedFileAttributeViews().contains("posix")) {
+                        Files.createDirectory(path, PosixFilePermissions.asFileAttribute(
+                            EnumSet.of(PosixFilePermission.OWNER_READ, PosixFilePermission.OWNER_WRITE,
+                                PosixFilePermission.OWNER_EXECUTE)));
+                    } else {
+                        Files.createDirectory(path);
+                    }
+                } catch (IOException | UnsupportedOperationException ex) {
+                    // another process may have created the directory first
+                    LOGGER.fine("WLSDPLY-01119", ex, directory, ex.getLocalizedMessage());
+                }
+                result = directory.isDirectory();
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Is the specified directory owned by the current user, and not writable by other users?  Symbolic links
+     * are not followed, so a link is never considered private.  On file systems without POSIX permissions, only
+     * the owner is checked.
+     *
+     * @param directory the directory to check
+     * @return true if only the current user can write to the directory, false otherwise
+     */
+    public static boolean isPrivateDirectory(File directory) {
+        final String METHOD = "isPrivateDirectory";
+
+        LOGGER.entering(CLASS, METHOD, directory);
+        boolean result = false;
+        Path path = directory.toPath();
+        try {
+            if (Files.isDirectory(path, LinkOption.NOFOLLOW_LINKS)) {
+                UserPrincipal currentUser = path.getFileSystem().getUserPrincipalLookupService()
+                    .lookupPrincipalByName(System.getProperty("user.name"));
+                result = currentUser.equals(Files.getOwner(path, LinkOption.NOFOLLOW_LINKS));
+
+                PosixFileAttributeView posixView =
+                    Files.getFileAttributeView(path, PosixFileAttributeView.class, LinkOption.NOFOLLOW_LINKS);
+                if (result && posixView != null) {
+                    Set<PosixFilePermission> permissions = posixView.readAttributes().permissions();
+                    result = !permissions.contains(PosixFilePermission.GROUP_WRITE)
+                        && !permissions.contains(PosixFilePermission.OTHERS_WRITE);
+                }
+            }
+        } catch (IOException | UnsupportedOperationException | SecurityException ex) {
+            LOGGER.fine("WLSDPLY-01120", ex, directory, ex.getLocalizedMessage());
+            result = false;
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
     /**
      * Compute the Base64-encoded hash for the specified file.
      *
@@ -541,7 +653,8 @@ public final class FileUtils {
     }
 
     /**
-     * Compute the Base64-encoded hash for the specified file.
+     * Compute the Base64-encoded hash for the specified file.  The file is read in blocks, so that its contents
+     * are never held in memory.
      *
      * @param file the file
      * @return the Base64-encoded hash
@@ -555,12 +668,90 @@ public final class FileUtils {
         LOGGER.entering(CLASS, METHOD, file);
         validateExistingFile(file);
 
-        byte[] fileBytes = readFileToByteArray(file);
-        String result = computeHash(fileBytes);
+        String result;
+        try (FileInputStream fis = new FileInputStream(file)) {
+            result = computeHash(fis);
+        }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
     }
 
+    /**
+     * Compute the Base64-encoded hash for the specified file, reusing the hash from the hash cache if the file
+     * has not changed since it was last hashed.  The hash cache is persisted between runs, so this is only
+     * used by the deploy tools, that hash the same application binaries on each run.
+     *
+     * @param fileName the file name
+     * @return the Base64-encoded hash
+     * @throws IOException if an error occurs reading the file
+     * @throws NoSuchAlgorithmException if an error occurs obtaining the hashing algorithm
+     * @throws IllegalArgumentException if the file is not a valid, existing file
+     */
+    public static String computeHashCached(String fileName) throws IOException, NoSuchAlgorithmException {
+        final String METHOD = "computeHashCached";
+
+        LOGGER.entering(CLASS, METHOD, fileName);
+        validateFileName(fileName);
+
+        String result = computeHashCached(getCanonicalFile(new File(fileName)));
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Compute the Base64-encoded hash for the specified file, reusing the hash from the hash cache if the file
+     * has not changed since it was last hashed.  A file hash is reused while the canonical path, size and
+     * last modified time of the file are unchanged.
+     *
+     * @param file the file
+     * @return the Base64-encoded hash
+     * @throws IOException if an error occurs reading the file
+     * @throws NoSuchAlgorithmException if an error occurs obtaining the hashing algorithm
+     * @throws IllegalArgumentException if the file is not a valid, existing file
+     */
+    public static String computeHashCached(File file) throws IOException, NoSuchAlgorithmException {
+        final String METHOD = "computeHashCached";
+
+        LOGGER.entering(CLASS, METHOD, file);
+        validateExistingFile(file);
+
+        String canonicalPath = getCanonicalPath(file);
+        long size = file.length();
+        long lastModified = file.lastModified();
+        HashCache hashCache = HashCache.getInstance();
+        String result = hashCache.getFileHash(canonicalPath, size, lastModified);
+        if (result == null) {
+            result = computeHash(file);
+            hashCache.putFileHash(canonicalPath, size, lastModified, result);
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Compute the Base64-encoded hash for the contents of the specified input stream, reading it in blocks
+     * so that the contents are never held in memory.  The caller is responsible for closing the stream.
+     *
+     * @param input the input stream to use
+     * @return the Base64-encoded hash
+     * @throws IOException if an error occurs reading the input stream
+     * @throws NoSuchAlgorithmException if an error occurs obtaining the hashing algorithm
+     */
+    public static String computeHash(InputStream input) throws IOException, NoSuchAlgorithmException {
+        MessageDigest messageDigest = MessageDigest.getInstance("MD5");
+        byte[] readBuffer = new byte[HASH_BUFFER_SIZE];
+
+        int bytesRead;
+        while (true) {
+            bytesRead = input.read(readBuffer);
+            if (bytesRead < 0) {
+                break;
+            }
+            messageDigest.update(readBuffer, 0, bytesRead);
+        }
+        return DatatypeConverter.printBase64Binary(messageDigest.digest());
+    }
+
     /**
      * Compute the Base64-encoded hash for the specified bytes.
      *
@@ -0,0 +1,240 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * The Universal Permissive License (UPL), Version 1.0
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.nio.file.Files;
+import java.nio.file.StandardCopyOption;
+import java.util.Properties;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+
+/**
+ * A persistent cache of the Base64-encoded hashes of files and archive entries, so that unchanged binaries
+ * are not read again each time their hash is needed.  A file hash is reused while the canonical path, size
+ * and last modified time of the file are unchanged.  An archive entry hash is reused while the archive path,
+ * entry name, entry CRC and entry size are unchanged.  The cache is stored as a properties file with one
+ * entry per file or archive entry, and failures to read or write it are not fatal.  New hashes are kept in
+ * memory until flush() is called, or until the JVM exits.
+ */
+public final class HashCache {
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
+
+    /**
+     * Environment variable used to override the location of the cache file.
+     */
+    public static final String CACHE_FILE_ENV_VARIABLE = "WLSDEPLOY_HASH_CACHE_FILE";
+
+    /**
+     * Environment variable used to turn off the cache, if set to true.
+     */
+    public static final String CACHE_DISABLED_ENV_VARIABLE = "WLSDEPLOY_HASH_CACHE_DISABLED";
+
+    // the default cache file is in the home directory, so that it is not shared with other users
+    private static final String DEFAULT_CACHE_DIR_NAME = ".wlsdeploy";
+    private static final String DEFAULT_CACHE_FILE_NAME = "hash-cache.properties";
+    private static final String FILE_KEY_PREFIX = "file:";
+    private static final String ENTRY_KEY_PREFIX = "entry:";
+    private static final String ENTRY_SEP = "!";
+    private static final String VALUE_SEP = "|";
+    private static final int VALUE_FIELD_COUNT = 3;
+
+    private static HashCache instance;
+
+    private final File cacheFile;
+    private final Properties hashes = new Properties();
+    private boolean loaded;
+    private boolean dirty;
+
+    /**
+     * Constructor used by getInstance() and the unit tests.
+     *
+     * @param cacheFile the file in which the cache is stored, or null to disable the cache
+     */
+    /* package */
+    HashCache(File cacheFile) {
+        this.cacheFile = cacheFile;
+    }
+
+    /**
+     * Get the cache for this process, stored in the file named by the environment or in the user's home
+     * directory.  The cache is flushed when the JVM exits.
+     *
+     * @return the hash cache
+     */
+    public static synchronized HashCache getInstance() {
+        if (instance == null) {
+            final HashCache hashCache = new HashCache(getCacheFileFromEnvironment());
+            if (hashCache.cacheFile != null) {
+                Runtime.getRuntime().addShutdownHook(new Thread() {
+                    @Override
+                    public void run() {
+                        hashCache.flush();
+                    }
+                });
+            }
+            instance = hashCache;
+        }
+        return instance;
+    }
+
+    /**
+     * Write the hashes stored since the cache was read or last flushed to the cache file.
+     */
+    public synchronized void flush() {
+        if (cacheFile == null || !dirty) {
+            return;
+        }
+        dirty = false;
+        save();
+    }
+
+    /**
+     * Get the cached hash of the specified file.
+     *
+     * @param canonicalPath the canonical path of the file
+     * @param size the size of the file
+     * @param lastModified the last modified time of the file
+     * @return the Base64-encoded hash, or null if the file has no cached hash or has changed
+     */
+    public synchronized String getFileHash(String canonicalPath, long size, long lastModified) {
+        return getHash(FILE_KEY_PREFIX + canonicalPath, size, lastModified);
+    }
+
+    /**
+     * Store the hash of the specified file.  The size and last modified time should be read before the
+     * file is hashed, so that a file that changes while it is hashed is hashed again next time.
+     *
+     * @param canonicalPath the canonical path of the file
+     * @param size the size of the file
+     * @param lastModified the last modified time of the file
+     * @param hash the Base64-encoded hash
+     */
+    public synchronized void putFileHash(String canonicalPath, long size, long lastModified, String hash) {
+        putHash(FILE_KEY_PREFIX + canonicalPath, size, lastModified, hash);
+    }
+
+    /**
+     * Get the cached hash of the specified archive entry.
+     *
+     * @param archivePath the canonical path of the archive file
+     * @param entryName the name of the entry in the archive
+     * @param crc the CRC of the entry
+     * @param size the uncompressed size of the entry
+     * @return the Base64-encoded hash, or null if the entry has no cached hash or has changed
+     */
+    public synchronized String getArchiveEntryHash(String archivePath, String entryName, long crc, long size) {
+        return getHash(ENTRY_KEY_PREFIX + archivePath + ENTRY_SEP + entryName, crc, size);
+    }
+
+    /**
+     * Store the hash of the specified archive entry.
+     *
+     * @param archivePath the canonical path of the archive file
+     * @param entryName the name of the entry in the archive
+     * @param crc the CRC of the entry
+     * @param size the uncompressed size of the entry
+     * @param hash the Base64-encoded hash
+     */
+    public synchronized void putArchiveEntryHash(String archivePath, String entryName, long crc, long size,
+        String hash) {
+        putHash(ENTRY_KEY_PREFIX + archivePath + ENTRY_SEP + entryName, crc, size, hash);
+    }
+
+    ///////////////////////////////////////////////////////////////////////////
+    // Private helper methods                                                //
+    ///////////////////////////////////////////////////////////////////////////
+
+    private static File getCacheFileFromEnvironment() {
+        String disabled = System.getenv(CACHE_DISABLED_ENV_VARIABLE);
+        if (disabled != null && Boolean.parseBoolean(disabled)) {
+            LOGGER.fine("WLSDPLY-01270", CACHE_DISABLED_ENV_VARIABLE);
+            return null;
+        }
+
+        String fileName = System.getenv(CACHE_FILE_ENV_VARIABLE);
+        File result;
+        if (StringUtils.isEmpty(fileName)) {
+            File cacheDir = new File(System.getProperty("user.home"), DEFAULT_CACHE_DIR_NAME);
+            result = new File(cacheDir, DEFAULT_CACHE_FILE_NAME);
+        } else {
+            result = FileUtils.getCanonicalFile(fileName);
+        }
+        LOGGER.fine("WLSDPLY-01274", result);
+        return result;
+    }
+
+    private String getHash(String key, long first, long second) {
+        if (cacheFile == null || first < 0 || second < 0) {
+            return null;
+        }
+        load();
+
+        String value = hashes.getProperty(key);
+        if (value == null) {
+            return null;
+        }
+        String[] fields = value.split("\\" + VALUE_SEP, VALUE_FIELD_COUNT);
+        if (fields.length != VALUE_FIELD_COUNT || !fields[0].equals(Long.toString(first))
+            || !fields[1].equals(Long.toString(second))) {
+            return null;
+        }
+        LOGGER.finest("WLSDPLY-01271", key, fields[2]);
+        return fields[2];
+    }
+
+    private void putHash(String key, long first, long second, String hash) {
+        if (cacheFile == null || first < 0 || second < 0 || hash == null) {
+            return;
+        }
+        load();
+
+        String value = Long.toString(first) + VALUE_SEP + Long.toString(second) + VALUE_SEP + hash;
+        if (!value.equals(hashes.getProperty(key))) {
+            hashes.setProperty(key, value);
+            dirty = true;
+        }
+    }
+
+    private void load() {
+        if (loaded) {
+            return;
+        }
+        loaded = true;
+
+        if (cacheFile.isFile()) {
+            try (FileInputStream fis = new FileInputStream(cacheFile)) {
+                hashes.load(fis);
+            } catch (IOException | IllegalArgumentException ex) {
+                LOGGER.fine("WLSDPLY-01272", ex, cacheFile, ex.getLocalizedMessage());
+                hashes.clear();
+            }
+        }
+    }
+
+    private void save() {
+        // write a temporary file and move it into place, so that other processes never read a partial file
+        File tempFile = new File(cacheFile.getPath() + ".tmp");
+        try {
+            File parent = cacheFile.getAbsoluteFile().getParentFile();
+            if (parent != null && !parent.isDirectory() && !parent.mkdirs()) {
+                throw new IOException(parent.getPath());
+            }
+            try (FileOutputStream fos = new FileOutputStream(tempFile)) {
+                hashes.store(fos, null);
+            }
+            Files.move(tempFile.toPath(), cacheFile.toPath(), StandardCopyOption.REPLACE_EXISTING);
+        } catch (IOException ex) {
+            LOGGER.fine("WLSDPLY-01273", ex, cacheFile, ex.getLocalizedMessage());
+            if (tempFile.exists() && !tempFile.delete()) {
+                LOGGER.finer("WLSDPLY-01115", tempFile.getName(), tempFile.getParent());
+            }
+        }
+    }
+}
@@ -4,6 +4,8 @@
  */
 package oracle.weblogic.deploy.util;
 
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
 import java.io.File;
 import java.io.FileInputStream;
 import java.io.FileOutputStream;
@@ -11,9 +13,16 @@ import java.io.IOException;
 import java.io.InputStream;
 import java.net.HttpURLConnection;
 import java.net.URL;
+import java.security.DigestInputStream;
+import java.security.MessageDigest;
 import java.security.NoSuchAlgorithmException;
+import java.util.ArrayList;
 import java.util.List;
 import java.util.Map;
+import java.util.Properties;
+import java.util.zip.ZipEntry;
+
+import javax.xml.bind.DatatypeConverter;
 
 import oracle.weblogic.deploy.exception.ExceptionHelper;
 import oracle.weblogic.deploy.logging.PlatformLogger;
@@ -97,6 +106,13 @@ public class WLSDeployArchive {
      */
     public static final String ARCHIVE_SCRIPTS_DIR = WLSDPLY_ARCHIVE_BINARY_DIR + "/scripts";
 
+    /**
+     * Top-level archive entry holding the digests of the binary files added to the archive, so that their hashes
+     * can be read without decompressing them.  Each property is keyed by the entry path, and its value is the
+     * uncompressed size, the CRC-32 of the uncompressed contents and the Base64-encoded MD5 hash, separated by |.
+     */
+    public static final String ARCHIVE_DIGEST_MANIFEST = "wlsdeploy-digests.properties";
+
     // Used by the unit tests so it requires package level scoping...
     //
     /* package */
@@ -107,10 +123,15 @@ public class WLSDeployArchive {
     private static final String COHERENCE_CONFIG_FILE_EXTENSION = ".xml";
     private static final int HTTP_OK = 200;
     private static final int HTTP_CREATED = 201;
+    private static final String DIGEST_SEP = "|";
+    private static final String DIGEST_ALGORITHM = "MD5";
+    private static final int DIGEST_FIELD_COUNT = 3;
 
     private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.archive");
 
     private WLSDeployZipFile zipFile;
+    private Properties digestManifest;
+    private boolean digestManifestModified;
 
     /**
      * Constructor for a JCSLifecycleArchive, which hides the details of the bundle generated by export domain.
@@ -422,7 +443,9 @@ public class WLSDeployArchive {
     }
 
     /**
-     * Get the Base64-encoded hash for the specified archive file entry.
+     * Get the Base64-encoded hash for the specified archive file entry.  The hash is read from the digest
+     * manifest if the manifest size and CRC of the entry match the entry.  Otherwise, the entry is read in
+     * blocks, and the hash is reused from the hash cache if the entry has not changed since it was last hashed.
      *
      * @param path the path into the archive file
      * @return the Base64-encoded hash for the entry
@@ -441,39 +464,43 @@ public class WLSDeployArchive {
             throw aioe;
         }
 
-        Map<String, InputStream> zipEntries = getZipFile().getZipEntries(path);
-        if (zipEntries.isEmpty() || !zipEntries.containsKey(path)) {
+        ZipEntry zipEntry = getZipFile().getZipEntryMetadata(path);
+        if (zipEntry == null) {
             WLSDeployArchiveIOException aioe =
                 new WLSDeployArchiveIOException("WLSDPLY-01406", getArchiveFileName(), path);
             LOGGER.throwing(CLASS, METHOD, aioe);
-            closeMapInputStreams(zipEntries);
-            getZipFile().close();
             throw aioe;
         }
 
-        byte[] fileBytes;
-        try {
-            fileBytes = FileUtils.readInputStreamToByteArray(zipEntries.get(path));
-        } catch (IOException ioe) {
-            WLSDeployArchiveIOException aioe =
-                new WLSDeployArchiveIOException("WLSDPLY-01407", ioe, getArchiveFileName(),
-                                                path, ioe.getLocalizedMessage());
-            LOGGER.throwing(CLASS, METHOD, aioe);
-            throw aioe;
-        } finally {
-            closeMapInputStreams(zipEntries);
-            getZipFile().close();
+        String result = getManifestDigest(path, zipEntry);
+        if (result != null) {
+            LOGGER.exiting(CLASS, METHOD, result);
+            return result;
         }
 
-        String result;
-        try {
-            result = FileUtils.computeHash(fileBytes);
-        } catch (NoSuchAlgorithmException e) {
-            WLSDeployArchiveIOException aioe =
-                new WLSDeployArchiveIOException("WLSDPLY-01407", e, getArchiveFileName(),
-                                                path, e.getLocalizedMessage());
-            LOGGER.throwing(CLASS, METHOD, aioe);
-            throw aioe;
+        String archivePath = FileUtils.getCanonicalPath(getArchiveFileName());
+        HashCache hashCache = HashCache.getInstance();
+        result = hashCache.getArchiveEntryHash(archivePath, path, zipEntry.getCrc(), zipEntry.getSize());
+        if (result == null) {
+            try {
+                InputStream inputStream = getZipFile().getZipEntry(path);
+                if (inputStream == null) {
+                    WLSDeployArchiveIOException aioe =
+                        new WLSDeployArchiveIOException("WLSDPLY-01406", getArchiveFileName(), path);
+                    LOGGER.throwing(CLASS, METHOD, aioe);
+                    throw aioe;
+                }
+                result = FileUtils.computeHash(inputStream);
+            } catch (IOException | NoSuchAlgorithmException e) {
+                WLSDeployArchiveIOException aioe =
+                    new WLSDeployArchiveIOException("WLSDPLY-01407", e, getArchiveFileName(),
+                                                    path, e.getLocalizedMessage());
+                LOGGER.throwing(CLASS, METHOD, aioe);
+                throw aioe;
+            } finally {
+                getZipFile().close();
+            }
+            hashCache.putArchiveEntryHash(archivePath, path, zipEntry.getCrc(), zipEntry.getSize(), result);
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
@@ -947,13 +974,23 @@ public class WLSDeployArchive {
      */
     public void removeAllBinaries() throws WLSDeployArchiveIOException {
         getZipFile().removeZipEntries(WLSDPLY_ARCHIVE_BINARY_DIR + ZIP_SEP);
+        digestManifest = new Properties();
+        digestManifestModified = true;
     }
 
     /**
-     * Closes the underlying zip file and any open streams.
+     * Writes the digest manifest, if binaries were added or removed, and closes the underlying zip file
+     * and any open streams.
      */
     public void close() {
         if (getZipFile() != null) {
+            if (digestManifestModified) {
+                try {
+                    writeDigestManifest();
+                } catch (WLSDeployArchiveIOException aioe) {
+                    LOGGER.warning("WLSDPLY-01426", aioe, getArchiveFileName(), aioe.getLocalizedMessage());
+                }
+            }
             getZipFile().close();
         }
     }
@@ -1258,10 +1295,22 @@ public class WLSDeployArchive {
 
         String newName = null;
         FileInputStream inputStream = null;
+        MessageDigest messageDigest = null;
         try {
             inputStream = getFileInputStream(itemToAdd, preferredName, getArchiveFileName(), callingMethod);
+            InputStream entryStream = inputStream;
+            if (preferredName.startsWith(WLSDPLY_ARCHIVE_BINARY_DIR + ZIP_SEP)) {
+                // compute the digest while the file is written to the archive, instead of reading it again
+                try {
+                    messageDigest = MessageDigest.getInstance(DIGEST_ALGORITHM);
+                    entryStream = new DigestInputStream(inputStream, messageDigest);
+                } catch (NoSuchAlgorithmException nsae) {
+                    LOGGER.fine("WLSDPLY-01427", nsae, preferredName, getArchiveFileName(),
+                        nsae.getLocalizedMessage());
+                }
+            }
             LOGGER.finer("WLSDPLY-01418", preferredName, itemToAdd);
-            newName = getZipFile().addZipEntry(preferredName, inputStream, true);
+            newName = getZipFile().addZipEntry(preferredName, entryStream, true);
             LOGGER.finer("WLSDPLY-01419", newName, itemToAdd);
         } finally {
             if (inputStream != null) {
@@ -1272,9 +1321,112 @@ public class WLSDeployArchive {
                 }
             }
         }
+        if (newName != null && messageDigest != null) {
+            addManifestDigest(newName, DatatypeConverter.printBase64Binary(messageDigest.digest()));
+        }
         return newName;
     }
 
+    /**
+     * Record the size, CRC and hash of a file added to the archive in the digest manifest.  The size and CRC
+     * are taken from the entry as it was written.  The manifest is written when the archive is closed.
+     *
+     * @param entryName the name of the new archive entry
+     * @param hash the Base64-encoded hash computed while the entry was written
+     * @throws WLSDeployArchiveIOException if an error occurs reading the existing digest manifest
+     */
+    private void addManifestDigest(String entryName, String hash) throws WLSDeployArchiveIOException {
+        ZipEntry zipEntry = getZipFile().getAddedZipEntry(entryName);
+        if (zipEntry == null || zipEntry.getSize() < 0 || zipEntry.getCrc() < 0) {
+            return;
+        }
+
+        String value = Long.toString(zipEntry.getSize()) + DIGEST_SEP + Long.toString(zipEntry.getCrc())
+            + DIGEST_SEP + hash;
+        getDigestManifest().setProperty(entryName, value);
+        digestManifestModified = true;
+    }
+
+    /**
+     * Get the hash of the archive entry from the digest manifest.  The digest is only used if the size and CRC
+     * recorded with it match the entry, so that entries replaced by other tools are hashed again.
+     *
+     * @param entryName the name of the archive entry
+     * @param zipEntry the metadata of the archive entry
+     * @return the Base64-encoded hash, or null if the manifest has no valid digest for the entry
+     * @throws WLSDeployArchiveIOException if an error occurs reading the archive
+     */
+    private String getManifestDigest(String entryName, ZipEntry zipEntry) throws WLSDeployArchiveIOException {
+        String value = getDigestManifest().getProperty(entryName);
+        if (value == null) {
+            return null;
+        }
+
+        String[] fields = value.split("\\" + DIGEST_SEP, DIGEST_FIELD_COUNT);
+        if (fields.length != DIGEST_FIELD_COUNT || !fields[0].equals(Long.toString(zipEntry.getSize()))
+            || !fields[1].equals(Long.toString(zipEntry.getCrc()))) {
+            LOGGER.fine("WLSDPLY-01428", entryName, getArchiveFileName());
+            return null;
+        }
+        return fields[2];
+    }
+
+    /**
+     * Get the digest manifest, reading it from the archive the first time.  A manifest that cannot be read
+     * is treated as empty.
+     *
+     * @return the digest manifest properties
+     * @throws WLSDeployArchiveIOException if an error occurs reading the archive
+     */
+    private Properties getDigestManifest() throws WLSDeployArchiveIOException {
+        if (digestManifest == null) {
+            digestManifest = new Properties();
+            InputStream inputStream = getZipFile().getZipEntry(ARCHIVE_DIGEST_MANIFEST);
+            if (inputStream != null) {
+                try {
+                    digestManifest.load(inputStream);
+                } catch (IOException | IllegalArgumentException ex) {
+                    LOGGER.fine("WLSDPLY-01429", ex, getArchiveFileName(), ex.getLocalizedMessage());
+                    digestManifest.clear();
+                } finally {
+                    getZipFile().close();
+                }
+            }
+        }
+        return digestManifest;
+    }
+
+    /**
+     * Write the digest manifest into the archive, without the digests of entries that were removed.
+     *
+     * @throws WLSDeployArchiveIOException if an error occurs writing the archive
+     */
+    private void writeDigestManifest() throws WLSDeployArchiveIOException {
+        final String METHOD = "writeDigestManifest";
+
+        LOGGER.entering(CLASS, METHOD);
+        Properties manifest = getDigestManifest();
+        List<String> entries = getZipFile().listZipEntries();
+        for (String entryName : new ArrayList<>(manifest.stringPropertyNames())) {
+            if (!entries.contains(entryName)) {
+                manifest.remove(entryName);
+            }
+        }
+
+        ByteArrayOutputStream outputStream = new ByteArrayOutputStream();
+        try {
+            manifest.store(outputStream, null);
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException aioe = new WLSDeployArchiveIOException("WLSDPLY-01426", ioe,
+                getArchiveFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, aioe);
+            throw aioe;
+        }
+        getZipFile().putZipEntry(ARCHIVE_DIGEST_MANIFEST, new ByteArrayInputStream(outputStream.toByteArray()));
+        digestManifestModified = false;
+        LOGGER.exiting(CLASS, METHOD, manifest.size());
+    }
+
     ///////////////////////////////////////////////////////////////////////////
     // Private Static Helper Methods                                         //
     ///////////////////////////////////////////////////////////////////////////
@@ -51,6 +51,7 @@ public class WLSDeployZipFile {
     private File file;
     private ZipFile openZipFile;
     private boolean newFile;
+    private Map<String, ZipEntry> addedZipEntries = new LinkedHashMap<>();
 
     //////////////////////////////////////////////////////////////////////////////////////////////////
     // Public APIs                                                                                  //
@@ -132,6 +133,24 @@ public class WLSDeployZipFile {
         return stream;
     }
 
+    /**
+     * Get the metadata of the specified entry, such as its size and CRC, without opening the entry.
+     *
+     * @param key entry name
+     * @return the zip entry, or null if the entry does not exist
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    public ZipEntry getZipEntryMetadata(String key) throws WLSDeployArchiveIOException {
+        final String METHOD = "getZipEntryMetadata";
+
+        LOGGER.entering(CLASS, METHOD, key);
+        closeOpenZipFile();
+
+        ZipEntry result = getZipFileEntries(getFile()).get(key);
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
     /**
      * Get the list of entries in the zip file.
      *
@@ -383,6 +402,17 @@ public class WLSDeployZipFile {
         return addedEntry;
     }
 
+    /**
+     * Get the metadata of an entry written by the last add, including the size and CRC computed while it was written,
+     * without opening the zip file again.
+     *
+     * @param key the name of the entry
+     * @return the zip entry, or null if the entry was not written by the last add
+     */
+    public ZipEntry getAddedZipEntry(String key) {
+        return addedZipEntries.get(key);
+    }
+
     /**
      * Add the provided directory entry to the unsaved changes list, optionally renaming it to prevent conflicts.
      *
@@ -660,6 +690,7 @@ public class WLSDeployZipFile {
 
         LOGGER.entering(CLASS, METHOD, updatedZipEntries, newEntries);
 
+        addedZipEntries = new LinkedHashMap<>();
         File newOutputFile = getNewOutputFile();
         if ((updatedZipEntries != null && !updatedZipEntries.isEmpty()) ||
             (newEntries != null && !newEntries.isEmpty())) {
@@ -728,6 +759,7 @@ public class WLSDeployZipFile {
                             readWriteBytes(newKey, inputStream, zos);
                             zos.closeEntry();
                             inputStream = closeFileInputStream(inputStream, newKey);
+                            addedZipEntries.put(newKey, ze);
                         }
                         LOGGER.finer("WLSDPLY-01520", newKey, getFileName(), newOutputFile.getAbsolutePath());
                     }
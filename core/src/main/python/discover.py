@@ -40,6 +40,7 @@ from wlsdeploy.tool.discover.domain_info_discoverer import DomainInfoDiscoverer
 from wlsdeploy.tool.discover.multi_tenant_discoverer import MultiTenantDiscoverer
 from wlsdeploy.tool.discover.resources_discoverer import ResourcesDiscoverer
 from wlsdeploy.tool.discover.topology_discoverer import TopologyDiscoverer
+from wlsdeploy.tool.discover.xml_config_session import XmlConfigSession
 from wlsdeploy.tool.util import filter_helper
 from wlsdeploy.tool.util.variable_injector import VariableInjector
 from wlsdeploy.tool.validate.validator import Validator
@@ -61,6 +62,11 @@ _class_name = 'discover'
 __logger = PlatformLogger(discoverer.get_discover_logger_name())
 __wlst_mode = WlstModes.OFFLINE
 
+# the number of threads used to discover the model sections online, each with its own connection
+DISCOVER_THREADS_ENV_VARIABLE = 'WLSDEPLOY_DISCOVER_THREADS'
+# the offline discover engine that reads the domain configuration files instead of using WLST
+XML_DISCOVER_ENGINE = 'xml'
+
 __required_arguments = [
     CommandLineArgUtil.ORACLE_HOME_SWITCH,
     CommandLineArgUtil.DOMAIN_HOME_SWITCH,
@@ -75,7 +81,8 @@ __optional_arguments = [
     CommandLineArgUtil.ADMIN_URL_SWITCH,
     CommandLineArgUtil.ADMIN_USER_SWITCH,
     CommandLineArgUtil.ADMIN_PASS_SWITCH,
-    CommandLineArgUtil.TARGET_MODE_SWITCH
+    CommandLineArgUtil.TARGET_MODE_SWITCH,
+    CommandLineArgUtil.DISCOVER_ENGINE_SWITCH
 ]
 
 
@@ -98,6 +105,7 @@ def __process_args(args):
 
     __verify_required_args_present(required_arg_map)
     __wlst_mode = __process_online_args(optional_arg_map)
+    __process_discover_engine_arg(optional_arg_map)
     __process_archive_filename_arg(required_arg_map)
     __process_variable_filename_arg(optional_arg_map)
 
@@ -160,6 +168,23 @@ def __process_online_args(optional_arg_map):
     return mode
 
 
+def __process_discover_engine_arg(optional_arg_map):
+    """
+    Verify that the discover engine can be used with the WLST mode.
+    :param optional_arg_map: the optional arguments map
+    :raises CLAException: if the xml discover engine is used online
+    """
+    _method_name = '__process_discover_engine_arg'
+
+    engine = dictionary_utils.get_element(optional_arg_map, CommandLineArgUtil.DISCOVER_ENGINE_SWITCH)
+    if engine == XML_DISCOVER_ENGINE and __wlst_mode == WlstModes.ONLINE:
+        ex = exception_helper.create_cla_exception('WLSDPLY-06026', engine)
+        ex.setExitCode(CommandLineArgUtil.USAGE_ERROR_EXIT_CODE)
+        __logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+        raise ex
+    return
+
+
 def __process_archive_filename_arg(required_arg_map):
     """
     Validate the archive file name and load the archive file object.
@@ -210,19 +235,50 @@ def __discover(model_context, aliases):
     :raises DiscoverException: if an error occurred while discover the domain
     """
     _method_name = '__discover'
+    if __wlst_mode == WlstModes.OFFLINE and model_context.get_discover_engine() == XML_DISCOVER_ENGINE:
+        __logger.info('WLSDPLY-06027', model_context.get_domain_home(), class_name=_class_name,
+                      method_name=_method_name)
+        wlst_helper.set_thread_session(XmlConfigSession(aliases))
+        try:
+            model = __discover_model(model_context, aliases)
+        finally:
+            wlst_helper.set_thread_session(None)
+    else:
+        model = __discover_model(model_context, aliases)
+    return model
+
+
+def __discover_model(model_context, aliases):
+    """
+    Populate the model from the domain, using the WLST session of the current thread.
+    :param model_context: the model context
+    :param aliases: the aliases
+    :return: the fully-populated model
+    :raises DiscoverException: if an error occurred while discover the domain
+    """
+    _method_name = '__discover_model'
     model = Model()
     base_location = LocationContext()
     __connect_to_domain(model_context)
     try:
         _add_domain_name(base_location, aliases)
-        DomainInfoDiscoverer(model_context, model.get_model_domain_info(), base_location, wlst_mode=__wlst_mode,
-                             aliases=aliases).discover()
-        TopologyDiscoverer(model_context, model.get_model_topology(), base_location, wlst_mode=__wlst_mode,
-                           aliases=aliases).discover()
-        ResourcesDiscoverer(model_context, model.get_model_resources(), base_location, wlst_mode=__wlst_mode,
-                            aliases=aliases).discover()
-        DeploymentsDiscoverer(model_context, model.get_model_app_deployments(), base_location, wlst_mode=__wlst_mode,
-                              aliases=aliases).discover()
+        discoverers = [
+            DomainInfoDiscoverer(model_context, model.get_model_domain_info(), base_location, wlst_mode=__wlst_mode,
+                                 aliases=aliases),
+            TopologyDiscoverer(model_context, model.get_model_topology(), base_location, wlst_mode=__wlst_mode,
+                               aliases=aliases),
+            ResourcesDiscoverer(model_context, model.get_model_resources(), base_location, wlst_mode=__wlst_mode,
+                                aliases=aliases),
+            DeploymentsDiscoverer(model_context, model.get_model_app_deployments(), base_location,
+                                  wlst_mode=__wlst_mode, aliases=aliases)
+        ]
+        thread_count = __get_discover_thread_count()
+        if __wlst_mode == WlstModes.ONLINE and thread_count > 1:
+            discoverer.discover_concurrently(discoverers, model_context, thread_count, __create_discover_session,
+                                             __connect_discover_session, __disconnect_domain)
+        else:
+            for section_discoverer in discoverers:
+                section_discoverer.discover()
         __discover_multi_tenant(model, model_context, base_location, aliases)
     except AliasException, ae:
         wls_version = WebLogicHelper(__logger).get_actual_weblogic_version()
@@ -237,6 +293,46 @@ def __discover(model_context, aliases):
     return model
 
 
+def __create_discover_session():
+    """
+    Create a WLST session for a thread that discovers a model section concurrently.
+    :return: the new WLST session
+    """
+    return wlst_helper.WlstSession()
+
+
+def __connect_discover_session(model_context):
+    """
+    Connect the WLST session of the current thread to the Admin Server.
+    :param model_context: the model context
+    :raises DiscoverException: if a WLST error occurs while connecting
+    """
+    wlst_helper.silence()
+    __connect_to_domain(model_context)
+    return
+
+
+def __get_discover_thread_count():
+    """
+    Get the number of threads used to discover the model sections online.
+    :return: the thread count from the environment, or 1 to discover the sections one after another
+    """
+    _method_name = '__get_discover_thread_count'
+
+    thread_count = os.environ.get(DISCOVER_THREADS_ENV_VARIABLE)
+    if thread_count is None:
+        return 1
+    try:
+        result = int(thread_count)
+    except ValueError:
+        result = 0
+    if result < 1:
+        __logger.warning('WLSDPLY-06025', thread_count, DISCOVER_THREADS_ENV_VARIABLE,
+                         class_name=_class_name, method_name=_method_name)
+        result = 1
+    return result
+
+
 def _add_domain_name(location, aliases):
     _method_name = '_get_domain_name'
     try:
@@ -34,8 +34,10 @@ from wlsdeploy.exception.expection_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.create.domain_typedef import DomainTypedef
 from wlsdeploy.tool.create.domain_typedef import UPDATE_DOMAIN
+from wlsdeploy.tool.deploy import deployer
 from wlsdeploy.tool.deploy import deployer_utils
 from wlsdeploy.tool.deploy import model_deployer
+from wlsdeploy.tool.deploy.model_delta import ModelDelta
 from wlsdeploy.tool.deploy.topology_updater import TopologyUpdater
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.tool.util import filter_helper
@@ -419,6 +421,59 @@ def __clean_up_temp_files():
         __tmp_model_dir = None
 
 
+def __get_changed_model(model, model_context, aliases, variable_map):
+    """
+    If a previous model file was specified, reduce the model to the folders and attributes that were added or
+    changed since the previous model.  The appDeployments and domainInfo sections are not reduced.  The models
+    are compared before variable substitution, so that a changed variable value is not hidden by the previous
+    model being substituted with the same values, and the changes are substituted afterwards.
+    :param model: the model
+    :param model_context: the model context
+    :param aliases: the aliases
+    :param variable_map: the variables used to substitute the model
+    :return: the model with only the changes, or the model if no previous model file was specified
+    :raises DeployException: if an error occurs
+    """
+    _method_name = '__get_changed_model'
+
+    previous_model_file = model_context.get_previous_model_file()
+    if previous_model_file is None:
+        return model
+
+    __logger.info('WLSDPLY-09018', _program_name, previous_model_file, class_name=_class_name,
+                  method_name=_method_name)
+    try:
+        previous_model_dictionary = FileToPython(previous_model_file, True).parse()
+    except TranslateException, ex:
+        __logger.severe('WLSDPLY-09019', _program_name, previous_model_file, ex.getLocalizedMessage(), error=ex,
+                        class_name=_class_name, method_name=_method_name)
+        __clean_up_temp_files()
+        tool_exit.end(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
+
+    # the model was substituted when it was loaded, so read it again for the unsubstituted values
+    model_file = model_context.get_model_file()
+    try:
+        raw_model_dictionary = FileToPython(model_file, True).parse()
+    except TranslateException, ex:
+        __logger.severe('WLSDPLY-09014', _program_name, model_file, ex.getLocalizedMessage(), error=ex,
+                        class_name=_class_name, method_name=_method_name)
+        __clean_up_temp_files()
+        tool_exit.end(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
+
+    model_delta = ModelDelta(previous_model_dictionary, raw_model_dictionary, aliases, __logger)
+    changed_model_dictionary = model_delta.get_changed_model()
+    try:
+        variables.substitute(changed_model_dictionary, variable_map, model_context)
+    except VariableException, ex:
+        __logger.severe('WLSDPLY-20004', _program_name, ex.getLocalizedMessage(), error=ex,
+                        class_name=_class_name, method_name=_method_name)
+        __clean_up_temp_files()
+        tool_exit.end(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
+
+    filter_helper.apply_filters(changed_model_dictionary, "update")
+    return Model(changed_model_dictionary)
+
+
 def validate_model(model_dictionary, model_context, aliases):
     _method_name = 'validate_model'
 
@@ -495,7 +550,7 @@ def main(args):
         validate_model(model_dictionary, model_context, aliases)
 
     try:
-        model = Model(model_dictionary)
+        model = __get_changed_model(Model(model_dictionary), model_context, aliases, variable_map)
         __update(model, model_context, aliases)
     except DeployException, ex:
         __logger.severe('WLSDPLY-09015', _program_name, ex.getLocalizedMessage(), error=ex,
@@ -503,6 +558,13 @@ def main(args):
         __clean_up_temp_files()
         tool_exit.end(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE)
 
+    list_cache_statistics = __wlst_helper.get_list_cache_statistics()
+    __logger.info('WLSDPLY-09016', _program_name, list_cache_statistics['hits'], list_cache_statistics['misses'],
+                  class_name=_class_name, method_name=_method_name)
+    if __wlst_mode == WlstModes.ONLINE:
+        __logger.info('WLSDPLY-09017', _program_name, deployer.get_skipped_attribute_count(),
+                      class_name=_class_name, method_name=_method_name)
+
     __clean_up_temp_files()
 
     tool_exit.end(model_context, exit_code)
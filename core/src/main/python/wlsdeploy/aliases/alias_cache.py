@@ -0,0 +1,230 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+The persistent cache for alias category dictionaries that have already been resolved for a WLS version
+and WLST mode.  The cache is stored on disk beneath a directory named for the hash of the jar file containing
+the alias category modules so that a new release of the tool never reads data cached by an older release.
+Loading a cache file can run code, so the cache is stored in the user's home directory by default, and is
+only used if its directories are owned by the current user and cannot be written by other users.
+"""
+import cPickle
+import os
+
+from java.io import File
+from java.lang import Exception as JException
+from java.lang import System
+
+from oracle.weblogic.deploy.util import FileUtils
+
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+# Environment variable used to override the location of the cache directory.
+CACHE_DIR_ENV_VARIABLE = 'WLSDEPLOY_ALIAS_CACHE_DIR'
+# Environment variable used to turn off the cache, if set to true.
+CACHE_DISABLED_ENV_VARIABLE = 'WLSDEPLOY_ALIAS_CACHE_DISABLED'
+
+# Keys used in the cache entry dictionary for a category.
+CATEGORY = 'category'
+UNRESOLVED = 'unresolved'
+
+_class_name = 'alias_cache'
+_logger = PlatformLogger('wlsdeploy.aliases')
+
+_DEFAULT_CACHE_DIR_NAME = os.path.join('.wlsdeploy', 'alias-cache')
+_CACHE_FILE_EXTENSION = '.cache'
+_PICKLE_PROTOCOL = 1
+
+# jar file hashes already computed by this process, keyed by the jar file path
+_jar_hashes = {}
+
+
+def get_cache_directory(resource_name, wls_version, wlst_mode):
+    """
+    Get the cache directory for the alias category dictionaries resolved for the specified WLS version
+    and WLST mode.  The cache is only used when the resource is loaded from a jar file, since the
+    contents of a class directory cannot be reliably identified.
+    :param resource_name: the name of a resource in the jar file containing the alias category modules
+    :param wls_version: the WLS version used to resolve the alias dictionaries
+    :param wlst_mode: the WLST mode used to resolve the alias dictionaries
+    :return: the cache directory path, or None if the cache should not be used
+    """
+    _method_name = 'get_cache_directory'
+
+    _logger.entering(resource_name, wls_version, WlstModes.from_value(wlst_mode),
+                     class_name=_class_name, method_name=_method_name)
+    disabled = os.environ.get(CACHE_DISABLED_ENV_VARIABLE)
+    if disabled is not None and disabled.lower() == 'true':
+        _logger.fine('WLSDPLY-08150', CACHE_DISABLED_ENV_VARIABLE, class_name=_class_name, method_name=_method_name)
+        return None
+
+    jar_hash = _get_jar_hash(resource_name)
+    if jar_hash is None:
+        return None
+
+    cache_root = os.environ.get(CACHE_DIR_ENV_VARIABLE)
+    if cache_root is None or len(cache_root) == 0:
+        cache_root = os.path.join(System.getProperty('user.home'), _DEFAULT_CACHE_DIR_NAME)
+
+    version_dir_name = '%s_%s' % (wls_version, WlstModes.from_value(wlst_mode))
+    result = os.path.join(cache_root, jar_hash, version_dir_name)
+    if not _is_private_cache_directory(cache_root, result):
+        result = None
+    _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
+    return result
+
+
+def is_category_cached(cache_dir, category_name):
+    """
+    Is the specified category stored in the cache?
+    :param cache_dir: the cache directory returned by get_cache_directory()
+    :param category_name: the model category name
+    :return: True if the category cache file exists, False otherwise
+    """
+    return os.path.isfile(_get_cache_file_name(cache_dir, category_name))
+
+
+def load_category(cache_dir, category_name):
+    """
+    Load the cache entry for the specified category.  Any error reading the cache is logged and
+    treated as a cache miss.
+    :param cache_dir: the cache directory returned by get_cache_directory()
+    :param category_name: the model category name
+    :return: the cache entry dictionary, or None if the category was not cached
+    """
+    _method_name = 'load_category'
+
+    cache_file_name = _get_cache_file_name(cache_dir, category_name)
+    if not os.path.isfile(cache_file_name):
+        _logger.finer('WLSDPLY-08151', category_name, cache_file_name, class_name=_class_name,
+                      method_name=_method_name)
+        return None
+
+    result = None
+    try:
+        cache_file = open(cache_file_name, 'rb')
+        try:
+            result = cPickle.load(cache_file)
+        finally:
+            cache_file.close()
+    except Exception, ex:
+        _logger.fine('WLSDPLY-08152', category_name, cache_file_name, str(ex), class_name=_class_name,
+                     method_name=_method_name)
+        result = None
+    except JException, ex:
+        _logger.fine('WLSDPLY-08152', category_name, cache_file_name, ex.getLocalizedMessage(),
+                     class_name=_class_name, method_name=_method_name)
+        result = None
+
+    if type(result) is not dict or CATEGORY not in result:
+        return None
+
+    _logger.fine('WLSDPLY-08153', category_name, cache_file_name, class_name=_class_name, method_name=_method_name)
+    return result
+
+
+def store_category(cache_dir, category_name, cache_entry):
+    """
+    Store the cache entry for the specified category.  The entry is written to a temporary file
+    that is then renamed, so that concurrent processes sharing the cache never read a partial entry.
+    Any error writing the cache is logged and otherwise ignored.
+    :param cache_dir: the cache directory returned by get_cache_directory()
+    :param category_name: the model category name
+    :param cache_entry: the cache entry dictionary to store
+    """
+    _method_name = 'store_category'
+
+    cache_file_name = _get_cache_file_name(cache_dir, category_name)
+    temp_file = None
+    try:
+        cache_dir_file = File(cache_dir)
+        if not cache_dir_file.isDirectory() and not cache_dir_file.mkdirs() and not cache_dir_file.isDirectory():
+            _logger.fine('WLSDPLY-08158', cache_dir, class_name=_class_name, method_name=_method_name)
+            return
+
+        temp_file = File.createTempFile(category_name, '.tmp', cache_dir_file)
+        output_file = open(temp_file.getPath(), 'wb')
+        try:
+            cPickle.dump(cache_entry, output_file, _PICKLE_PROTOCOL)
+        finally:
+            output_file.close()
+
+        if temp_file.renameTo(File(cache_file_name)):
+            temp_file = None
+            _logger.fine('WLSDPLY-08155', category_name, cache_file_name, class_name=_class_name,
+                         method_name=_method_name)
+    except Exception, ex:
+        _logger.fine('WLSDPLY-08154', category_name, cache_file_name, str(ex), class_name=_class_name,
+                     method_name=_method_name)
+    except JException, ex:
+        _logger.fine('WLSDPLY-08154', category_name, cache_file_name, ex.getLocalizedMessage(),
+                     class_name=_class_name, method_name=_method_name)
+
+    # another process may have stored the same entry first, so just clean up
+    if temp_file is not None and temp_file.exists():
+        temp_file.delete()
+    return
+
+
+###############################################################################
+#                              Private functions                              #
+###############################################################################
+
+def _get_cache_file_name(cache_dir, category_name):
+    return os.path.join(cache_dir, category_name + _CACHE_FILE_EXTENSION)
+
+
+def _is_private_cache_directory(cache_root, cache_dir):
+    """
+    Create the cache directory if it does not exist, and check that the cache root directory and each of its
+    subdirectories down to the cache directory are owned by the current user and cannot be written by other
+    users, so that no other user can plant a cache file.
+    :param cache_root: the cache root directory
+    :param cache_dir: the cache directory beneath the cache root directory
+    :return: True if the cache directory can be used, False otherwise
+    """
+    _method_name = '_is_private_cache_directory'
+
+    cache_dir_file = File(cache_dir)
+    if not FileUtils.createPrivateDirectory(cache_dir_file):
+        _logger.fine('WLSDPLY-08158', cache_dir, class_name=_class_name, method_name=_method_name)
+        return False
+
+    root_path = File(cache_root).getAbsolutePath()
+    directory = cache_dir_file.getAbsoluteFile()
+    while directory is not None:
+        if not FileUtils.isPrivateDirectory(directory):
+            _logger.warning('WLSDPLY-08159', directory.getPath(), class_name=_class_name, method_name=_method_name)
+            return False
+        if directory.getPath() == root_path:
+            break
+        directory = directory.getParentFile()
+    return True
+
+
+def _get_jar_hash(resource_name):
+    """
+    Get the hash of the jar file containing the specified resource, formatted for use as a directory name.
+    The hash for each jar file is only computed once per process.
+    :param resource_name: the resource name
+    :return: the formatted hash, or None if the resource was not loaded from a jar file
+    """
+    _method_name = '_get_jar_hash'
+
+    jar_file = FileUtils.getResourceJarFile(resource_name)
+    if jar_file is None:
+        _logger.fine('WLSDPLY-08156', resource_name, class_name=_class_name, method_name=_method_name)
+        return None
+
+    jar_path = jar_file.getPath()
+    if jar_path not in _jar_hashes:
+        try:
+            jar_hash = FileUtils.computeHash(jar_file)
+            # Base64 contains characters that are not valid in file names
+            _jar_hashes[jar_path] = jar_hash.replace('/', '_').replace('+', '-').replace('=', '')
+        except JException, ex:
+            _logger.fine('WLSDPLY-08157', jar_path, ex.getLocalizedMessage(), class_name=_class_name,
+                         method_name=_method_name)
+            _jar_hashes[jar_path] = None
+    return _jar_hashes[jar_path]
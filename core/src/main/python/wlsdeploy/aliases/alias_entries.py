@@ -2,14 +2,17 @@
 Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
-import copy
+import os
+import threading
 
+from oracle.weblogic.deploy.aliases import AliasException
 from oracle.weblogic.deploy.aliases import VersionException
 from oracle.weblogic.deploy.aliases import VersionUtils
 from oracle.weblogic.deploy.json import JsonException
 from oracle.weblogic.deploy.json import JsonStreamTranslator
 from oracle.weblogic.deploy.util import FileUtils
 
+import wlsdeploy.aliases.alias_cache as alias_cache
 import wlsdeploy.aliases.alias_utils as alias_utils
 from wlsdeploy.aliases import password_utils
 from wlsdeploy.aliases.alias_constants import ChildFoldersTypes
@@ -18,6 +21,8 @@ from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import task_executor
+from wlsdeploy.util.task_executor import TaskExecutor
 from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
@@ -56,6 +61,15 @@ from wlsdeploy.aliases.alias_constants import WLST_TYPE
 _class_name = 'AliasEntries'
 _logger = PlatformLogger('wlsdeploy.aliases')
 
+# Environment variable used to load all alias categories in the background, if set to true.
+PRELOAD_ENV_VARIABLE = 'WLSDEPLOY_ALIAS_PRELOAD'
+# Environment variable used to set the number of threads used to load the alias categories in the background.
+PRELOAD_THREADS_ENV_VARIABLE = 'WLSDEPLOY_ALIAS_PRELOAD_THREADS'
+
+# markers for the dictionary and list signatures used to find identical alias values
+_DICT_SIGNATURE = 'dict'
+_LIST_SIGNATURE = 'list'
+
 
 class AliasEntries(object):
     """
@@ -190,6 +204,9 @@ class AliasEntries(object):
 
     __domain_name_token = 'DOMAIN'
 
+    # maximum number of (folder path, name tokens) entries kept in the resolved paths cache
+    __resolved_paths_cache_size = 4096
+
     def __init__(self, wlst_mode=WlstModes.OFFLINE, wls_version=None):
         """
         The initialization method called when the object is constructed.
@@ -197,6 +214,18 @@ class AliasEntries(object):
         :param wls_version: the WLS version to use, the default is the version of WLST being used to run the program.
         """
         self._category_dict = {}
+        self._resolved_paths_dict = {}
+        # resolved alias values shared by all identical subtrees, keyed by the hash of their shallow signatures
+        self._shared_values = {}
+        # the other shared values whose shallow signatures have the same hash, which should be rare
+        self._shared_collisions = {}
+        # resolved attribute entries for the category being loaded,
+        # keyed by the model attribute name and the raw attribute definition
+        self._resolved_attributes = {}
+        # the results of testing the WLS version against version ranges, keyed by the range string
+        self._version_in_range_results = {}
+        # held while a category is resolved and added to the knowledge base
+        self._category_lock = threading.RLock()
         self._wlst_mode = wlst_mode
         if wls_version is None:
             self._wls_helper = WebLogicHelper(_logger)
@@ -205,12 +234,19 @@ class AliasEntries(object):
             self._wls_helper = WebLogicHelper(_logger, wls_version)
             self._wls_version = wls_version
 
+        domain_category_file = '%s%s.json' % (self.__category_modules_dir_name, self.__domain_category)
+        self._alias_cache_dir = alias_cache.get_cache_directory(domain_category_file, self._wls_version,
+                                                                self._wlst_mode)
+        preload = os.environ.get(PRELOAD_ENV_VARIABLE)
+        if preload is not None and preload.lower() == 'true':
+            self.__start_preload()
         return
 
     def get_dictionary_for_location(self, location, resolve=True):
         """
         Get the alias dictionary for the specified location with all the context applied to the data.  Note
-        that any paths in subfolders are not resolved by this method.
+        that any paths in subfolders are not resolved by this method, and that the dictionary shares its alias
+        data with the knowledge base so it must not be modified.
         :param location: the location context that identifies the folder in question and the name
                          tokens to use to convert the WLST paths to concrete values
         :return: the alias dictionary for the specified location, or None if the dictionary is not relevant
@@ -676,8 +712,8 @@ class AliasEntries(object):
 
     def get_alias_attribute_entries_by_location(self, location):
         """
-        Get the attribute entries for the specified location.  Note that since this method does not resolve
-        the paths, the wlst_path attribute is removed for the returned attribute entries.
+        Get the attribute entries for the specified location.  The entries are shared with the knowledge base
+        and must not be modified.
         :param location: the location
         :return: the dictionary of attribute entries, keyed by the model attribute names
         :raises AliasException: if an error occurs
@@ -686,16 +722,8 @@ class AliasEntries(object):
 
         _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
-        model_attr_dict = dict()
         if folder_dict is not None and ATTRIBUTES in folder_dict:
-            attrs = folder_dict[ATTRIBUTES]
-            for attr_name in attrs:
-                attr = copy.deepcopy(attrs[attr_name])
-                if WLST_PATH in attr:
-                    del attr[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08107', attr_name, location.get_folder_path(), WLST_PATH)
-                model_attr_dict[attr_name] = attr
+            model_attr_dict = folder_dict[ATTRIBUTES]
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08108', location.get_folder_path(), ATTRIBUTES)
             _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
@@ -707,6 +735,7 @@ class AliasEntries(object):
     def get_alias_attribute_entry_by_model_name(self, location, model_attribute_name):
         """
         Get a single alias attribute entry from the specified location by its model name.
+        The entry is shared with the knowledge base and must not be modified.
         :param location: the location
         :param model_attribute_name: the model name for the attribute
         :return: the alias entry for the specified attribute
@@ -718,11 +747,7 @@ class AliasEntries(object):
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and ATTRIBUTES in folder_dict:
             if model_attribute_name in folder_dict[ATTRIBUTES]:
-                model_attr_dict = copy.deepcopy(folder_dict[ATTRIBUTES][model_attribute_name])
-                if WLST_PATH in model_attr_dict:
-                    del model_attr_dict[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08107', model_attribute_name, location.get_folder_path(), WLST_PATH)
+                model_attr_dict = folder_dict[ATTRIBUTES][model_attribute_name]
             else:
                 model_attr_dict = None
         else:
@@ -737,6 +762,7 @@ class AliasEntries(object):
     def get_alias_attribute_entry_by_wlst_name(self, location, wlst_attribute_name):
         """
         Get a single alias attribute entry from the specified location by its WLST name.
+        The entry is shared with the knowledge base and must not be modified.
         :param location: the location
         :param wlst_attribute_name: the WLST name for the attribute
         :return: the alias entry for the specified attribute
@@ -750,11 +776,7 @@ class AliasEntries(object):
             result = None
         elif folder_dict is not None and WLST_NAMES_MAP in folder_dict:
             if wlst_attribute_name in folder_dict[WLST_NAMES_MAP]:
-                result = copy.deepcopy(folder_dict[WLST_NAMES_MAP][wlst_attribute_name])
-                if WLST_PATH in result:
-                    del result[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08110', wlst_attribute_name, location.get_folder_path(), WLST_PATH)
+                result = folder_dict[WLST_NAMES_MAP][wlst_attribute_name]
             else:
                 if wlst_attribute_name not in self.IGNORE_FOR_MODEL_LIST:
                     ex = exception_helper.create_alias_exception('WLSDPLY-08111', location.get_folder_path(),
@@ -942,7 +964,10 @@ class AliasEntries(object):
                 path_name += '/' + location_subfolder
 
             if resolve_path_tokens:
-                resolved_dict = alias_utils.resolve_path_tokens(location, path_name, child_dict)
+                resolved_paths = None
+                if child_dict is not None:
+                    resolved_paths = self.__get_resolved_folder_paths(location, path_name, child_dict)
+                resolved_dict = alias_utils.resolve_path_tokens(location, path_name, child_dict, resolved_paths)
             else:
                 resolved_dict = child_dict
         else:
@@ -951,6 +976,30 @@ class AliasEntries(object):
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return resolved_dict
 
+    def __get_resolved_folder_paths(self, location, path_name, folder_dict):
+        """
+        Get the resolved paths for the folder, using the paths previously resolved for the same folder
+        and name tokens if possible.
+        :param location: the location of the folder
+        :param path_name: the model folder path name
+        :param folder_dict: the dictionary for the folder
+        :return: the dictionary of resolved paths
+        :raises: AliasException: if an error occurs while processing the path tokens
+        """
+        name_tokens = location.get_name_tokens().items()
+        name_tokens.sort()
+        cache_key = (path_name, tuple(name_tokens))
+        # a single lookup, since another thread may clear the cache between a membership test and a read
+        resolved_paths = self._resolved_paths_dict.get(cache_key)
+        if resolved_paths is not None:
+            return resolved_paths
+
+        resolved_paths = alias_utils.get_resolved_folder_paths(location, path_name, folder_dict)
+        if len(self._resolved_paths_dict) >= self.__resolved_paths_cache_size:
+            self._resolved_paths_dict.clear()
+        self._resolved_paths_dict[cache_key] = resolved_paths
+        return resolved_paths
+
     def __get_category_dictionary(self, model_category_name):
         """
         Get the category dictionary from the cache, loading it first if required.  The dictionary
@@ -963,27 +1012,128 @@ class AliasEntries(object):
             self.__load_category(model_category_name)
         return self._category_dict[model_category_name]
 
-    def __load_category(self, model_category_name):
+    def __load_category(self, model_category_name, raw_category_dict=None):
         """
-        Load the category and apply WLS version and WLST mode context to it.
+        Load the category and apply WLS version and WLST mode context to it.  The category is resolved
+        while holding the category lock, so that it can be loaded by the preload threads.
         :param model_category_name: the category name
+        :param raw_category_dict: the raw category dictionary, if it was already loaded by the caller
         :raises: AliasException: if an error occurs
         """
         _method_name = '__load_category'
 
         _logger.entering(model_category_name, class_name=_class_name, method_name=_method_name)
+        self._category_lock.acquire()
+        try:
+            # another thread may have loaded the category while this one was waiting
+            if model_category_name not in self._category_dict and \
+                    not self.__load_cached_category(model_category_name):
+                if raw_category_dict is None:
+                    raw_category_dict = self.__load_raw_category(model_category_name)
+
+                # Now that the structure and paths are updated based on loading contains references,
+                # process the folder recursively and resolve everything based on WLS version and WLST mode.
+                category_dict = \
+                    self.__apply_wlst_context_changes(model_category_name, raw_category_dict, self._category_dict)
+                self._category_dict[model_category_name] = self.__share_alias_values(category_dict)
+                self.__store_cached_category(model_category_name)
+        finally:
+            # the raw attribute signatures are as large as the definitions, so only keep them for one category
+            self._resolved_attributes.clear()
+            self._category_lock.release()
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return
+
+    def __load_raw_category(self, model_category_name):
+        """
+        Load the raw category dictionary from its data file, including the categories that it contains.
+        This method does not use the knowledge base, so it can be called concurrently by the preload threads.
+        :param model_category_name: the category name
+        :return: the raw category dictionary
+        :raises: AliasException: if an error occurs
+        """
+        _method_name = '__load_raw_category'
+
         model_category_file = self.__model_categories_map[model_category_name]
         raw_category_dict = self.__load_category_file(model_category_file)
         _logger.fine('WLSDPLY-08118', model_category_name, class_name=_class_name, method_name=_method_name)
 
         # At this point, we need to look for contains elements and replace them accordingly.
         self.__load_contains_categories(model_category_name, raw_category_dict)
+        return raw_category_dict
 
-        # Now that the structure and paths are updated based on loading contains references,
-        # process the folder recursively and resolve everything based on WLS version and WLST mode.
-        self._category_dict[model_category_name] = \
-            self.__apply_wlst_context_changes(model_category_name, raw_category_dict, self._category_dict)
-        _logger.exiting(class_name=_class_name, method_name=_method_name)
+    def __start_preload(self):
+        """
+        Start loading all the categories on background threads, so that they are ready before they are first used.
+        """
+        _method_name = '__start_preload'
+
+        category_names = self.__model_categories_map.keys()
+        thread_count = _get_preload_thread_count()
+        _logger.fine('WLSDPLY-08145', len(category_names), thread_count, class_name=_class_name,
+                     method_name=_method_name)
+        executor = TaskExecutor(thread_count, 'wlsdeploy-alias-preload')
+        for category_name in category_names:
+            executor.submit(self.__preload_category, category_name)
+        executor.shutdown()
+        return
+
+    def __preload_category(self, model_category_name):
+        """
+        Load the category on a preload thread.  The data file is parsed before taking the category lock,
+        so that the data files are parsed concurrently.  Errors are only logged, since the category
+        will be loaded again, and the error reported, when it is first used.
+        :param model_category_name: the category name
+        """
+        _method_name = '__preload_category'
+
+        try:
+            if model_category_name not in self._category_dict:
+                raw_category_dict = None
+                if self._alias_cache_dir is None or \
+                        not alias_cache.is_category_cached(self._alias_cache_dir, model_category_name):
+                    raw_category_dict = self.__load_raw_category(model_category_name)
+                self.__load_category(model_category_name, raw_category_dict)
+        except AliasException, ae:
+            _logger.fine('WLSDPLY-08146', model_category_name, ae.getLocalizedMessage(), class_name=_class_name,
+                         method_name=_method_name)
+        except Exception, ex:
+            _logger.fine('WLSDPLY-08146', model_category_name, str(ex), class_name=_class_name,
+                         method_name=_method_name)
+        return
+
+    def __load_cached_category(self, model_category_name):
+        """
+        Load the category from the alias cache, if it was previously stored for this WLS version and WLST mode.
+        :param model_category_name: the category name
+        :return: True if the category was loaded from the cache, False otherwise
+        """
+        if self._alias_cache_dir is None:
+            return False
+
+        cache_entry = alias_cache.load_category(self._alias_cache_dir, model_category_name)
+        if cache_entry is None:
+            return False
+
+        self._category_dict[model_category_name] = self.__share_alias_values(cache_entry[alias_cache.CATEGORY])
+        if alias_cache.UNRESOLVED in cache_entry:
+            _add_to_unresolved_folders(model_category_name, self._category_dict, cache_entry[alias_cache.UNRESOLVED])
+        return True
+
+    def __store_cached_category(self, model_category_name):
+        """
+        Store the resolved category in the alias cache, along with the unresolved folder entry
+        for the category if it is not relevant to this WLS version and WLST mode.
+        :param model_category_name: the category name
+        """
+        if self._alias_cache_dir is None:
+            return
+
+        cache_entry = {alias_cache.CATEGORY: self._category_dict[model_category_name]}
+        if UNRESOLVED_FOLDERS_MAP in self._category_dict and \
+                model_category_name in self._category_dict[UNRESOLVED_FOLDERS_MAP]:
+            cache_entry[alias_cache.UNRESOLVED] = self._category_dict[UNRESOLVED_FOLDERS_MAP][model_category_name]
+        alias_cache.store_category(self._alias_cache_dir, model_category_name, cache_entry)
         return
 
     def __load_category_file(self, category_base_file_name):
@@ -1146,46 +1296,36 @@ class AliasEntries(object):
             result_model_attrs = dict()
             result_wlst_attrs = dict()
             unresolved_attrs = dict()
-            wlst_skip_attrs = list()
+            wlst_skip_attrs = dict()
 
             model_attrs = alias_dict[ATTRIBUTES]
             for model_attr in model_attrs:
-                model_attr_dict, unresolved_version_range = \
-                    self.__resolve_attribute_by_wlst_context(path_name, model_attr, model_attrs)
+                model_attr_dict, wlst_path, unresolved_version_range = \
+                    self.__get_resolved_attribute(path_name, model_attr, model_attrs)
                 if model_attr_dict is None:
                     unresolved_attrs[model_attr] = unresolved_version_range
                     continue
 
                 #
-                # At this point, the attribute is matched to a single dictionary.  All we
-                # need to do is to remove the version and wlst_mode attributes.  We do not
-                # resolve and replace the wlst_path value yet since the path tokens cannot
-                # yet be replaced.  We will resolve and replace the wlst_path at runtime
-                # to make the token replacement more efficient.
+                # The wlst_path of the attribute is only checked against the folder's wlst_paths,
+                # since the attribute entries are shared, read-only records and no caller uses the path.
                 #
-                del model_attr_dict[VERSION_RANGE]
-                del model_attr_dict[WLST_MODE]
-
-                if WLST_NAME in model_attr_dict:
-                    wlst_name = model_attr_dict[WLST_NAME]
-                else:
-                    ex = exception_helper.create_alias_exception('WLSDPLY-08128', model_attr, path_name)
+                if wlst_path is None:
+                    ex = exception_helper.create_alias_exception('WLSDPLY-08011', model_attr, path_name)
+                    _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                    raise ex
+                elif wlst_path not in result[WLST_PATHS]:
+                    ex = exception_helper.create_alias_exception('WLSDPLY-08010', model_attr, path_name, wlst_path)
                     _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
                     raise ex
 
-                #
-                # To make the reverse lookup map usable, we need to add the model attribute name to the
-                # model_attr_dict.  Otherwise, it is impossible to find the model attribute name when
-                # looking up the attribute by the WLST name.
-                #
-                model_attr_dict[MODEL_NAME] = model_attr
                 result_model_attrs[model_attr] = model_attr_dict
-                result_wlst_attrs[wlst_name] = model_attr_dict
+                result_wlst_attrs[model_attr_dict[WLST_NAME]] = model_attr_dict
 
                 # if attribute is dual-password, add its WLST skip name to the skip list
                 skip_name = password_utils.get_wlst_skip_name(model_attr_dict, self._wlst_mode)
                 if skip_name is not None:
-                    wlst_skip_attrs.append(skip_name)
+                    wlst_skip_attrs[skip_name] = True
 
             result[ATTRIBUTES] = result_model_attrs
             result[WLST_NAMES_MAP] = result_wlst_attrs
@@ -1194,6 +1334,104 @@ class AliasEntries(object):
 
         return result
 
+    def __get_resolved_attribute(self, path_name, model_attr, model_attrs):
+        """
+        Get the attribute entry that applies to the current WLS version and WLST mode.  Identical raw attribute
+        definitions in the category being loaded, such as those repeated in folders included by several contains
+        references, are only resolved once and share the same attribute entry.
+        :param path_name: the model folder path name for the attribute
+        :param model_attr: the model attribute name
+        :param model_attrs: the raw attributes dictionary
+        :return: the attribute entry, the wlst_path of the entry and the unmatched version range,
+                 where either the entry or the version range will be None
+        :raises: AliasException: if an error occurs
+        """
+        _method_name = '__get_resolved_attribute'
+
+        raw_key = (model_attr, _get_raw_signature(model_attrs[model_attr]))
+        result = self._resolved_attributes.get(raw_key)
+        if result is not None:
+            return result
+
+        model_attr_dict, unresolved_version_range = \
+            self.__resolve_attribute_by_wlst_context(path_name, model_attr, model_attrs)
+        wlst_path = None
+        if model_attr_dict is not None:
+            #
+            # At this point, the attribute is matched to a single dictionary.  All we need to do is
+            # to remove the version, wlst_mode and wlst_path attributes.
+            #
+            del model_attr_dict[VERSION_RANGE]
+            del model_attr_dict[WLST_MODE]
+            if WLST_PATH in model_attr_dict:
+                wlst_path = model_attr_dict[WLST_PATH]
+                del model_attr_dict[WLST_PATH]
+
+            if WLST_NAME not in model_attr_dict:
+                ex = exception_helper.create_alias_exception('WLSDPLY-08128', model_attr, path_name)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+
+            #
+            # To make the reverse lookup map usable, we need to add the model attribute name to the
+            # model_attr_dict.  Otherwise, it is impossible to find the model attribute name when
+            # looking up the attribute by the WLST name.
+            #
+            model_attr_dict[MODEL_NAME] = model_attr
+
+        result = (model_attr_dict, wlst_path, unresolved_version_range)
+        self._resolved_attributes[raw_key] = result
+        return result
+
+    def __share_alias_values(self, value):
+        """
+        Replace the dictionaries and lists in the resolved alias value with the equal ones already in use,
+        so that identical subtrees are only held in memory once.  This covers the folders and attribute entries
+        repeated between the Server and ServerTemplate categories, as well as the JDBC, JMS and WLDF folders
+        contained in the Partition and ResourceGroupTemplate folders.  The shared values must not be modified.
+
+        The values are shared bottom-up, so two values are equal if their scalar children are equal and their
+        other children are the same shared objects.  Only the hash of this shallow signature is kept, so the
+        table costs one entry per shared value instead of a copy of the value.
+        :param value: the resolved alias value, whose nested values are replaced in place
+        :return: the shared value equal to the specified value
+        """
+        value_type = type(value)
+        if value_type is dict:
+            items = list()
+            for key in value.keys():
+                child = self.__share_alias_values(value[key])
+                value[key] = child
+                items.append((key, _get_shallow_signature(child)))
+            items.sort()
+            signature_hash = hash((_DICT_SIGNATURE, tuple(items)))
+        elif value_type is list:
+            elements = list()
+            for index in range(len(value)):
+                child = self.__share_alias_values(value[index])
+                value[index] = child
+                elements.append(_get_shallow_signature(child))
+            signature_hash = hash((_LIST_SIGNATURE, tuple(elements)))
+        else:
+            return value
+
+        shared = self._shared_values.get(signature_hash)
+        if shared is None:
+            self._shared_values[signature_hash] = value
+            return value
+        if _is_shallow_equal(shared, value):
+            return shared
+
+        collisions = self._shared_collisions.get(signature_hash)
+        if collisions is None:
+            collisions = list()
+            self._shared_collisions[signature_hash] = collisions
+        for shared in collisions:
+            if _is_shallow_equal(shared, value):
+                return shared
+        collisions.append(value)
+        return value
+
     def __is_version(self, path_name, alias_dict):
         _method_name = '__is_version'
         is_version = True
@@ -1370,11 +1608,16 @@ class AliasEntries(object):
         :return: true if the current version is within the range, false otherwise
         :raises: VersionException: if an error occurs in processing the specified version range
         """
-        return VersionUtils.isVersionInRange(self._wls_version, attr_version_range)
+        # the WLS version is fixed, and the alias files only use a few dozen distinct ranges
+        if attr_version_range not in self._version_in_range_results:
+            version_range = VersionUtils.getVersionRange(attr_version_range)
+            self._version_in_range_results[attr_version_range] = version_range.includes(self._wls_version)
+        return self._version_in_range_results[attr_version_range]
 
     def __resolve_attribute(self, attr_dict):
         """
         Process the attribute entry removing the curly braces to allow the correct value based on the current WLST mode.
+        The keys and string values are interned, since the same few strings are repeated in thousands of entries.
         :param attr_dict: the attribute entry dictionary
         :return: a modified copy of the attribute entry dictionary
         """
@@ -1382,9 +1625,9 @@ class AliasEntries(object):
         for key in attr_dict:
             attr = attr_dict[key]
             if type(attr) is dict:
-                result[key] = self.__resolve_attribute(attr)
+                result[intern(key)] = self.__resolve_attribute(attr)
             else:
-                result[key] = self._resolve_curly_braces(attr)
+                result[intern(key)] = _intern_value(self._resolve_curly_braces(attr))
 
         for key in [GET_METHOD, SET_METHOD, GET_MBEAN_TYPE, SET_MBEAN_TYPE]:
             if key in result and len(result[key]) == 0:
@@ -1464,7 +1707,7 @@ class AliasEntries(object):
         return version_range
 
     def _is_wlst_attribute_skipped(self, folder_dict, wlst_attribute_name):
-        skip_names = dictionary_utils.get_element(folder_dict, WLST_SKIP_NAMES)  # type: list
+        skip_names = dictionary_utils.get_element(folder_dict, WLST_SKIP_NAMES)  # type: dict
         if skip_names is not None:
             return wlst_attribute_name in skip_names
         return False
@@ -1505,3 +1748,94 @@ def _add_to_unresolved_folders(path_name, parent_dict, unresolved):
         parent_dict[UNRESOLVED_FOLDERS_MAP] = dict()
     alias_dict_folder_name = alias_utils.compute_folder_name_from_path(path_name)
     parent_dict[UNRESOLVED_FOLDERS_MAP][alias_dict_folder_name] = unresolved
+
+
+def _get_preload_thread_count():
+    """
+    Get the number of threads used to preload the categories.
+    :return: the thread count from the environment, or the number of available processors
+    """
+    _method_name = '_get_preload_thread_count'
+
+    default_count = task_executor.get_default_worker_count()
+    thread_count = os.environ.get(PRELOAD_THREADS_ENV_VARIABLE)
+    if thread_count is None:
+        return default_count
+    try:
+        result = int(thread_count)
+    except ValueError:
+        result = 0
+    if result < 1:
+        _logger.warning('WLSDPLY-08147', thread_count, PRELOAD_THREADS_ENV_VARIABLE, default_count,
+                        class_name=_class_name, method_name=_method_name)
+        result = default_count
+    return result
+
+
+def _get_raw_signature(value):
+    """
+    Get a hashable signature of a raw alias value, so that equal values have equal signatures.
+    :param value: the raw alias value
+    :return: the signature
+    """
+    value_type = type(value)
+    if value_type is dict:
+        items = list()
+        for key, child in value.iteritems():
+            items.append((key, _get_raw_signature(child)))
+        items.sort()
+        return _DICT_SIGNATURE, tuple(items)
+    elif value_type is list:
+        elements = list()
+        for child in value:
+            elements.append(_get_raw_signature(child))
+        return _LIST_SIGNATURE, tuple(elements)
+    return value_type, value
+
+
+def _get_shallow_signature(value):
+    """
+    Get the part of the shallow signature for a child of a shared alias value.
+    :param value: the child value, which is already shared if it is a dictionary or list
+    :return: the id of a shared dictionary or list, or the type and value of a scalar value
+    """
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        return id(value)
+    return value_type, value
+
+
+def _is_shallow_equal(shared, value):
+    """
+    Is the value equal to the shared value?  The dictionaries and lists in both values are already shared,
+    so they are only equal if they are the same objects.
+    :param shared: the shared dictionary or list
+    :param value: the dictionary or list
+    :return: True if the values are equal, False otherwise
+    """
+    if type(shared) is not type(value) or len(shared) != len(value):
+        return False
+    if type(value) is dict:
+        for key, child in value.iteritems():
+            if key not in shared or not _is_same_child(shared[key], child):
+                return False
+    else:
+        for index in range(len(value)):
+            if not _is_same_child(shared[index], value[index]):
+                return False
+    return True
+
+
+def _is_same_child(shared_child, child):
+    if shared_child is child:
+        return True
+    child_type = type(child)
+    if child_type is dict or child_type is list or type(shared_child) is not child_type:
+        return False
+    return shared_child == child
+
+
+def _intern_value(value):
+    if type(value) is str:
+        return intern(value)
+    return value
@@ -28,7 +28,6 @@ from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 
 from wlsdeploy.aliases.alias_constants import ALIAS_DELIMITED_TYPES
-from wlsdeploy.aliases.alias_constants import ATTRIBUTES
 from wlsdeploy.aliases.alias_constants import COMMA_DELIMITED_STRING
 from wlsdeploy.aliases.alias_constants import DELIMITED_STRING
 from wlsdeploy.aliases.alias_constants import JARRAY
@@ -46,7 +45,6 @@ from wlsdeploy.aliases.alias_constants import WLST_ATTRIBUTES_PATH
 from wlsdeploy.aliases.alias_constants import WLST_CREATE_PATH
 from wlsdeploy.aliases.alias_constants import WLST_LIST_PATH
 from wlsdeploy.aliases.alias_constants import WLST_MODE
-from wlsdeploy.aliases.alias_constants import WLST_PATH
 from wlsdeploy.aliases.alias_constants import WLST_PATHS
 from wlsdeploy.aliases.alias_constants import WLST_READ_TYPE
 from wlsdeploy.aliases.alias_constants import WLST_TYPE
@@ -254,17 +252,17 @@ def get_missing_name_tokens(wlst_path):
     return missing_name_tokens.keys()
 
 
-def resolve_path_tokens(location, path_name, folder_dict):
+def resolve_path_tokens(location, path_name, folder_dict, resolved_paths=None):
     """
-    Resolve any path tokens in all paths within the folder
+    Resolve any path tokens in all paths within the folder.  The result is a shallow copy of the folder dictionary
+    that shares all other alias data with the folder dictionary, so the result must be treated as read-only.
     :param location: the location of the folder
     :param path_name: the path name
     :param folder_dict: the dictionary for the folder
+    :param resolved_paths: the paths already resolved for the location by get_resolved_folder_paths(), if available
     :return: a new dictionary with all path tokens resolved
     :raises: AliasException: if an error occurs while processing the path tokens
     """
-    _method_name = 'resolve_path_tokens'
-
     #
     # With folder versioning in place, a folder dictionary will be None if it is not relevant to the
     # current WLS version.  As such, just return None since there are no paths to resolve.
@@ -272,15 +270,33 @@ def resolve_path_tokens(location, path_name, folder_dict):
     if folder_dict is None:
         return None
 
-    #
-    # Now that we have the target dictionary, we need to make a copy of it and replace the path tokens.
-    #
-    resolved_dict = copy.deepcopy(folder_dict)
-    if WLST_PATHS in resolved_dict:
-        wlst_paths_dict = resolved_dict[WLST_PATHS]
-        for path_key in wlst_paths_dict:
-            path_value = wlst_paths_dict[path_key]
-            wlst_paths_dict[path_key] = replace_tokens_in_path(location, path_value)
+    if resolved_paths is None:
+        resolved_paths = get_resolved_folder_paths(location, path_name, folder_dict)
+
+    resolved_dict = copy.copy(folder_dict)
+    resolved_dict.update(resolved_paths)
+    return resolved_dict
+
+
+def get_resolved_folder_paths(location, path_name, folder_dict):
+    """
+    Resolve the path tokens in the wlst_paths of the folder, and resolve the attributes, subfolders, list and
+    create paths of the folder from them.  The result only depends on the folder and the location name tokens.
+    :param location: the location of the folder
+    :param path_name: the path name
+    :param folder_dict: the dictionary for the folder
+    :return: a dictionary containing the resolved wlst_paths dictionary and the resolved path for each path type
+    :raises: AliasException: if an error occurs while processing the path tokens
+    """
+    _method_name = 'get_resolved_folder_paths'
+
+    result = dict()
+    if WLST_PATHS in folder_dict:
+        wlst_paths_dict = dict()
+        folder_wlst_paths = folder_dict[WLST_PATHS]
+        for path_key in folder_wlst_paths:
+            wlst_paths_dict[path_key] = replace_tokens_in_path(location, folder_wlst_paths[path_key])
+        result[WLST_PATHS] = wlst_paths_dict
     else:
         ex = exception_helper.create_alias_exception('WLSDPLY-08007', path_name)
         _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
@@ -289,10 +305,10 @@ def resolve_path_tokens(location, path_name, folder_dict):
     #
     # Resolve the wlst path attributes in the model
     #
-    if WLST_ATTRIBUTES_PATH in resolved_dict:
-        wlst_path_key = resolved_dict[WLST_ATTRIBUTES_PATH]
+    if WLST_ATTRIBUTES_PATH in folder_dict:
+        wlst_path_key = folder_dict[WLST_ATTRIBUTES_PATH]
         if wlst_path_key in wlst_paths_dict:
-            resolved_dict[WLST_ATTRIBUTES_PATH] = wlst_paths_dict[wlst_path_key]
+            result[WLST_ATTRIBUTES_PATH] = wlst_paths_dict[wlst_path_key]
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08008', path_name, WLST_ATTRIBUTES_PATH,
                                                          wlst_path_key, WLST_PATHS)
@@ -303,10 +319,10 @@ def resolve_path_tokens(location, path_name, folder_dict):
         _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
         raise ex
 
-    if WLST_SUBFOLDERS_PATH in resolved_dict:
-        wlst_path_key = resolved_dict[WLST_SUBFOLDERS_PATH]
+    if WLST_SUBFOLDERS_PATH in folder_dict:
+        wlst_path_key = folder_dict[WLST_SUBFOLDERS_PATH]
         if wlst_path_key in wlst_paths_dict:
-            resolved_dict[WLST_SUBFOLDERS_PATH] = wlst_paths_dict[wlst_path_key]
+            result[WLST_SUBFOLDERS_PATH] = wlst_paths_dict[wlst_path_key]
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08008', path_name, WLST_SUBFOLDERS_PATH,
                                                          wlst_path_key, WLST_PATHS)
@@ -314,12 +330,12 @@ def resolve_path_tokens(location, path_name, folder_dict):
             raise ex
     else:
         # default back to the attributes path
-        resolved_dict[WLST_SUBFOLDERS_PATH] = resolved_dict[WLST_ATTRIBUTES_PATH]
+        result[WLST_SUBFOLDERS_PATH] = result[WLST_ATTRIBUTES_PATH]
 
-    if WLST_LIST_PATH in resolved_dict:
-        wlst_path_key = resolved_dict[WLST_LIST_PATH]
+    if WLST_LIST_PATH in folder_dict:
+        wlst_path_key = folder_dict[WLST_LIST_PATH]
         if wlst_path_key in wlst_paths_dict:
-            resolved_dict[WLST_LIST_PATH] = wlst_paths_dict[wlst_path_key]
+            result[WLST_LIST_PATH] = wlst_paths_dict[wlst_path_key]
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08008', path_name, WLST_LIST_PATH,
                                                          wlst_path_key, WLST_PATHS)
@@ -327,13 +343,13 @@ def resolve_path_tokens(location, path_name, folder_dict):
             raise ex
     else:
         # default back to the parent folder of the attributes path
-        attr_path = resolved_dict[WLST_ATTRIBUTES_PATH]
-        resolved_dict[WLST_LIST_PATH] = strip_trailing_folders_in_path(attr_path)
+        attr_path = result[WLST_ATTRIBUTES_PATH]
+        result[WLST_LIST_PATH] = strip_trailing_folders_in_path(attr_path)
 
-    if WLST_CREATE_PATH in resolved_dict:
-        wlst_path_key = resolved_dict[WLST_CREATE_PATH]
+    if WLST_CREATE_PATH in folder_dict:
+        wlst_path_key = folder_dict[WLST_CREATE_PATH]
         if wlst_path_key in wlst_paths_dict:
-            resolved_dict[WLST_CREATE_PATH] = wlst_paths_dict[wlst_path_key]
+            result[WLST_CREATE_PATH] = wlst_paths_dict[wlst_path_key]
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08008', path_name, WLST_CREATE_PATH,
                                                          wlst_path_key, WLST_PATHS)
@@ -341,32 +357,10 @@ def resolve_path_tokens(location, path_name, folder_dict):
             raise ex
     else:
         # default back to the grandparent folder of the attributes path
-        attr_path = resolved_dict[WLST_ATTRIBUTES_PATH]
-        resolved_dict[WLST_CREATE_PATH] = strip_trailing_folders_in_path(attr_path, 2)
-
-    #
-    # Now that the wlst_paths have been resolved, resolve the references to them in each of the attributes
-    #
-    if ATTRIBUTES in resolved_dict:
-        attrs_dict = resolved_dict[ATTRIBUTES]
-        for attr_name in attrs_dict:
-            attr_dict = attrs_dict[attr_name]
-
-            if WLST_PATH in attr_dict:
-                wlst_path_key = attr_dict[WLST_PATH]
+        attr_path = result[WLST_ATTRIBUTES_PATH]
+        result[WLST_CREATE_PATH] = strip_trailing_folders_in_path(attr_path, 2)
 
-                if wlst_path_key in wlst_paths_dict:
-                    attr_dict[WLST_PATH] = wlst_paths_dict[wlst_path_key]
-                else:
-                    ex = exception_helper.create_alias_exception('WLSDPLY-08010', attr_name,
-                                                                 path_name, wlst_path_key)
-                    _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
-                    raise ex
-            else:
-                ex = exception_helper.create_alias_exception('WLSDPLY-08011', attr_name, path_name)
-                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
-                raise ex
-    return resolved_dict
+    return result
 
 
 def resolve_path_index(folder_dict, paths_index, path_attribute_name_used, location):
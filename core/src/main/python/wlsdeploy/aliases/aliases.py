@@ -4,6 +4,7 @@ The Universal Permissive License (UPL), Version 1.0
 """
 from java.lang import String
 
+from oracle.weblogic.deploy.aliases import AliasException
 from oracle.weblogic.deploy.aliases import TypeUtils
 from oracle.weblogic.deploy.aliases import VersionUtils
 from oracle.weblogic.deploy.encrypt import EncryptionException
@@ -11,19 +12,23 @@ from oracle.weblogic.deploy.encrypt import EncryptionUtils
 
 from wlsdeploy.aliases.alias_constants import ChildFoldersTypes
 from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.folder_descriptor import FolderDescriptor
 from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.aliases import alias_utils
 from wlsdeploy.aliases import password_utils
+from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util import string_utils
+from wlsdeploy.util.lru_cache import LruCache
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
 from wlsdeploy.aliases.alias_constants import ACCESS
 from wlsdeploy.aliases.alias_constants import ALIAS_LIST_TYPES
 from wlsdeploy.aliases.alias_constants import ALIAS_MAP_TYPES
 from wlsdeploy.aliases.alias_constants import ATTRIBUTES
+from wlsdeploy.aliases.alias_constants import BOOLEAN
 from wlsdeploy.aliases.alias_constants import DEFAULT
 from wlsdeploy.aliases.alias_constants import FLATTENED_FOLDER_DATA
 from wlsdeploy.aliases.alias_constants import FOLDERS
@@ -31,21 +36,20 @@ from wlsdeploy.aliases.alias_constants import GET
 from wlsdeploy.aliases.alias_constants import GET_MBEAN_TYPE
 from wlsdeploy.aliases.alias_constants import GET_METHOD
 from wlsdeploy.aliases.alias_constants import JARRAY
+from wlsdeploy.aliases.alias_constants import JAVA_LANG_BOOLEAN
 from wlsdeploy.aliases.alias_constants import LIST
 from wlsdeploy.aliases.alias_constants import LSA
-from wlsdeploy.aliases.alias_constants import MBEAN
 from wlsdeploy.aliases.alias_constants import MERGE
 from wlsdeploy.aliases.alias_constants import MODEL_NAME
 from wlsdeploy.aliases.alias_constants import PASSWORD
 from wlsdeploy.aliases.alias_constants import PASSWORD_TOKEN
 from wlsdeploy.aliases.alias_constants import PREFERRED_MODEL_TYPE
 from wlsdeploy.aliases.alias_constants import PROPERTIES
-from wlsdeploy.aliases.alias_constants import RESTART_REQUIRED
 from wlsdeploy.aliases.alias_constants import SET_MBEAN_TYPE
-from wlsdeploy.aliases.alias_constants import SET_METHOD
 from wlsdeploy.aliases.alias_constants import USES_PATH_TOKENS
 from wlsdeploy.aliases.alias_constants import VALUE
 from wlsdeploy.aliases.alias_constants import WLST_NAME
+from wlsdeploy.aliases.alias_constants import WLST_SKIP_NAMES
 from wlsdeploy.aliases.alias_constants import WLST_TYPE
 from wlsdeploy.aliases.model_constants import MODEL_LIST_DELIMITER
 
@@ -54,9 +58,15 @@ class Aliases(object):
     """
     The public interface into the aliases subsystem that abstracts out the WLST knowledge base from the
     rest of the tooling.
+
+    The results of the per-folder queries that do not depend on the location name tokens are cached,
+    so the lists and dictionaries they return are shared and must not be modified by the caller.
     """
     _class_name = 'Aliases'
 
+    # maximum number of per-folder query results kept in the query cache
+    _query_cache_size = 1024
+
     def __init__(self, model_context, wlst_mode=WlstModes.OFFLINE, wls_version=None, logger=None):
         self._model_context = model_context
         self._wlst_mode = wlst_mode
@@ -73,8 +83,17 @@ class Aliases(object):
             self._wls_version = wls_version
 
         self._alias_entries = AliasEntries(wlst_mode, self._wls_version)
+        self._query_cache = LruCache(self._query_cache_size)
         return
 
+    def get_query_cache_statistics(self):
+        """
+        Get the statistics for the cache of per-folder query results.
+        :return: a dictionary with the hits, misses and size of the query cache
+        """
+        return {'hits': self._query_cache.get_hits(), 'misses': self._query_cache.get_misses(),
+                'size': self._query_cache.size()}
+
     ###########################################################################
     #              Model folder navigation-related methods                    #
     ###########################################################################
@@ -131,7 +150,13 @@ class Aliases(object):
         :return: list[string]: the list of model subfolder names or an empty list if there are none
         :raises: AliasException: if an error occurs while getting or processing the folders for the specified location
         """
-        return self._alias_entries.get_model_subfolder_names_for_location(location)
+        cache_key = self.__get_query_cache_key('get_model_subfolder_names', location)
+        result = self._query_cache.get(cache_key)
+        if result is None:
+            result = self._alias_entries.get_model_subfolder_names_for_location(location)
+            self._query_cache.put(cache_key, result)
+        # copy the cached list, so that callers that sort or modify the result do not change the cache
+        return list(result)
 
     def get_name_token(self, location):
         """
@@ -462,7 +487,7 @@ class Aliases(object):
         self._logger.entering(str(location), model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         wlst_attribute_name = None
-        alias_attr_dict = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
+        alias_attr_dict = self.get_folder_descriptor(location).get_attribute_entry(model_attribute_name)
         if alias_attr_dict is not None and (not check_read_only or not
                                             self.__is_model_attribute_read_only(location, alias_attr_dict)):
             if WLST_NAME in alias_attr_dict:
@@ -481,22 +506,7 @@ class Aliases(object):
         :return: list[string]: the list of attribute names
         :raises: AliasException: if an error occurs due to a bad location or bad alias data
         """
-        _method_name = 'get_wlst_get_required_attribute_names'
-
-        wlst_attribute_names = []
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_METHOD in value and value[GET_METHOD] == GET:
-                wlst_attribute_names.append(value[WLST_NAME])
-
-        return wlst_attribute_names
+        return list(self.get_folder_descriptor(location).get_wlst_get_required_attribute_names())
 
     def get_wlst_lsa_required_attribute_names(self, location):
         """
@@ -638,6 +648,31 @@ class Aliases(object):
     #                  Model attribute-related methods                        #
     ###########################################################################
 
+    def get_folder_descriptor(self, location):
+        """
+        Get the descriptor with the attribute information for the folder type at the specified location.
+        The descriptor is shared by all instances of the folder type, regardless of the location name tokens.
+        :param location: the location
+        :return: the FolderDescriptor for the folder type
+        :raises: AliasException: if an error occurs
+        """
+        _method_name = 'get_folder_descriptor'
+
+        cache_key = self.__get_query_cache_key(_method_name, location)
+        result = self._query_cache.get(cache_key)
+        if result is None:
+            module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
+            if ATTRIBUTES not in module_folder:
+                ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
+                self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
+                raise ex
+
+            subfolder_names = self._alias_entries.get_model_subfolder_names_for_location(location)
+            result = FolderDescriptor('/'.join(location.get_model_folders()), module_folder[ATTRIBUTES],
+                                      subfolder_names, dictionary_utils.get_element(module_folder, WLST_SKIP_NAMES))
+            self._query_cache.put(cache_key, result)
+        return result
+
     def get_model_password_type_attribute_names(self, location):
         """
         Get the attributes in the current location whose types are passwords.
@@ -645,19 +680,7 @@ class Aliases(object):
         :return: list of the attribute names
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_password_type_attribute_names'
-
-        password_attribute_names = []
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if WLST_TYPE in value and value[WLST_TYPE] == 'password':
-                password_attribute_names.append(key)
-        return password_attribute_names
+        return list(self.get_folder_descriptor(location).get_password_type_attribute_names())
 
     def get_model_restart_required_attribute_names(self, location):
         """
@@ -665,24 +688,7 @@ class Aliases(object):
         :return: list[string] Model attribute names at specified location
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_restart_required_attribute_names'
-
-        restart_attribute_names = []
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if RESTART_REQUIRED in value:
-                restart_required_value = value[RESTART_REQUIRED]
-                if "true" == restart_required_value.lower():
-                    restart_attribute_names.append(key)
-
-        return restart_attribute_names
+        return list(self.get_folder_descriptor(location).get_restart_required_attribute_names())
 
     def get_model_get_required_attribute_names(self, location):
         """
@@ -714,21 +720,7 @@ class Aliases(object):
         :return: the list of attribute names
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_lsa_required_attribute_names'
-
-        lsa_required_attribute_names = []
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_METHOD in value and LSA in value[GET_METHOD]:
-                lsa_required_attribute_names.append(key)
-
-        return lsa_required_attribute_names
+        return list(self.get_folder_descriptor(location).get_lsa_required_attribute_names())
 
     def get_model_get_returns_mbean_attribute_names_and_types(self, location):
         """
@@ -762,34 +754,7 @@ class Aliases(object):
         :return: a dictionary keyed by model attribute names with the set_method and set_mbean_type fields set
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_mbean_set_method_attribute_names_and_types'
-
-        model_attributes_dict = dict()
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if SET_METHOD in value and value[SET_METHOD].startswith(MBEAN):
-                attr_dict = dict()
-
-                attr_set_method_name = None
-                set_method_value_components = value[SET_METHOD].split('.')
-                if len(set_method_value_components) == 2:
-                    attr_set_method_name = set_method_value_components[1]
-
-                attr_dict[SET_METHOD] = attr_set_method_name
-                if SET_MBEAN_TYPE in value:
-                    attr_dict[SET_MBEAN_TYPE] = value[SET_MBEAN_TYPE]
-                else:
-                    attr_dict[SET_MBEAN_TYPE] = None
-
-                model_attributes_dict[key] = attr_dict
-
-        return model_attributes_dict
+        return dict(self.get_folder_descriptor(location).get_mbean_set_method_map())
 
     def get_model_merge_required_attribute_names(self, location):
         """
@@ -798,25 +763,7 @@ class Aliases(object):
         :return: a list of the model attribute names
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_merge_required_attribute_names'
-
-        model_attribute_names = list()
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if WLST_TYPE in value and (value[WLST_TYPE] in ALIAS_LIST_TYPES or value[WLST_TYPE] in ALIAS_MAP_TYPES):
-                merge = True
-                if MERGE in value:
-                    merge = alias_utils.convert_boolean(value[MERGE])
-                if merge:
-                    model_attribute_names.append(key)
-
-        return model_attribute_names
+        return list(self.get_folder_descriptor(location).get_merge_required_attribute_names())
 
     def get_model_password_attribute_names(self, location):
         """
@@ -847,21 +794,7 @@ class Aliases(object):
         :return: a list of the model attribute names
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_uses_path_tokens_attribute_names'
-
-        model_attribute_names = list()
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if USES_PATH_TOKENS in value and alias_utils.convert_boolean(value[USES_PATH_TOKENS]):
-                model_attribute_names.append(key)
-
-        return model_attribute_names
+        return list(self.get_folder_descriptor(location).get_uses_path_tokens_attribute_names())
 
     def get_model_attribute_name_and_value(self, location, wlst_attribute_name, wlst_attribute_value):
         """
@@ -883,7 +816,7 @@ class Aliases(object):
         # Assume wlst_attribute_value is the same as default value of model_attribute_name
         model_attribute_value = None
 
-        attribute_info = self._alias_entries.get_alias_attribute_entry_by_wlst_name(location, wlst_attribute_name)
+        attribute_info = self.__get_attribute_entry_by_wlst_name(location, wlst_attribute_name)
         if attribute_info is not None and not self.__is_model_attribute_read_only(location, attribute_info):
             data_type, preferred_type, delimiter = \
                 alias_utils.compute_read_data_type_for_wlst_and_delimiter_from_attribute_info(attribute_info,
@@ -954,7 +887,7 @@ class Aliases(object):
                               class_name=self._class_name, method_name=_method_name)
         model_attribute_name = None
 
-        attribute_info = self._alias_entries.get_alias_attribute_entry_by_wlst_name(location, wlst_attribute_name)
+        attribute_info = self.__get_attribute_entry_by_wlst_name(location, wlst_attribute_name)
         if attribute_info is not None and \
                 (not check_read_only or not self.__is_model_attribute_read_only(location, attribute_info)):
             model_attribute_name = attribute_info[MODEL_NAME]
@@ -973,8 +906,7 @@ class Aliases(object):
         _method_name = 'get_model_attribute_names'
 
         self._logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
-        attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
-        result = list(attributes_dict.keys())
+        result = self.get_folder_descriptor(location).get_attribute_names()
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
         return result
 
@@ -988,16 +920,7 @@ class Aliases(object):
         _method_name = 'get_model_attribute_names_and_types'
 
         self._logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
-        result = {}
-        attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
-        for key, value in attributes_dict.iteritems():
-            if PREFERRED_MODEL_TYPE in value:
-                result[key] = value[PREFERRED_MODEL_TYPE]
-            elif WLST_TYPE in value:
-                result[key] = value[WLST_TYPE]
-            else:
-                result[key] = None
-
+        result = dict(self.get_folder_descriptor(location).get_attribute_types())
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
         return result
 
@@ -1010,19 +933,22 @@ class Aliases(object):
 
     def attribute_values_are_equal(self, location, model_attribute_name, model_attribute_value, wlst_attribute_value):
         """
-        Returns whether or not the model and WLST values for a given model attribute,
-        should be considered equal.
+        Returns whether or not the model and WLST values for a given model attribute should be considered equal,
+        so that setting the model value in WLST would not change the attribute.  The WLST value is converted to the
+        model type before it is compared.  Password and properties values are never considered equal, since they
+        cannot be compared reliably.
 
-        :param location:
-        :param model_attribute_name:
-        :param model_attribute_value:
-        :param wlst_attribute_value:
-        :return: boolean
+        :param location: the location
+        :param model_attribute_name: the model attribute name
+        :param model_attribute_value: the model attribute value
+        :param wlst_attribute_value: the current WLST attribute value
+        :return: True if the values are equal, False otherwise
         :raises: AliasException: if an error occurs
         """
-
         _method_name = 'attribute_values_are_equal'
 
+        self._logger.entering(str(location), model_attribute_name,
+                              class_name=self._class_name, method_name=_method_name)
         result = False
 
         module_folder = self._alias_entries.get_dictionary_for_location(location)
@@ -1032,13 +958,39 @@ class Aliases(object):
             self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
 
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if key == model_attribute_name:
-                attribute_info = module_folder[ATTRIBUTES][key]
-                if attribute_info and VALUE in attribute_info and DEFAULT in attribute_info[VALUE]:
-                    result = (model_attribute_value == wlst_attribute_value and
-                              model_attribute_value == attribute_info[VALUE][DEFAULT])
+        attribute_info = dictionary_utils.get_element(module_folder[ATTRIBUTES], model_attribute_name)
+        if attribute_info is not None and model_attribute_value is not None and wlst_attribute_value is not None:
+            data_type, preferred_type, delimiter = \
+                alias_utils.compute_read_data_type_for_wlst_and_delimiter_from_attribute_info(attribute_info,
+                                                                                              wlst_attribute_value)
+            model_type = data_type
+            if preferred_type:
+                model_type = preferred_type
+
+            if PASSWORD not in (data_type, model_type) and model_type not in ALIAS_MAP_TYPES and \
+                    data_type not in ALIAS_MAP_TYPES:
+                if self._model_context and USES_PATH_TOKENS in attribute_info and \
+                        isinstance(model_attribute_value, str):
+                    model_attribute_value = self._model_context.replace_token_string(model_attribute_value)
+                try:
+                    converted_value = alias_utils.convert_to_model_type(model_type, wlst_attribute_value,
+                                                                        delimiter=delimiter)
+                    if model_type in ALIAS_LIST_TYPES:
+                        model_list = _get_list_elements(model_type, model_attribute_value)
+                        result = model_list is not None and model_list == _get_list_elements(model_type,
+                                                                                             converted_value)
+                    elif model_type in (BOOLEAN, JAVA_LANG_BOOLEAN):
+                        result = alias_utils.convert_boolean(model_attribute_value) == \
+                            alias_utils.convert_boolean(converted_value)
+                    else:
+                        result = str(model_attribute_value) == str(converted_value)
+                except AliasException, ae:
+                    self._logger.finer('WLSDPLY-08411', model_attribute_name, location.get_folder_path(),
+                                       ae.getLocalizedMessage(), class_name=self._class_name,
+                                       method_name=_method_name)
+                    result = False
 
+        self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
         return result
 
     def is_valid_model_attribute_name(self, location, model_attribute_name):
@@ -1096,7 +1048,7 @@ class Aliases(object):
         self._logger.entering(str(location), model_attribute_name,
                               class_name=self._class_name, method_name=_method_name)
         default_value = None
-        attribute_info = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
+        attribute_info = self.get_folder_descriptor(location).get_attribute_entry(model_attribute_name)
         if attribute_info is not None:
             default_value = attribute_info[VALUE][DEFAULT]
             if default_value == 'None':
@@ -1117,7 +1069,7 @@ class Aliases(object):
         :return:
         """
         wlst_type = None
-        attribute_info = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
+        attribute_info = self.get_folder_descriptor(location).get_attribute_entry(model_attribute_name)
         if attribute_info is not None:
             wlst_type = attribute_info[WLST_TYPE]
         return wlst_type
@@ -1136,6 +1088,16 @@ class Aliases(object):
     #
     ####################################################################################
 
+    def __get_query_cache_key(self, query_name, location):
+        """
+        Get the query cache key for the specified query and location.  The per-folder query results do not
+        depend on the name tokens of the location, so all instances of a folder type share the same key.
+        :param query_name: the name of the query
+        :param location: the location
+        :return: the cache key
+        """
+        return query_name, '/'.join(location.get_model_folders()), self._wls_version, self._wlst_mode
+
     def __decrypt_password(self, text):
         """
         Internal method to determine if the provided password text needs to be decrypted
@@ -1156,6 +1118,28 @@ class Aliases(object):
 
         return rtnval
 
+    def __get_attribute_entry_by_wlst_name(self, location, wlst_attribute_name):
+        """
+        Get the alias entry for the WLST attribute name from the folder descriptor indexes.
+        :param location: the location
+        :param wlst_attribute_name: the WLST attribute name
+        :return: the shared alias entry, or None if the attribute is skipped or is not mapped to the model
+        :raises: AliasException: if the attribute is not in the folder
+        """
+        _method_name = '__get_attribute_entry_by_wlst_name'
+
+        folder_descriptor = self.get_folder_descriptor(location)
+        if folder_descriptor.is_wlst_attribute_skipped(wlst_attribute_name):
+            return None
+
+        result = folder_descriptor.get_attribute_entry_by_wlst_name(wlst_attribute_name)
+        if result is None and wlst_attribute_name not in AliasEntries.IGNORE_FOR_MODEL_LIST:
+            ex = exception_helper.create_alias_exception('WLSDPLY-08111', location.get_folder_path(),
+                                                         wlst_attribute_name)
+            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
+            raise ex
+        return result
+
     def __is_model_attribute_read_only(self, location, attribute_info):
         """
         Is the model attribute read-only?
@@ -1174,6 +1158,34 @@ class Aliases(object):
         return rtnval
 
 
+def _get_list_elements(data_type, value):
+    """
+    Get the elements of a list attribute value as a list of strings, so that model and WLST values can be compared.
+    :param data_type: the list data type of the attribute
+    :param value: the value, either a delimited string or a list
+    :return: the list of string elements, or None if the value is not a list or string
+    """
+    if value is None:
+        return []
+
+    if isinstance(value, str):
+        delimiter = alias_utils.compute_delimiter_from_data_type(data_type, value)
+        if delimiter is None or delimiter == PREFERRED_MODEL_TYPE:
+            delimiter = MODEL_LIST_DELIMITER
+        elements = value.split(delimiter)
+    elif isinstance(value, (list, tuple)) or hasattr(value, '__len__'):
+        elements = value
+    else:
+        return None
+
+    result = []
+    for element in elements:
+        element = str(element).strip()
+        if len(element) > 0:
+            result.append(element)
+    return result
+
+
 def _strings_are_empty(converted_value, default_value):
     """
     Test converted and default values to see if they are both either None or an empty string
@@ -0,0 +1,235 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+from wlsdeploy.aliases import alias_utils
+
+from wlsdeploy.aliases.alias_constants import ALIAS_LIST_TYPES
+from wlsdeploy.aliases.alias_constants import ALIAS_MAP_TYPES
+from wlsdeploy.aliases.alias_constants import GET
+from wlsdeploy.aliases.alias_constants import GET_METHOD
+from wlsdeploy.aliases.alias_constants import LSA
+from wlsdeploy.aliases.alias_constants import MBEAN
+from wlsdeploy.aliases.alias_constants import MERGE
+from wlsdeploy.aliases.alias_constants import PASSWORD
+from wlsdeploy.aliases.alias_constants import PREFERRED_MODEL_TYPE
+from wlsdeploy.aliases.alias_constants import RESTART_REQUIRED
+from wlsdeploy.aliases.alias_constants import SET_MBEAN_TYPE
+from wlsdeploy.aliases.alias_constants import SET_METHOD
+from wlsdeploy.aliases.alias_constants import USES_PATH_TOKENS
+from wlsdeploy.aliases.alias_constants import WLST_NAME
+from wlsdeploy.aliases.alias_constants import WLST_TYPE
+
+
+class FolderDescriptor(object):
+    """
+    The attribute information for a model folder type, computed once from the alias entries for the folder.
+    The information does not depend on the name tokens of a location, so one descriptor is shared by all
+    instances of the folder type.  The lists and dictionaries returned by a descriptor are shared and must
+    not be modified by the caller.
+    """
+
+    def __init__(self, model_folder_path, attributes_dict, subfolder_names, wlst_skip_names=None):
+        """
+        Create the descriptor.
+        :param model_folder_path: the model folder path of the folder type, without name tokens
+        :param attributes_dict: the alias attributes dictionary for the folder, keyed by model attribute name
+        :param subfolder_names: the model subfolder names of the folder
+        :param wlst_skip_names: the dictionary keyed by the WLST attribute names that are not mapped to the model
+        """
+        self._model_folder_path = model_folder_path
+        self._subfolder_names = subfolder_names
+        self._model_entries = attributes_dict
+        self._wlst_entries = dict()
+        self._wlst_skip_names = wlst_skip_names
+        if self._wlst_skip_names is None:
+            self._wlst_skip_names = dict()
+        self._attribute_types = dict()
+        self._model_to_wlst_names = dict()
+        self._wlst_to_model_names = dict()
+        self._uses_path_tokens_attribute_names = list()
+        self._restart_required_attribute_names = list()
+        self._merge_required_attribute_names = list()
+        self._lsa_required_attribute_names = list()
+        self._password_type_attribute_names = list()
+        self._wlst_get_required_attribute_names = list()
+        self._mbean_set_method_map = dict()
+
+        for key, value in attributes_dict.iteritems():
+            wlst_name = value[WLST_NAME]
+            self._model_to_wlst_names[key] = wlst_name
+            self._wlst_to_model_names[wlst_name] = key
+            self._wlst_entries[wlst_name] = value
+
+            if PREFERRED_MODEL_TYPE in value:
+                self._attribute_types[key] = value[PREFERRED_MODEL_TYPE]
+            elif WLST_TYPE in value:
+                self._attribute_types[key] = value[WLST_TYPE]
+            else:
+                self._attribute_types[key] = None
+
+            if USES_PATH_TOKENS in value and alias_utils.convert_boolean(value[USES_PATH_TOKENS]):
+                self._uses_path_tokens_attribute_names.append(key)
+
+            if RESTART_REQUIRED in value and 'true' == value[RESTART_REQUIRED].lower():
+                self._restart_required_attribute_names.append(key)
+
+            if WLST_TYPE in value and (value[WLST_TYPE] in ALIAS_LIST_TYPES or value[WLST_TYPE] in ALIAS_MAP_TYPES):
+                merge = True
+                if MERGE in value:
+                    merge = alias_utils.convert_boolean(value[MERGE])
+                if merge:
+                    self._merge_required_attribute_names.append(key)
+
+            if WLST_TYPE in value and value[WLST_TYPE] == PASSWORD:
+                self._password_type_attribute_names.append(key)
+
+            if GET_METHOD in value:
+                if LSA in value[GET_METHOD]:
+                    self._lsa_required_attribute_names.append(key)
+                if value[GET_METHOD] == GET:
+                    self._wlst_get_required_attribute_names.append(wlst_name)
+
+            if SET_METHOD in value and value[SET_METHOD].startswith(MBEAN):
+                self._mbean_set_method_map[key] = _get_set_method_info(value)
+        return
+
+    def get_model_folder_path(self):
+        """
+        Get the model folder path of the folder type, without name tokens.
+        :return: the model folder path
+        """
+        return self._model_folder_path
+
+    def get_subfolder_names(self):
+        """
+        Get the model subfolder names.
+        :return: the list of model subfolder names
+        """
+        return self._subfolder_names
+
+    def get_attribute_names(self):
+        """
+        Get the model attribute names.
+        :return: the list of model attribute names
+        """
+        return self._attribute_types.keys()
+
+    def get_attribute_types(self):
+        """
+        Get the model attribute names and their model types.  Use this dictionary for fast membership checks.
+        :return: a dictionary keyed on model attribute names with the type as the value
+        """
+        return self._attribute_types
+
+    def get_model_to_wlst_name_map(self):
+        """
+        Get the WLST attribute name for each model attribute name.
+        :return: a dictionary keyed on model attribute names with the WLST attribute name as the value
+        """
+        return self._model_to_wlst_names
+
+    def get_wlst_to_model_name_map(self):
+        """
+        Get the model attribute name for each WLST attribute name.
+        :return: a dictionary keyed on WLST attribute names with the model attribute name as the value
+        """
+        return self._wlst_to_model_names
+
+    def get_attribute_entry(self, model_name):
+        """
+        Get the alias entry for the model attribute name.  The entry is shared and must not be modified.
+        :param model_name: the model attribute name
+        :return: the alias entry, or None if the attribute is not in the folder
+        """
+        if model_name in self._model_entries:
+            return self._model_entries[model_name]
+        return None
+
+    def get_attribute_entry_by_wlst_name(self, wlst_name):
+        """
+        Get the alias entry for the WLST attribute name.  The entry is shared and must not be modified.
+        :param wlst_name: the WLST attribute name
+        :return: the alias entry, or None if the attribute is not in the folder
+        """
+        if wlst_name in self._wlst_entries:
+            return self._wlst_entries[wlst_name]
+        return None
+
+    def is_wlst_attribute_skipped(self, wlst_name):
+        """
+        Is the WLST attribute one that is not mapped to the model, such as the encrypted
+        counterpart of a dual-password attribute?
+        :param wlst_name: the WLST attribute name
+        :return: True if the attribute should be skipped, False otherwise
+        """
+        return wlst_name in self._wlst_skip_names
+
+    def get_uses_path_tokens_attribute_names(self):
+        """
+        Get the model attribute names whose values are file system paths.
+        :return: the list of model attribute names
+        """
+        return self._uses_path_tokens_attribute_names
+
+    def get_restart_required_attribute_names(self):
+        """
+        Get the model attribute names that require a restart when changed.
+        :return: the list of model attribute names
+        """
+        return self._restart_required_attribute_names
+
+    def get_merge_required_attribute_names(self):
+        """
+        Get the model attribute names where merging the new and old values is required.
+        :return: the list of model attribute names
+        """
+        return self._merge_required_attribute_names
+
+    def get_lsa_required_attribute_names(self):
+        """
+        Get the model attribute names that require the use of LSA to get the accurate value from WLST.
+        :return: the list of model attribute names
+        """
+        return self._lsa_required_attribute_names
+
+    def get_password_type_attribute_names(self):
+        """
+        Get the model attribute names whose types are passwords.
+        :return: the list of model attribute names
+        """
+        return self._password_type_attribute_names
+
+    def get_wlst_get_required_attribute_names(self):
+        """
+        Get the WLST attribute names that have their get_method specified as GET.
+        :return: the list of WLST attribute names
+        """
+        return self._wlst_get_required_attribute_names
+
+    def get_mbean_set_method_map(self):
+        """
+        Get the model attribute names where the set method requires an MBean.
+        :return: a dictionary keyed by model attribute names with the set_method and set_mbean_type fields set
+        """
+        return self._mbean_set_method_map
+
+
+def _get_set_method_info(attribute_dict):
+    """
+    Get the set method name and MBean type for an attribute with an MBean set method.
+    :param attribute_dict: the alias entry for the attribute
+    :return: a dictionary with the set_method and set_mbean_type fields set
+    """
+    attr_set_method_name = None
+    set_method_value_components = attribute_dict[SET_METHOD].split('.')
+    if len(set_method_value_components) == 2:
+        attr_set_method_name = set_method_value_components[1]
+
+    result = dict()
+    result[SET_METHOD] = attr_set_method_name
+    if SET_MBEAN_TYPE in attribute_dict:
+        result[SET_MBEAN_TYPE] = attribute_dict[SET_MBEAN_TYPE]
+    else:
+        result[SET_MBEAN_TYPE] = None
+    return result
@@ -69,21 +69,57 @@ class Creator(object):
         create_path = self.alias_helper.get_wlst_create_path(location)
         list_path = self.alias_helper.get_wlst_list_path(location)
         existing_folder_names = self._get_existing_folders(list_path)
+
+        # plan the MBeans up front from the single listing, so that the missing ones are created together
+        # from the create path before each MBean is visited once to process its child nodes.
+        planned_mbeans = []
         for model_name in model_nodes:
             name = self.wlst_helper.get_quoted_name_for_wlst(model_name)
 
+            mbean_location = LocationContext(location)
             if token_name is not None:
-                location.add_name_token(token_name, name)
+                mbean_location.add_name_token(token_name, name)
+
+            wlst_type, wlst_name = self.alias_helper.get_wlst_mbean_type_and_name(mbean_location)
+            is_new = wlst_name not in existing_folder_names
+            planned_mbeans.append((name, mbean_location, wlst_type, wlst_name, is_new))
+
+        self._create_planned_mbeans(type_name, planned_mbeans, create_path, log_created)
 
-            wlst_type, wlst_name = self.alias_helper.get_wlst_mbean_type_and_name(location)
-            if wlst_name not in existing_folder_names:
+        for name, mbean_location, wlst_type, wlst_name, is_new in planned_mbeans:
+            attribute_path = self.alias_helper.get_wlst_attributes_path(mbean_location)
+            self.wlst_helper.cd(attribute_path)
+
+            child_nodes = dictionary_utils.get_dictionary_element(model_nodes, name)
+            self._process_child_nodes(mbean_location, child_nodes)
+
+        self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
+        return
+
+    def _create_planned_mbeans(self, type_name, planned_mbeans, create_path, log_created):
+        """
+        Create the planned MBeans that do not exist, with a single change to the create path.
+        :param type_name: the model folder type
+        :param planned_mbeans: the list of (name, location, WLST type, WLST name, is new) tuples for the MBeans
+        :param create_path: the WLST path from which to create the MBeans
+        :param log_created: whether or not to log created at INFO level, by default it is logged at the FINE level
+        :raises: CreateException: if an error occurs
+        """
+        _method_name = '_create_planned_mbeans'
+
+        create_path_current = False
+        for name, mbean_location, wlst_type, wlst_name, is_new in planned_mbeans:
+            if is_new:
                 if log_created:
                     self.logger.info('WLSDPLY-12100', type_name, name,
                                      class_name=self.__class_name, method_name=_method_name)
                 else:
                     self.logger.fine('WLSDPLY-12100', type_name, name,
                                      class_name=self.__class_name, method_name=_method_name)
-                self.wlst_helper.create_and_cd(self.alias_helper, wlst_type, wlst_name, location, create_path)
+                if not create_path_current:
+                    self.wlst_helper.cd(create_path)
+                    create_path_current = True
+                self.wlst_helper.create(wlst_name, wlst_type)
             else:
                 if log_created:
                     self.logger.info('WLSDPLY-12101', type_name, name,
@@ -91,14 +127,6 @@ class Creator(object):
                 else:
                     self.logger.fine('WLSDPLY-12101', type_name, name,
                                      class_name=self.__class_name, method_name=_method_name)
-
-                attribute_path = self.alias_helper.get_wlst_attributes_path(location)
-                self.wlst_helper.cd(attribute_path)
-
-            child_nodes = dictionary_utils.get_dictionary_element(model_nodes, name)
-            self._process_child_nodes(location, child_nodes)
-
-        self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
         return
 
     def _create_mbean(self, type_name, model_nodes, base_location, log_created=False):
@@ -225,7 +253,8 @@ class Creator(object):
         _method_name = '_process_child_nodes'
 
         self.logger.finest('WLSDPLY-12111', self.alias_helper.get_model_folder_path(location),
-                           self.wlst_helper.get_pwd(), class_name=self.__class_name, method_name=_method_name)
+                           self.wlst_helper.get_current_path(), class_name=self.__class_name,
+                           method_name=_method_name)
         self._set_attributes(location, model_nodes)
         self._create_subfolders(location, model_nodes)
 
@@ -238,12 +267,13 @@ class Creator(object):
         """
         _method_name = '_set_attributes'
 
-        model_attribute_names = self.alias_helper.get_model_attribute_names_and_types(location)
-        password_attribute_names = self.alias_helper.get_model_password_type_attribute_names(location)
-        set_method_map = self.alias_helper.get_model_mbean_set_method_attribute_names_and_types(location)
-        uses_path_tokens_attribute_names = self.alias_helper.get_model_uses_path_tokens_attribute_names(location)
+        folder_descriptor = self.alias_helper.get_folder_descriptor(location)
+        model_attribute_names = folder_descriptor.get_attribute_types()
+        password_attribute_names = folder_descriptor.get_password_type_attribute_names()
+        set_method_map = folder_descriptor.get_mbean_set_method_map()
+        uses_path_tokens_attribute_names = folder_descriptor.get_uses_path_tokens_attribute_names()
         model_folder_path = self.alias_helper.get_model_folder_path(location)
-        pwd = self.wlst_helper.get_pwd()
+        pwd = self.wlst_helper.get_current_path()
 
         for key, value in model_nodes.iteritems():
             if key in model_attribute_names:
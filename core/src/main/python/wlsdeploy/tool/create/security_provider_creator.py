@@ -180,7 +180,8 @@ class SecurityProviderCreator(Creator):
             self.wlst_helper.cd(attribute_path)
 
             self.logger.finest('WLSDPLY-12111', self.alias_helper.get_model_folder_path(prov_location),
-                               self.wlst_helper.get_pwd(), class_name=self.__class_name, method_name=_method_name)
+                               self.wlst_helper.get_current_path(), class_name=self.__class_name,
+                               method_name=_method_name)
             self._set_attributes(prov_location, child_nodes)
             self._create_subfolders(prov_location, child_nodes)
 
@@ -203,7 +204,8 @@ class SecurityProviderCreator(Creator):
         model_type, model_name = self.alias_helper.get_model_type_and_name(location)
         if model_type in [SECURITY_CONFIGURATION, REALM]:
             self.logger.finest('WLSDPLY-12143', self.alias_helper.get_model_folder_path(location),
-                               self.wlst_helper.get_pwd(), class_name=self.__class_name, method_name=_method_name)
+                               self.wlst_helper.get_current_path(), class_name=self.__class_name,
+                               method_name=_method_name)
 
             self._create_subfolders(location, model_nodes)
             self.wlst_helper.cd(self.alias_helper.get_wlst_attributes_path(location))
@@ -4,15 +4,19 @@ The Universal Permissive License (UPL), Version 1.0
 """
 import copy
 import javaos as os
+import threading
 from java.io import ByteArrayOutputStream
 from java.io import File
 from java.io import FileNotFoundException
 from java.io import IOException
 from java.lang import IllegalStateException
+from java.lang import System
+from java.lang import Thread
 from java.security import NoSuchAlgorithmException
 from java.util.jar import JarFile
 from java.util.zip import ZipException
 from sets import Set
+from oracle.weblogic.deploy.deploy import DeployException
 from wlsdeploy.aliases.location_context import LocationContext
 from wlsdeploy.aliases.model_constants import ABSOLUTE_SOURCE_PATH
 from wlsdeploy.aliases.model_constants import APPLICATION
@@ -35,10 +39,22 @@ from wlsdeploy.tool.deploy import deployer_utils
 from wlsdeploy.tool.deploy.deployer import Deployer
 from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util import string_utils
+from wlsdeploy.util import task_executor
+from wlsdeploy.util.task_executor import TaskExecutor
 
 import oracle.weblogic.deploy.util.FileUtils as FileUtils
+import oracle.weblogic.deploy.util.HashCache as HashCache
 import oracle.weblogic.deploy.util.PyOrderedDict as OrderedDict
 
+# the maximum number of applications or libraries with the same deployment order that are deployed at the same time
+DEPLOY_PARALLELISM_ENV_VARIABLE = 'WLSDEPLOY_DEPLOY_PARALLELISM'
+# the number of milliseconds that a deployment, start or stop operation may run before it is reported as failed
+DEPLOY_TIMEOUT_ENV_VARIABLE = 'WLSDEPLOY_DEPLOY_TIMEOUT'
+# the first and the longest number of milliseconds to wait between checks of the running operations
+_PROGRESS_POLL_MIN_MILLIS = 100
+_PROGRESS_POLL_MAX_MILLIS = 2000
+# the number of threads used to hash the application and library files when computing the deployment strategy
+HASH_THREADS_ENV_VARIABLE = 'WLSDEPLOY_HASH_THREADS'
 
 class ApplicationsDeployer(Deployer):
     """
@@ -220,15 +236,25 @@ class ApplicationsDeployer(Deployer):
         update_library_list = list()
 
         lib_location = LocationContext(base_location).append_location(LIBRARY)
+        app_location = LocationContext(base_location).append_location(APPLICATION)
+        self.__replace_path_tokens(LIBRARY, lib_location, model_shared_libraries)
+        self.__replace_path_tokens(APPLICATION, app_location, model_applications)
+
+        # Hash all the model and existing files that are compared, concurrently, before computing the strategies.
+        hash_paths = self.__get_strategy_hash_paths(model_shared_libraries, model_applications,
+                                                    existing_lib_refs, existing_app_refs)
+        hashes = self.__compute_hashes(hash_paths)
+        _set_ref_hashes(existing_lib_refs, hashes)
+        _set_ref_hashes(existing_app_refs, hashes)
+
         # Go through the model libraries and find existing libraries that are referenced
         # by applications and compute a processing strategy for each library.
-        self.__build_library_deploy_strategy(lib_location, model_shared_libraries, existing_libs, existing_lib_refs,
+        self.__build_library_deploy_strategy(model_shared_libraries, existing_libs, existing_lib_refs, hashes,
                                              stop_app_list, update_library_list)
 
         # Go through the model applications and compute the processing strategy for each application.
-        app_location = LocationContext(base_location).append_location(APPLICATION)
-        self.__build_app_deploy_strategy(app_location, model_applications, existing_apps,
-                                         existing_app_refs, stop_and_undeploy_app_list)
+        self.__build_app_deploy_strategy(model_applications, existing_apps, existing_app_refs, hashes,
+                                         stop_and_undeploy_app_list)
 
         # deployed_app_list is list of apps that has been deployed and stareted again
         # redeploy_app_list is list of apps that needs to be redeplyed
@@ -237,15 +263,14 @@ class ApplicationsDeployer(Deployer):
 
         # shared library updated, app referenced must be stopped, redeployed, and started so stop the app first
         for app in stop_app_list:
-            self.__stop_app(app)
             # add the referenced app to the redeploy list
             redeploy_app_list.append(app)
             # add the referenced app to the start list
             deployed_app_list.append(app)
 
         # app is updated, it must be stopped and undeployed first
+        self.__stop_apps(stop_app_list + stop_and_undeploy_app_list, base_location)
         for app in stop_and_undeploy_app_list:
-            self.__stop_app(app)
             self.__undeploy_app(app)
 
         # library is updated, it must be undeployed first
@@ -389,15 +414,10 @@ class ApplicationsDeployer(Deployer):
                 absolute_sourcepath = attributes_map['AbsoluteSourcePath']
                 absolute_planpath = attributes_map['AbsolutePlanPath']
                 deployment_order = attributes_map['DeploymentOrder']
-                app_hash = self.__get_file_hash(absolute_sourcepath)
-                if absolute_planpath is not None:
-                    plan_hash = self.__get_file_hash(absolute_planpath)
-                else:
-                    plan_hash = None
 
-                _update_ref_dictionary(ref_dictionary, app, absolute_sourcepath, app_hash, None,
-                                       absolute_plan_path=absolute_planpath, deploy_order=deployment_order,
-                                       plan_hash=plan_hash)
+                # the hashes are computed later, only for the applications that are compared to the model
+                _update_ref_dictionary(ref_dictionary, app, absolute_sourcepath, None, None,
+                                       absolute_plan_path=absolute_planpath, deploy_order=deployment_order)
         return ref_dictionary
 
     def __get_library_references(self, base_location):
@@ -439,7 +459,8 @@ class ApplicationsDeployer(Deployer):
                 # TODO(jshum) - Why does the deployment plan not get considered?
                 absolute_source_path = config_attributes[ABSOLUTE_SOURCE_PATH]
                 deployment_order = config_attributes[DEPLOYMENT_ORDER]
-                lib_hash = self.__get_file_hash(absolute_source_path)
+                # the hash is computed later, only for the libraries that are compared to the model
+                lib_hash = None
 
                 if string_utils.to_boolean(runtime_attributes['Referenced']) is True:
                     referenced_path = library_runtime_path + lib + '/ReferencingRuntimes/'
@@ -462,15 +483,116 @@ class ApplicationsDeployer(Deployer):
                     _update_ref_dictionary(existing_libraries, lib, absolute_source_path, lib_hash, config_targets)
         return existing_libraries
 
-    def __build_library_deploy_strategy(self, location, model_libs, existing_libs, existing_lib_refs,
-                                        stop_app_list, update_library_list):
-        if model_libs is not None:
+    def __replace_path_tokens(self, type_name, location, model_dict):
+        """
+        Replace the path tokens in the attributes of the model applications or libraries that use path tokens.
+        :param type_name: the model type name, Application or Library
+        :param location: the location of the applications or libraries
+        :param model_dict: the dictionary of model applications or libraries
+        """
+        if model_dict is not None:
             uses_path_tokens_model_attribute_names = self.__get_uses_path_tokens_attribute_names(location)
-            for lib, lib_dict in model_libs.iteritems():
+            for name, value_dict in model_dict.iteritems():
                 for param in uses_path_tokens_model_attribute_names:
-                    if param in lib_dict:
-                        self.model_context.replace_tokens(LIBRARY, lib, param, lib_dict)
+                    if param in value_dict:
+                        self.model_context.replace_tokens(type_name, name, param, value_dict)
+        return
+
+    def __get_strategy_hash_paths(self, model_libs, model_apps, existing_lib_refs, existing_app_refs):
+        """
+        Get the paths of the model and existing files whose hashes are compared when computing the
+        deployment strategies, without duplicates.
+        :param model_libs: the dictionary of model libraries
+        :param model_apps: the dictionary of model applications
+        :param existing_lib_refs: the existing library references
+        :param existing_app_refs: the existing application references
+        :return: the list of paths
+        """
+        paths = []
+        if model_libs is not None:
+            for lib, lib_dict in model_libs.iteritems():
+                if lib in existing_lib_refs:
+                    model_src_path = dictionary_utils.get_element(lib_dict, SOURCE_PATH)
+                    existing_src_path = dictionary_utils.get_element(existing_lib_refs[lib], 'sourcePath')
+                    # the WebLogic-distributed shared libraries are not hashed
+                    if self.__is_builtin_library_or_app(model_src_path) and existing_src_path == model_src_path:
+                        continue
+                    _add_hash_path(paths, model_src_path)
+                    _add_hash_path(paths, existing_src_path)
+
+        if model_apps is not None:
+            for app, app_dict in model_apps.iteritems():
+                if app in existing_app_refs:
+                    existing_app_ref = existing_app_refs[app]
+                    _add_hash_path(paths, dictionary_utils.get_element(app_dict, SOURCE_PATH))
+                    _add_hash_path(paths, dictionary_utils.get_element(app_dict, PLAN_PATH))
+                    _add_hash_path(paths, dictionary_utils.get_element(existing_app_ref, 'sourcePath'))
+                    _add_hash_path(paths, dictionary_utils.get_element(existing_app_ref, 'planPath'))
+        return paths
+
+    def __compute_hashes(self, paths):
+        """
+        Compute the hashes of the files on a pool of threads.  The archive file is not thread-safe, so the
+        hashes of the archive entries are computed one at a time.
+        :param paths: the list of absolute file paths or paths into the archive
+        :return: a dictionary of path to hash value
+        :raises: DeployException: if an error occurs
+        """
+        _method_name = '__compute_hashes'
+
+        result = dict()
+        if len(paths) == 0:
+            return result
+
+        thread_count = min(self.__get_hash_thread_count(), len(paths))
+        self.logger.fine('WLSDPLY-09338', len(paths), thread_count,
+                         class_name=self._class_name, method_name=_method_name)
+        if thread_count < 2:
+            for path in paths:
+                result[path] = self.__get_hash(path)
+        else:
+            archive_lock = threading.Lock()
+            executor = TaskExecutor(thread_count, 'deploy-hash')
+            try:
+                tasks = []
+                for path in paths:
+                    tasks.append(executor.submit(self.__get_hash, path, archive_lock))
+                hash_values = task_executor.get_results(tasks)
+            finally:
+                executor.shutdown()
+
+            for index in range(len(paths)):
+                result[paths[index]] = hash_values[index]
+
+        # write the new hashes to the hash cache file once, instead of after each hash
+        HashCache.getInstance().flush()
+        return result
+
+    def __get_hash_thread_count(self):
+        """
+        Get the number of threads used to hash the application and library files.
+        :return: the thread count from the environment, or the number of available processors
+        """
+        _method_name = '__get_hash_thread_count'
 
+        default_count = task_executor.get_default_worker_count()
+        thread_count = os.environ.get(HASH_THREADS_ENV_VARIABLE)
+        if thread_count is None:
+            return default_count
+        try:
+            result = int(thread_count)
+        except ValueError:
+            result = 0
+        if result < 1:
+            self.logger.warning('WLSDPLY-09339', thread_count, HASH_THREADS_ENV_VARIABLE, default_count,
+                                class_name=self._class_name, method_name=_method_name)
+            result = default_count
+        return result
+
+    def __build_library_deploy_strategy(self, model_libs, existing_libs, existing_lib_refs, hashes,
+                                        stop_app_list, update_library_list):
+        if model_libs is not None:
+            for lib, lib_dict in model_libs.iteritems():
                 if lib in existing_libs:
                     existing_lib_ref = dictionary_utils.get_dictionary_element(existing_lib_refs, lib)
 
@@ -497,8 +619,8 @@ class ApplicationsDeployer(Deployer):
                         continue
 
                     # user libraries
-                    model_lib_hash = self.__get_hash(model_src_path)
-                    existing_lib_hash = self.__get_file_hash(existing_src_path)
+                    model_lib_hash = _get_hash_value(hashes, model_src_path)
+                    existing_lib_hash = _get_hash_value(hashes, existing_src_path)
                     if model_lib_hash != existing_lib_hash:
                         #
                         # updated library and add referencing apps to the stop list
@@ -524,28 +646,20 @@ class ApplicationsDeployer(Deployer):
                             lib_dict['Target'] = adjusted_targets
         return
 
-    def __build_app_deploy_strategy(self, location, model_apps, existing_apps, existing_app_refs,
+    def __build_app_deploy_strategy(self, model_apps, existing_apps, existing_app_refs, hashes,
                                     stop_and_undeploy_app_list):
         if model_apps is not None:
-            uses_path_tokens_model_attribute_names = self.__get_uses_path_tokens_attribute_names(location)
-
             for app, app_dict in model_apps.iteritems():
-                for param in uses_path_tokens_model_attribute_names:
-                    if param in app_dict:
-                        self.model_context.replace_tokens(APPLICATION, app, param, app_dict)
-
                 if app in existing_apps:
                     existing_app_ref = dictionary_utils.get_dictionary_element(existing_app_refs, app)
                     plan_path = dictionary_utils.get_element(existing_app_ref, 'planPath')
                     src_path = dictionary_utils.get_element(existing_app_ref, 'sourcePath')
 
-                    model_src_hash = \
-                        self.__get_hash(dictionary_utils.get_element(app_dict, SOURCE_PATH))
-                    model_plan_hash = \
-                        self.__get_hash(dictionary_utils.get_element(app_dict, PLAN_PATH))
+                    model_src_hash = _get_hash_value(hashes, dictionary_utils.get_element(app_dict, SOURCE_PATH))
+                    model_plan_hash = _get_hash_value(hashes, dictionary_utils.get_element(app_dict, PLAN_PATH))
 
-                    existing_src_hash = self.__get_file_hash(src_path)
-                    existing_plan_hash = self.__get_file_hash(plan_path)
+                    existing_src_hash = _get_hash_value(hashes, src_path)
+                    existing_plan_hash = _get_hash_value(hashes, plan_path)
                     if model_src_hash == existing_src_hash:
                         if model_plan_hash == existing_plan_hash:
                             self.__remove_app_from_deployment(model_apps, app)
@@ -569,14 +683,14 @@ class ApplicationsDeployer(Deployer):
         _method_name = '__get_file_hash'
 
         try:
-            hash_value = FileUtils.computeHash(filename)
+            hash_value = FileUtils.computeHashCached(filename)
         except (IOException, NoSuchAlgorithmException), e:
             ex = exception_helper.create_deploy_exception('WLSDPLY-09309', filename, e.getLocalizedMessage(), error=e)
             self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
         return hash_value
 
-    def __get_hash(self, path):
+    def __get_hash(self, path, archive_lock=None):
         _method_name = '__get_hash'
 
         if string_utils.is_empty(path):
@@ -584,7 +698,13 @@ class ApplicationsDeployer(Deployer):
         elif os.path.isabs(path):
             hash_value = self.__get_file_hash(path)
         elif deployer_utils.is_path_into_archive(path):
-            hash_value = self.archive_helper.get_file_hash(path)
+            if archive_lock is not None:
+                archive_lock.acquire()
+            try:
+                hash_value = self.archive_helper.get_file_hash(path)
+            finally:
+                if archive_lock is not None:
+                    archive_lock.release()
         else:
             ex = exception_helper.create_deploy_exception('WLSDPLY-09310', path)
             self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
@@ -625,20 +745,80 @@ class ApplicationsDeployer(Deployer):
         model_dict.pop(lib_name)
         return
 
-    def __stop_app(self, application_name, partition_name=None, timeout=None):
+    def __stop_apps(self, application_names, base_location):
+        """
+        Stop the applications in the reverse of their deployment order.  The applications with the same
+        deployment order are stopped concurrently.
+        :param application_names: the names of the applications to stop
+        :param base_location: the base location of the applications
+        :raises: DeployException: if an application fails to stop
+        """
+        _method_name = '__stop_apps'
+
+        if len(application_names) == 0:
+            return
+
+        app_dict = self.__get_existing_deployment_orders(application_names, base_location)
+        tiers = _get_deployment_tiers(app_dict, self.__get_deployment_ordering(app_dict))
+        tiers.reverse()
+        parallelism = self.__get_deploy_parallelism()
+        timeout = self.__get_deploy_timeout()
+        for tier in tiers:
+            deployment_order = app_dict[tier[0]][DEPLOYMENT_ORDER]
+            if len(tier) > 1 and parallelism > 1:
+                self.logger.info('WLSDPLY-09331', len(tier), deployment_order, min(parallelism, len(tier)),
+                                 class_name=self._class_name, method_name=_method_name)
+            running = []
+            failures = []
+            for application_name in tier:
+                self.__wait_for_progress(running, failures, parallelism - 1, timeout)
+                self.__stop_app(application_name, running, failures, timeout=timeout)
+            self.__wait_for_progress(running, failures, 0, timeout)
+            self.__raise_tier_failures('WLSDPLY-09333', failures, tier, deployment_order)
+        return
+
+    def __stop_app(self, application_name, running, failures, partition_name=None, timeout=None):
+        """
+        Begin stopping the application without blocking, and add its progress to the running list.
+        :param application_name: the application name
+        :param running: the list of running operations
+        :param failures: the list of the names of the failed operations
+        :param partition_name: the partition name, or None
+        :param timeout: the timeout in milliseconds, or None
+        """
         _method_name = '__stop_app'
 
         self.logger.info('WLSDPLY-09312', application_name, class_name=self._class_name, method_name=_method_name)
-        progress = self.wlst_helper.stop_application(application_name, partition=partition_name, timeout=timeout)
-        while progress.isRunning():
-            continue
+        try:
+            progress = self.wlst_helper.stop_application(application_name, partition=partition_name,
+                                                         timeout=timeout, block='false')
+            running.append((application_name, progress, _get_deadline(timeout)))
+        except DeployException, de:
+            self.logger.severe('WLSDPLY-09335', application_name, de.getLocalizedMessage(),
+                               class_name=self._class_name, method_name=_method_name)
+            failures.append(application_name)
         return
 
-    def __start_app(self, application_name, partition_name=None):
+    def __start_app(self, application_name, running, failures, partition_name=None, timeout=None):
+        """
+        Begin starting the application without blocking, and add its progress to the running list.
+        :param application_name: the application name
+        :param running: the list of running operations
+        :param failures: the list of the names of the failed operations
+        :param partition_name: the partition name, or None
+        :param timeout: the timeout in milliseconds, or None
+        """
         _method_name = '__start_app'
 
         self.logger.info('WLSDPLY-09313', application_name, class_name=self._class_name, method_name=_method_name)
-        self.wlst_helper.start_application(application_name, partition=partition_name)
+        try:
+            progress = self.wlst_helper.start_application(application_name, partition=partition_name,
+                                                          timeout=timeout, block='false')
+            running.append((application_name, progress, _get_deadline(timeout)))
+        except DeployException, de:
+            self.logger.severe('WLSDPLY-09335', application_name, de.getLocalizedMessage(),
+                               class_name=self._class_name, method_name=_method_name)
+            failures.append(application_name)
         return
 
     def __undeploy_app(self, application_name, library_module='false', partition_name=None,
@@ -661,52 +841,66 @@ class ApplicationsDeployer(Deployer):
         if model_libs is not None and len(model_libs) > 0:
             uses_path_tokens_attribute_names = self.__get_uses_path_tokens_attribute_names(lib_location)
             deploy_ordered_keys = self.__get_deployment_ordering(model_libs)
+            parallelism = self.__get_deploy_parallelism()
             location = LocationContext(lib_location)
             token_name = self.alias_helper.get_name_token(location)
-            for lib_name in deploy_ordered_keys:
-                lib_dict = model_libs[lib_name]
-                src_path = dictionary_utils.get_element(lib_dict, SOURCE_PATH)
-                plan_file = dictionary_utils.get_element(lib_dict, PLAN_PATH)
-                targets = dictionary_utils.get_element(lib_dict, TARGET)
-                options = _get_deploy_options(model_libs, lib_name, library_module='true')
-                for uses_path_tokens_attribute_name in uses_path_tokens_attribute_names:
-                    if uses_path_tokens_attribute_name in lib_dict:
-                        self.__extract_file_from_archive(lib_dict[uses_path_tokens_attribute_name])
-
-                location.add_name_token(token_name, lib_name)
-                resource_group_template_name, resource_group_name, partition_name = \
-                    self.__get_mt_names_from_location(location)
-                self.__deploy_app_online(lib_name, src_path, targets, plan=plan_file,
-                                         partition=partition_name, resource_group=resource_group_name,
-                                         resource_group_template=resource_group_template_name, options=options)
-                location.remove_name_token(token_name)
+            for tier in _get_deployment_tiers(model_libs, deploy_ordered_keys):
+                deployments = []
+                for lib_name in tier:
+                    lib_dict = model_libs[lib_name]
+                    src_path = dictionary_utils.get_element(lib_dict, SOURCE_PATH)
+                    plan_file = dictionary_utils.get_element(lib_dict, PLAN_PATH)
+                    targets = dictionary_utils.get_element(lib_dict, TARGET)
+                    options = _get_deploy_options(model_libs, lib_name, library_module='true')
+                    for uses_path_tokens_attribute_name in uses_path_tokens_attribute_names:
+                        if uses_path_tokens_attribute_name in lib_dict:
+                            self.__extract_file_from_archive(lib_dict[uses_path_tokens_attribute_name])
+
+                    location.add_name_token(token_name, lib_name)
+                    resource_group_template_name, resource_group_name, partition_name = \
+                        self.__get_mt_names_from_location(location)
+                    deployments.append(self.__get_deploy_arguments(lib_name, src_path, targets, plan=plan_file,
+                                                                   partition=partition_name,
+                                                                   resource_group=resource_group_name,
+                                                                   resource_group_template=resource_group_template_name,
+                                                                   options=options))
+                    location.remove_name_token(token_name)
+
+                deployment_order = dictionary_utils.get_element(model_libs[tier[0]], DEPLOYMENT_ORDER)
+                self.__deploy_tier_online(deployments, deployment_order, parallelism)
         return
 
     def __deploy_model_applications(self, model_apps, app_location, deployed_applist):
         if model_apps is not None:
             uses_path_tokens_attribute_names = self.__get_uses_path_tokens_attribute_names(app_location)
             deploy_ordered_keys = self.__get_deployment_ordering(model_apps)
+            parallelism = self.__get_deploy_parallelism()
             location = LocationContext(app_location)
             token_name = self.alias_helper.get_name_token(location)
-            for app_name in deploy_ordered_keys:
-                app_dict = model_apps[app_name]
-                src_path = dictionary_utils.get_element(app_dict, SOURCE_PATH)
-                plan_file = dictionary_utils.get_element(app_dict, PLAN_PATH)
-                targets = dictionary_utils.get_element(app_dict, TARGET)
-                options = _get_deploy_options(model_apps, app_name, library_module='false')
-                for uses_path_tokens_attribute_name in uses_path_tokens_attribute_names:
-                    if uses_path_tokens_attribute_name in app_dict:
-                        self.__extract_file_from_archive(app_dict[uses_path_tokens_attribute_name])
-
-                location.add_name_token(token_name, app_name)
-                resource_group_template_name, resource_group_name, partition_name = \
-                    self.__get_mt_names_from_location(location)
-
-                new_app_name = self.__deploy_app_online(app_name, src_path, targets, plan=plan_file,
-                                         partition=partition_name, resource_group=resource_group_name,
-                                         resource_group_template=resource_group_template_name, options=options)
-                location.remove_name_token(token_name)
-                deployed_applist.append(new_app_name)
+            for tier in _get_deployment_tiers(model_apps, deploy_ordered_keys):
+                deployments = []
+                for app_name in tier:
+                    app_dict = model_apps[app_name]
+                    src_path = dictionary_utils.get_element(app_dict, SOURCE_PATH)
+                    plan_file = dictionary_utils.get_element(app_dict, PLAN_PATH)
+                    targets = dictionary_utils.get_element(app_dict, TARGET)
+                    options = _get_deploy_options(model_apps, app_name, library_module='false')
+                    for uses_path_tokens_attribute_name in uses_path_tokens_attribute_names:
+                        if uses_path_tokens_attribute_name in app_dict:
+                            self.__extract_file_from_archive(app_dict[uses_path_tokens_attribute_name])
+
+                    location.add_name_token(token_name, app_name)
+                    resource_group_template_name, resource_group_name, partition_name = \
+                        self.__get_mt_names_from_location(location)
+                    deployments.append(self.__get_deploy_arguments(app_name, src_path, targets, plan=plan_file,
+                                                                   partition=partition_name,
+                                                                   resource_group=resource_group_name,
+                                                                   resource_group_template=resource_group_template_name,
+                                                                   options=options))
+                    location.remove_name_token(token_name)
+
+                deployment_order = dictionary_utils.get_element(model_apps[tier[0]], DEPLOYMENT_ORDER)
+                deployed_applist.extend(self.__deploy_tier_online(deployments, deployment_order, parallelism))
         return
 
     def __get_mt_names_from_location(self, app_location):
@@ -730,11 +924,23 @@ class ApplicationsDeployer(Deployer):
         dummy_location.pop_location()
         return resource_group_template_name, resource_group_name, partition_name
 
-    def __deploy_app_online(self, application_name, source_path, targets, plan=None, partition=None,
-                            resource_group=None, resource_group_template=None, options=None):
-        _method_name = '__deploy_app_online'
-
-        self.logger.info('WLSDPLY-09316', application_name, class_name=self._class_name, method_name=_method_name)
+    def __get_deploy_arguments(self, application_name, source_path, targets, plan=None, partition=None,
+                               resource_group=None, resource_group_template=None, options=None):
+        """
+        Validate the source and plan paths of the application or library, and compute its deployable name
+        and the named arguments to the WLST deploy function.
+        :param application_name: the model name of the application or library
+        :param source_path: the source path of the application or library
+        :param targets: the targets of the application or library
+        :param plan: the plan path, or None
+        :param partition: the partition name, or None
+        :param resource_group: the resource group name, or None
+        :param resource_group_template: the resource group template name, or None
+        :param options: the dictionary of additional deploy options, or None
+        :return: a tuple of the deployable name and the dictionary of named arguments
+        :raises: DeployException: if the source or plan path is invalid
+        """
+        _method_name = '__get_deploy_arguments'
 
         if string_utils.is_empty(source_path):
             ex = exception_helper.create_deploy_exception('WLSDPLY-09317', application_name, SOURCE_PATH)
@@ -754,7 +960,6 @@ class ApplicationsDeployer(Deployer):
         application_name = computed_name
 
         # build the dictionary of named arguments to pass to the deploy_application method
-        args = list()
         kwargs = {'path': str(source_path), 'targets': str(targets)}
         if plan is not None:
             if not os.path.isabs(plan):
@@ -774,11 +979,152 @@ class ApplicationsDeployer(Deployer):
         if options is not None:
             for key, value in options.iteritems():
                 kwargs[key] = value
+        return application_name, kwargs
 
-        self.logger.fine('WLSDPLY-09320', application_name, kwargs,
+    def __deploy_tier_online(self, deployments, deployment_order, parallelism):
+        """
+        Deploy the applications or libraries that have the same deployment order.  When the parallelism is
+        greater than one, the deployments are started without blocking and are run concurrently.
+        :param deployments: the list of tuples of the deployable name and the named arguments of each deployment
+        :param deployment_order: the deployment order of the tier, or None for the tier without a deployment order
+        :param parallelism: the maximum number of deployments that run at the same time
+        :return: the list of deployed names
+        :raises: DeployException: if a deployment fails
+        """
+        _method_name = '__deploy_tier_online'
+
+        deployed_names = []
+        timeout = self.__get_deploy_timeout()
+        if parallelism < 2 or len(deployments) < 2:
+            for application_name, kwargs in deployments:
+                self.logger.info('WLSDPLY-09316', application_name,
+                                 class_name=self._class_name, method_name=_method_name)
+                if timeout is not None:
+                    kwargs['timeout'] = timeout
+                self.logger.fine('WLSDPLY-09320', application_name, kwargs,
+                                 class_name=self._class_name, method_name=_method_name)
+                self.wlst_helper.deploy_application(application_name, **kwargs)
+                deployed_names.append(application_name)
+            return deployed_names
+
+        self.logger.info('WLSDPLY-09327', len(deployments), deployment_order, min(parallelism, len(deployments)),
                          class_name=self._class_name, method_name=_method_name)
-        self.wlst_helper.deploy_application(application_name, *args, **kwargs)
-        return application_name
+        running = []
+        failures = []
+        for application_name, kwargs in deployments:
+            self.__wait_for_progress(running, failures, parallelism - 1, timeout)
+
+            self.logger.info('WLSDPLY-09316', application_name, class_name=self._class_name, method_name=_method_name)
+            kwargs['block'] = 'false'
+            if timeout is not None:
+                kwargs['timeout'] = timeout
+            self.logger.fine('WLSDPLY-09320', application_name, kwargs,
+                             class_name=self._class_name, method_name=_method_name)
+            try:
+                progress = self.wlst_helper.deploy_application(application_name, **kwargs)
+                running.append((application_name, progress, _get_deadline(timeout)))
+                deployed_names.append(application_name)
+            except DeployException, de:
+                self.logger.severe('WLSDPLY-09335', application_name, de.getLocalizedMessage(),
+                                   class_name=self._class_name, method_name=_method_name)
+                failures.append(application_name)
+        self.__wait_for_progress(running, failures, 0, timeout)
+        self.__raise_tier_failures('WLSDPLY-09329', failures, deployments, deployment_order)
+        return deployed_names
+
+    def __wait_for_progress(self, running, failures, max_running, timeout):
+        """
+        Wait until no more than the maximum number of deploy, start or stop operations are running.  The WLST
+        progress objects are polled with an increasing interval, so that waiting does not use the CPU.  Finished
+        operations are removed from the running list, and the names of the failed operations, and of those that
+        ran longer than the timeout, are added to the failures list.
+        :param running: the list of tuples of the name, the WLST progress and the deadline of the running operations
+        :param failures: the list of the names of the failed operations
+        :param max_running: the maximum number of operations that may still be running
+        :param timeout: the timeout in milliseconds used to compute the deadlines, or None
+        """
+        _method_name = '__wait_for_progress'
+
+        poll_millis = _PROGRESS_POLL_MIN_MILLIS
+        while len(running) > max_running:
+            now = System.currentTimeMillis()
+            still_running = []
+            for application_name, progress, deadline in running:
+                if progress.isRunning():
+                    if deadline is not None and now > deadline:
+                        self.logger.severe('WLSDPLY-09334', application_name, progress.getCommandType(), timeout,
+                                           class_name=self._class_name, method_name=_method_name)
+                        failures.append(application_name)
+                    else:
+                        still_running.append((application_name, progress, deadline))
+                elif progress.isFailed():
+                    self.logger.severe('WLSDPLY-09328', application_name, progress.getCommandType(),
+                                       progress.getMessage(), class_name=self._class_name, method_name=_method_name)
+                    failures.append(application_name)
+            running[:] = still_running
+            if len(running) > max_running:
+                Thread.sleep(poll_millis)
+                poll_millis = min(poll_millis * 2, _PROGRESS_POLL_MAX_MILLIS)
+        return
+
+    def __raise_tier_failures(self, message_key, failures, tier, deployment_order):
+        """
+        Raise an exception naming the failed operations of a deployment order tier, if there are any.
+        :param message_key: the key of the exception message
+        :param failures: the list of the names of the failed operations
+        :param tier: the list of the operations of the tier
+        :param deployment_order: the deployment order of the tier
+        :raises: DeployException: if there are failed operations
+        """
+        _method_name = '__raise_tier_failures'
+
+        if len(failures) > 0:
+            ex = exception_helper.create_deploy_exception(message_key, len(failures), len(tier), deployment_order,
+                                                          ', '.join(failures))
+            self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
+            raise ex
+        return
+
+    def __get_deploy_parallelism(self):
+        """
+        Get the maximum number of applications or libraries with the same deployment order that are deployed
+        at the same time.
+        :return: the parallelism from the environment, or 1 to deploy one application at a time
+        """
+        _method_name = '__get_deploy_parallelism'
+
+        parallelism = os.environ.get(DEPLOY_PARALLELISM_ENV_VARIABLE)
+        if parallelism is None:
+            return 1
+        try:
+            result = int(parallelism)
+        except ValueError:
+            result = 0
+        if result < 1:
+            self.logger.warning('WLSDPLY-09330', parallelism, DEPLOY_PARALLELISM_ENV_VARIABLE,
+                                class_name=self._class_name, method_name=_method_name)
+            result = 1
+        return result
+
+    def __get_deploy_timeout(self):
+        """
+        Get the number of milliseconds that a deploy, start or stop operation may run.
+        :return: the timeout from the environment, or None to wait until the operation finishes
+        """
+        _method_name = '__get_deploy_timeout'
+
+        timeout = os.environ.get(DEPLOY_TIMEOUT_ENV_VARIABLE)
+        if timeout is None:
+            return None
+        try:
+            result = int(timeout)
+        except ValueError:
+            result = 0
+        if result < 1:
+            self.logger.warning('WLSDPLY-09336', timeout, DEPLOY_TIMEOUT_ENV_VARIABLE,
+                                class_name=self._class_name, method_name=_method_name)
+            result = None
+        return result
 
     def __extract_file_from_archive(self, path):
         if path is not None and deployer_utils.is_path_into_archive(path):
@@ -901,26 +1247,56 @@ class ApplicationsDeployer(Deployer):
         return result_deploy_order
 
     def __start_all_apps(self, deployed_app_list, base_location):
+        """
+        Start the applications in their deployment order.  The applications with the same deployment order
+        are started concurrently.
+        :param deployed_app_list: the names of the applications to start
+        :param base_location: the base location of the applications
+        :raises: DeployException: if an application fails to start
+        """
+        _method_name = '__start_all_apps'
 
+        temp_app_dict = self.__get_existing_deployment_orders(deployed_app_list, base_location)
+        start_order = self.__get_deployment_ordering(temp_app_dict)
+        parallelism = self.__get_deploy_parallelism()
+        timeout = self.__get_deploy_timeout()
+        for tier in _get_deployment_tiers(temp_app_dict, start_order):
+            deployment_order = temp_app_dict[tier[0]][DEPLOYMENT_ORDER]
+            if len(tier) > 1 and parallelism > 1:
+                self.logger.info('WLSDPLY-09332', len(tier), deployment_order, min(parallelism, len(tier)),
+                                 class_name=self._class_name, method_name=_method_name)
+            running = []
+            failures = []
+            for app in tier:
+                self.__wait_for_progress(running, failures, parallelism - 1, timeout)
+                self.__start_app(app, running, failures, timeout=timeout)
+            self.__wait_for_progress(running, failures, 0, timeout)
+            self.__raise_tier_failures('WLSDPLY-09337', failures, tier, deployment_order)
+        return
+
+    def __get_existing_deployment_orders(self, application_names, base_location):
+        """
+        Get the configured deployment order of each of the applications.
+        :param application_names: the names of the applications
+        :param base_location: the base location of the applications
+        :return: a dictionary of application name to a dictionary with the deployment order
+        """
         temp_app_dict = OrderedDict()
         location = LocationContext(base_location).append_location(APPLICATION)
         token_name = self.alias_helper.get_name_token(location)
 
         self.wlst_helper.server_config()
-        for app in deployed_app_list:
+        for app in application_names:
+            if temp_app_dict.has_key(app):
+                continue
             location.add_name_token(token_name, app)
             wlst_attribute_path = self.alias_helper.get_wlst_attributes_path(location)
             self.wlst_helper.cd(wlst_attribute_path)
             deployment_order = self.wlst_helper.get(DEPLOYMENT_ORDER)
 
-            if temp_app_dict.has_key(app) is False:
-                temp_app_dict[app] = OrderedDict()
+            temp_app_dict[app] = OrderedDict()
             temp_app_dict[app][DEPLOYMENT_ORDER] = deployment_order
-
-        start_order = self.__get_deployment_ordering(temp_app_dict)
-        for app in start_order:
-            self.__start_app(app)
-        return
+        return temp_app_dict
 
 def _get_deploy_options(model_apps, app_name, library_module):
     """
@@ -954,6 +1330,74 @@ def _get_deploy_options(model_apps, app_name, library_module):
         deploy_options = None
     return deploy_options
 
+def _get_deployment_tiers(apps_dict, ordered_list):
+    """
+    Split the apps in deployment order into tiers of apps with the same deployment order.  The apps
+    without a deployment order form the last tier.
+    :param apps_dict: the apps dict
+    :param ordered_list: the list of app names in deployment order
+    :return: the list of tiers, each a list of app names
+    """
+    tiers = []
+    tier = []
+    tier_order = None
+    for app_name in ordered_list:
+        order = dictionary_utils.get_element(apps_dict[app_name], DEPLOYMENT_ORDER)
+        if len(tier) > 0 and order != tier_order:
+            tiers.append(tier)
+            tier = []
+        tier.append(app_name)
+        tier_order = order
+    if len(tier) > 0:
+        tiers.append(tier)
+    return tiers
+
+def _get_deadline(timeout):
+    """
+    Get the time by which an operation started now must finish.
+    :param timeout: the timeout in milliseconds, or None
+    :return: the deadline in milliseconds since the epoch, or None if there is no timeout
+    """
+    if timeout is None:
+        return None
+    return System.currentTimeMillis() + timeout
+
+def _add_hash_path(paths, path):
+    """
+    Add the path to the list of paths to hash, if it is not empty and not already in the list.
+    :param paths: the list of paths
+    :param path: the path, which may be None
+    """
+    if not string_utils.is_empty(path) and path not in paths:
+        paths.append(path)
+    return
+
+def _get_hash_value(hashes, path):
+    """
+    Get the hash of the path computed before the deployment strategy.
+    :param hashes: the dictionary of path to hash value
+    :param path: the path, which may be None
+    :return: the hash value, or None if the path is empty
+    """
+    if string_utils.is_empty(path):
+        return None
+    return hashes[path]
+
+def _set_ref_hashes(ref_dictionary, hashes):
+    """
+    Set the hashes of the existing applications or libraries whose files were hashed.
+    :param ref_dictionary: the reference dictionary to update
+    :param hashes: the dictionary of path to hash value
+    """
+    for ref in ref_dictionary.values():
+        source_path = ref['sourcePath']
+        if source_path in hashes:
+            ref['hash'] = hashes[source_path]
+        plan_path = ref['planPath']
+        if plan_path in hashes:
+            ref['planHash'] = hashes[plan_path]
+    return
+
 def _find_deployorder_list(apps_dict, ordered_list, order):
     """
     Get the deployment order for the apps
@@ -3,6 +3,7 @@ Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 import javaos as os
+import threading
 
 from array import array
 from java.lang import Class
@@ -23,6 +24,10 @@ from wlsdeploy.tool.util.wlst_helper import WlstHelper
 import wlsdeploy.util.dictionary_utils as dictionary_utils
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
+# the number of attribute writes that were skipped because the online value already matched the model
+_skipped_attribute_count = 0
+_skipped_attribute_count_lock = threading.Lock()
+
 
 class Deployer(object):
     """
@@ -161,16 +166,18 @@ class Deployer(object):
         :raise: DeployException: if an error condition is encountered
         """
         _method_name = 'set_attributes'
-        attribute_names = self.alias_helper.get_model_attribute_names(location)
-        uses_path_tokens_attribute_names = self.alias_helper.get_model_uses_path_tokens_attribute_names(location)
-        restart_attribute_names = self.alias_helper.get_model_restart_required_attribute_names(location)
-        merge_attribute_names = self.alias_helper.get_model_merge_required_attribute_names(location)
-        lsa_required_attribute_names = self.aliases.get_model_lsa_required_attribute_names(location)
-        set_method_map = self.alias_helper.get_model_mbean_set_method_attribute_names_and_types(location)
+        folder_descriptor = self.alias_helper.get_folder_descriptor(location)
+        attribute_types = folder_descriptor.get_attribute_types()
+        uses_path_tokens_attribute_names = folder_descriptor.get_uses_path_tokens_attribute_names()
+        merge_attribute_names = folder_descriptor.get_merge_required_attribute_names()
+        lsa_required_attribute_names = folder_descriptor.get_lsa_required_attribute_names()
+        set_method_map = folder_descriptor.get_mbean_set_method_map()
+        existing_values = self._get_existing_wlst_values(location, model_nodes, attribute_types, excludes,
+                                                         merge_attribute_names, set_method_map)
 
         for key in model_nodes:
             key_excluded = (excludes is not None) and (key in excludes)
-            if key in attribute_names and not key_excluded:
+            if key in attribute_types and not key_excluded:
                 value = model_nodes[key]
                 if key in uses_path_tokens_attribute_names:
                     self._extract_from_archive_if_needed(location, key, value)
@@ -179,7 +186,7 @@ class Deployer(object):
                 if key in merge_attribute_names:
                     wlst_merge_value = self._get_existing_wlst_value(location, key, lsa_required_attribute_names)
 
-                if not self._skip_setting_attribute(key, value, wlst_merge_value, restart_attribute_names) and \
+                if not self._skip_setting_attribute(location, key, value, existing_values) and \
                         (not self.set_special_attribute(location, key, value, wlst_merge_value, set_method_map)):
                     try:
                         self.attribute_setter.set_attribute(location, key, value, wlst_merge_value)
@@ -191,25 +198,72 @@ class Deployer(object):
                         raise ex
         return
 
-    def _skip_setting_attribute(self, key, value, wlst_merge_value, restart_attribute_names):
+    def _get_existing_wlst_values(self, location, model_nodes, attribute_types, excludes, merge_attribute_names,
+                                  set_method_map):
+        """
+        Read the current WLST values of the model attributes that can be compared to the model, using a single
+        bulk read of the current location.  This is only done in online mode, and only for attributes that are
+        set directly.
+        :param location: the location of the attributes, which must be the current WLST location
+        :param model_nodes: a map of model nodes with attributes to be set
+        :param attribute_types: the model attribute names and types for the location
+        :param excludes: a list of items that should not be set
+        :param merge_attribute_names: the names of the attributes that are merged with the existing value
+        :param set_method_map: the map of attribute names to special set methods
+        :return: a dictionary of model attribute name to the existing WLST value, for the attributes that were read
+        """
+        _method_name = '_get_existing_wlst_values'
+
+        result = dict()
+        if self.wlst_mode != WlstModes.ONLINE:
+            return result
+
+        password_attribute_names = self.alias_helper.get_model_password_type_attribute_names(location)
+        model_names = dict()
+        for key in model_nodes:
+            if key not in attribute_types or (excludes is not None and key in excludes) or \
+                    key in merge_attribute_names or key in set_method_map or key in password_attribute_names:
+                continue
+            wlst_name = self.alias_helper.get_wlst_attribute_name(location, key)
+            if wlst_name is not None:
+                model_names[wlst_name] = key
+
+        if len(model_names) > 0:
+            wlst_values = self.wlst_helper.get_attributes(model_names.keys())
+            for wlst_name, wlst_value in wlst_values.iteritems():
+                result[model_names[wlst_name]] = self._convert_if_mbean_list(wlst_value)
+
+        self.logger.finest('WLSDPLY-09205', len(result), len(model_nodes), str(location),
+                           class_name=self._class_name, method_name=_method_name)
+        return result
+
+    def _skip_setting_attribute(self, location, key, value, existing_values):
         """
-        For the case where a change to an attribute will require restart, verify that the new value is different
-        from the current value in WLST.
+        Determine if the model value of an attribute already matches its current value in WLST, so the attribute
+        does not need to be set.  Skipping these writes keeps them out of the edit session and its activation.
+        :param location: the location of the attribute
         :param key: the attribute key
         :param value: the attribute value from the model
-        :param wlst_merge_value: the WLST value to check for merge
-        :param restart_attribute_names: a list of attribute names that require system restart
+        :param existing_values: the existing WLST values, keyed by model attribute name
         :return: True if the attribute does not need to be set
         """
+        global _skipped_attribute_count
         _method_name = '_skip_setting_attribute'
-        self.logger.entering(str(key), str(value), str(wlst_merge_value), str(restart_attribute_names),
-                             class_name=self._class_name, method_name=_method_name)
 
-        # Needs implementation. Return true if model key in restart attribute_names,
-        # and WLST helper determines that set is required,
-        # based on model key, model value, and the WLST merge value
+        if key not in existing_values:
+            return False
 
-        return False
+        if not self.alias_helper.attribute_values_are_equal(location, key, value, existing_values[key]):
+            return False
+
+        self.logger.finer('WLSDPLY-09206', key, self.alias_helper.get_model_folder_path(location),
+                          class_name=self._class_name, method_name=_method_name)
+        _skipped_attribute_count_lock.acquire()
+        try:
+            _skipped_attribute_count += 1
+        finally:
+            _skipped_attribute_count_lock.release()
+        return True
 
     def _get_existing_wlst_value(self, location, key, lsa_required_attribute_names):
         """
@@ -411,3 +465,11 @@ class Deployer(object):
             os.makedirs(path)
             result = True
         return result
+
+
+def get_skipped_attribute_count():
+    """
+    Get the number of attribute writes that were skipped because the online value already matched the model.
+    :return: the number of skipped attribute writes
+    """
+    return _skipped_attribute_count
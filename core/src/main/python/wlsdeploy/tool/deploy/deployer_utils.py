@@ -272,7 +272,7 @@ def get_file_hash(file_name):
 
     _logger.entering(file_name, class_name=_class_name, method_name=_method_name)
     try:
-        result = FileUtils.computeHash(file_name)
+        result = FileUtils.computeHashCached(file_name)
     except (IOException, NoSuchAlgorithmException), e:
         ex = exception_helper.create_deploy_exception('WLSDPLY-09108', file_name, e.getLocalizedMessage(), error=e)
         _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
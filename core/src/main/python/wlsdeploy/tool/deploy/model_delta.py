@@ -0,0 +1,317 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Computes the structural differences between a previous model and the current model, so that an update
+only visits the folders and attributes that were added or changed.
+"""
+import oracle.weblogic.deploy.util.PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.tool.util.alias_helper import AliasHelper
+from wlsdeploy.util import model as model_helper
+
+
+class ModelDelta(object):
+    """
+    The differences between a previous model and the current model.
+
+    The changed model contains the complete domainInfo and appDeployments sections of the current model, and the
+    topology and resources sections reduced to the folders and attributes that were added or changed.  Named
+    folders that were added, and folders whose children must be processed together, such as security providers,
+    are included in full.  Folders and attributes that were removed are only reported, since the update tools do
+    not remove them from the domain.
+
+    The models should be compared before variable substitution.  Attributes and folder names that contain a
+    variable token, such as @@PROP:name@@ or @@SECRET:name:key@@, are always included, since the value of the
+    token may have changed even though the model did not.
+    """
+    _class_name = 'ModelDelta'
+
+    def __init__(self, previous_model_dictionary, model_dictionary, aliases, logger):
+        self._previous_model_dictionary = previous_model_dictionary
+        self._model_dictionary = model_dictionary
+        self._logger = logger
+        self._alias_helper = AliasHelper(aliases, logger, ExceptionType.DEPLOY)
+
+        self.added_folders = 0
+        self.added_attributes = 0
+        self.changed_folders = 0
+        self.changed_attributes = 0
+        self.removed_folders = 0
+        self.removed_attributes = 0
+        return
+
+    def get_changed_model(self):
+        """
+        Compute the changed model from the previous and current models.
+        :return: the changed model dictionary
+        :raises: DeployException: if an error occurs
+        """
+        _method_name = 'get_changed_model'
+
+        self._logger.entering(class_name=self._class_name, method_name=_method_name)
+        result = OrderedDict()
+        for key in model_helper.get_model_top_level_keys():
+            if key not in self._model_dictionary:
+                continue
+
+            current_section = self._model_dictionary[key]
+            previous_section = _get_element(self._previous_model_dictionary, key)
+            if key == model_helper.get_model_topology_key():
+                folder_names = self._alias_helper.get_model_topology_top_level_folder_names()
+                result[key] = self._diff_section(key, previous_section, current_section, folder_names)
+            elif key == model_helper.get_model_resources_key():
+                folder_names = self._alias_helper.get_model_resources_top_level_folder_names()
+                result[key] = self._diff_section(key, previous_section, current_section, folder_names)
+            else:
+                result[key] = current_section
+
+        self._logger.info('WLSDPLY-09750', self.added_folders, self.added_attributes, self.changed_folders,
+                          self.changed_attributes, self.removed_folders, self.removed_attributes,
+                          class_name=self._class_name, method_name=_method_name)
+        self._logger.exiting(class_name=self._class_name, method_name=_method_name)
+        return result
+
+    def _diff_section(self, section_name, previous_nodes, current_nodes, folder_names):
+        """
+        Compute the changed nodes of a top-level model section.
+        :param section_name: the name of the model section
+        :param previous_nodes: the section nodes of the previous model
+        :param current_nodes: the section nodes of the current model
+        :param folder_names: the names of the top-level folders of the section
+        :return: the changed nodes of the section, which may be empty
+        """
+        location = LocationContext()
+        result = OrderedDict()
+        for key in current_nodes:
+            current_value = current_nodes[key]
+            if key in folder_names:
+                sub_location = LocationContext(location).append_location(key)
+                changed_value = self._diff_folder(sub_location, _get_element(previous_nodes, key), current_value)
+                if changed_value is not None:
+                    result[key] = changed_value
+            elif self._diff_attribute(key, previous_nodes, current_value):
+                result[key] = current_value
+
+        self._log_removed_attributes(previous_nodes, current_nodes, folder_names, section_name)
+        self._log_removed_folders(previous_nodes, current_nodes, folder_names, location)
+        return result
+
+    def _diff_folder(self, location, previous_nodes, current_nodes):
+        """
+        Compute the changed nodes of the model folder at the specified location.
+        :param location: the location of the folder, without a name token for the folder
+        :param previous_nodes: the folder nodes of the previous model, or None if the folder is new
+        :param current_nodes: the folder nodes of the current model
+        :return: the changed nodes of the folder, or None if the folder did not change
+        """
+        if previous_nodes is None:
+            self.added_folders += 1
+            return current_nodes
+
+        if self._alias_helper.requires_artificial_type_subfolder_handling(location):
+            # the children are processed together and in order, so any change requires all of them
+            if _values_are_equal(previous_nodes, current_nodes) and not _contains_token(current_nodes):
+                return None
+            self.changed_folders += 1
+            return current_nodes
+
+        if not isinstance(previous_nodes, dict) or not isinstance(current_nodes, dict) or \
+                not self._alias_helper.supports_multiple_mbean_instances(location):
+            return self._diff_folder_nodes(location, previous_nodes, current_nodes)
+
+        result = OrderedDict()
+        token = self._alias_helper.get_name_token(location)
+        for name in current_nodes:
+            name_location = LocationContext(location)
+            if token is not None:
+                name_location.add_name_token(token, name)
+
+            if name not in previous_nodes or _contains_token(name):
+                self.added_folders += 1
+                result[name] = current_nodes[name]
+            else:
+                changed_nodes = self._diff_folder_nodes(name_location, previous_nodes[name], current_nodes[name])
+                if changed_nodes is not None:
+                    result[name] = changed_nodes
+
+        folder_path = self._alias_helper.get_model_folder_path(location)
+        for name in previous_nodes:
+            if name not in current_nodes:
+                self._log_removed_folder(folder_path + '/' + name)
+
+        if len(result) == 0:
+            return None
+        return result
+
+    def _diff_folder_nodes(self, location, previous_nodes, current_nodes):
+        """
+        Compute the changed attributes and sub-folders of a single folder instance.
+        :param location: the location of the folder instance
+        :param previous_nodes: the folder instance nodes of the previous model
+        :param current_nodes: the folder instance nodes of the current model
+        :return: the changed nodes of the folder instance, or None if it did not change
+        """
+        if not isinstance(previous_nodes, dict) or not isinstance(current_nodes, dict):
+            if _values_are_equal(previous_nodes, current_nodes) and not _contains_token(current_nodes):
+                return None
+            self.changed_folders += 1
+            return current_nodes
+
+        subfolder_names = self._alias_helper.get_model_subfolder_names(location)
+        result = OrderedDict()
+        attribute_changed = False
+        for key in current_nodes:
+            current_value = current_nodes[key]
+            if key in subfolder_names:
+                sub_location = LocationContext(location).append_location(key)
+                changed_value = self._diff_folder(sub_location, _get_element(previous_nodes, key), current_value)
+                if changed_value is not None:
+                    result[key] = changed_value
+            elif self._diff_attribute(key, previous_nodes, current_value):
+                attribute_changed = True
+                result[key] = current_value
+
+        if attribute_changed:
+            self.changed_folders += 1
+
+        folder_path = self._alias_helper.get_model_folder_path(location)
+        self._log_removed_attributes(previous_nodes, current_nodes, subfolder_names, folder_path)
+        self._log_removed_folders(previous_nodes, current_nodes, subfolder_names, location)
+
+        if len(result) == 0:
+            return None
+        return result
+
+    def _diff_attribute(self, key, previous_nodes, current_value):
+        """
+        Determine if the attribute was added or changed, and count it.  An attribute with a variable token in its
+        value is treated as changed, since the value of the token is not known.
+        :param key: the attribute name
+        :param previous_nodes: the folder nodes of the previous model containing the attribute, which may be None
+        :param current_value: the current attribute value, before variable substitution
+        :return: True if the attribute was added or changed, False otherwise
+        """
+        if previous_nodes is None or key not in previous_nodes:
+            self.added_attributes += 1
+            return True
+
+        if _values_are_equal(previous_nodes[key], current_value) and not _contains_token(current_value):
+            return False
+        self.changed_attributes += 1
+        return True
+
+    def _log_removed_attributes(self, previous_nodes, current_nodes, folder_names, folder_path):
+        """
+        Count and log the attributes of the previous folder nodes that are not in the current folder nodes.
+        :param previous_nodes: the folder nodes of the previous model
+        :param current_nodes: the folder nodes of the current model
+        :param folder_names: the names of the sub-folders, which are not attributes
+        :param folder_path: the folder path to log
+        """
+        _method_name = '_log_removed_attributes'
+
+        if previous_nodes is None:
+            return
+        for key in previous_nodes:
+            if key not in folder_names and key not in current_nodes:
+                self.removed_attributes += 1
+                self._logger.info('WLSDPLY-09751', key, folder_path, class_name=self._class_name,
+                                  method_name=_method_name)
+        return
+
+    def _log_removed_folders(self, previous_nodes, current_nodes, folder_names, location):
+        """
+        Count and log the sub-folders of the previous folder nodes that are not in the current folder nodes.
+        :param previous_nodes: the folder nodes of the previous model
+        :param current_nodes: the folder nodes of the current model
+        :param folder_names: the names of the sub-folders
+        :param location: the location of the folder
+        """
+        if previous_nodes is None:
+            return
+        for key in previous_nodes:
+            if key in folder_names and key not in current_nodes:
+                sub_location = LocationContext(location).append_location(key)
+                self._log_removed_folder(self._alias_helper.get_model_folder_path(sub_location))
+        return
+
+    def _log_removed_folder(self, folder_path):
+        """
+        Count and log a folder of the previous model that is not in the current model.
+        :param folder_path: the model path of the removed folder
+        """
+        _method_name = '_log_removed_folder'
+
+        self.removed_folders += 1
+        self._logger.info('WLSDPLY-09752', folder_path, class_name=self._class_name, method_name=_method_name)
+        return
+
+
+def _get_element(dictionary, key):
+    """
+    Get the value of the key from the dictionary.
+    :param dictionary: the dictionary, which may be None
+    :param key: the key
+    :return: the value, or None if the dictionary is None or does not contain the key
+    """
+    if dictionary is None or key not in dictionary:
+        return None
+    return dictionary[key]
+
+
+def _contains_token(value):
+    """
+    Determine if a model value contains a variable token, such as @@PROP:name@@ or ${name}.
+    :param value: the model value, before variable substitution
+    :return: True if the value or any of its elements contains a token, False otherwise
+    """
+    if isinstance(value, dict):
+        for key in value:
+            if _contains_token(key) or _contains_token(value[key]):
+                return True
+        return False
+
+    if isinstance(value, list):
+        for element in value:
+            if _contains_token(element):
+                return True
+        return False
+
+    if type(value) is not str:
+        return False
+    return '@@' in value or '${' in value
+
+
+def _values_are_equal(previous_value, current_value):
+    """
+    Determine if two model values are equal, comparing dictionaries and lists element by element.
+    :param previous_value: the previous model value
+    :param current_value: the current model value
+    :return: True if the values are equal, False otherwise
+    """
+    if isinstance(previous_value, dict) or isinstance(current_value, dict):
+        if not isinstance(previous_value, dict) or not isinstance(current_value, dict):
+            return False
+        if len(previous_value) != len(current_value):
+            return False
+        for key in current_value:
+            if key not in previous_value or not _values_are_equal(previous_value[key], current_value[key]):
+                return False
+        return True
+
+    if isinstance(previous_value, list) or isinstance(current_value, list):
+        if not isinstance(previous_value, list) or not isinstance(current_value, list):
+            return False
+        if len(previous_value) != len(current_value):
+            return False
+        for index in range(len(current_value)):
+            if not _values_are_equal(previous_value[index], current_value[index]):
+                return False
+        return True
+
+    if previous_value is None or current_value is None:
+        return previous_value is None and current_value is None
+    return str(previous_value) == str(current_value)
@@ -3,6 +3,8 @@ Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 import javaos as os
+import threading
+from sets import Set
 
 from oracle.weblogic.deploy.aliases import AliasException
 from oracle.weblogic.deploy.discover import DiscoverException
@@ -19,7 +21,10 @@ from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.util.alias_helper import AliasHelper
 from wlsdeploy.tool.util.wlst_helper import WlstHelper
 from wlsdeploy.util import path_utils
+from wlsdeploy.util import task_executor
 from wlsdeploy.util import wlst_helper
+from wlsdeploy.util.task_executor import SynchronizedObject
+from wlsdeploy.util.task_executor import TaskExecutor
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
 _DISCOVER_LOGGER_NAME = 'wlsdeploy.discover'
@@ -27,6 +32,11 @@ _DISCOVER_LOGGER_NAME = 'wlsdeploy.discover'
 _class_name = 'Discoverer'
 _logger = PlatformLogger(_DISCOVER_LOGGER_NAME)
 
+# MBeanInfo attribute and containment folder names, keyed by the MBean type.  The discoverers running
+# concurrently online share the cache, so it is only read and updated while holding the lock.
+_mbi_names_cache = dict()
+_mbi_names_cache_lock = threading.Lock()
+
 
 class Discoverer(object):
     """
@@ -77,15 +87,20 @@ class Discoverer(object):
                        class_name=_class_name, method_name=_method_name)
         attr_dict = OrderedDict()
         if wlst_params:
+            # online, read the values of the get required attributes in one round-trip
+            bulk_values = wlst_helper.get_attributes(_get_required_names(wlst_params, wlst_get_params))
             for wlst_param in wlst_params:
                 if wlst_param in wlst_get_params:
                     _logger.finest('WLSDPLY-06104', wlst_param, class_name=_class_name, method_name=_method_name)
-                    try:
-                        wlst_value = wlst_helper.get(wlst_param)
-                    except PyWLSTException, pe:
-                        _logger.warning('WLSDPLY-06127', wlst_param, wlst_path,
-                                        pe.getLocalizedMessage(), class_name=_class_name, method_name=_method_name)
-                        continue
+                    if wlst_param in bulk_values:
+                        wlst_value = bulk_values[wlst_param]
+                    else:
+                        try:
+                            wlst_value = wlst_helper.get(wlst_param)
+                        except PyWLSTException, pe:
+                            _logger.warning('WLSDPLY-06127', wlst_param, wlst_path, pe.getLocalizedMessage(),
+                                            class_name=_class_name, method_name=_method_name)
+                            continue
                 else:
                     _logger.finer('WLSDPLY-06131', wlst_param, class_name=_class_name, method_name=_method_name)
                     wlst_value = wlst_params[wlst_param]
@@ -150,12 +165,19 @@ class Discoverer(object):
                     if lsa_attribute_name in lsa_attributes and lsa_attribute_name not in mbi_attributes:
                         _logger.finer('WLSDPLY-06142', lsa_attribute_name)
                         del lsa_attributes[lsa_attribute_name]
+                missing_attributes = []
                 for mbi_attribute_name in mbi_attributes:
                     if mbi_attribute_name not in lsa_attributes and mbi_attribute_name in mbi_attributes:
-                        # don't count on the item in the get required list in caller, just get the value
-                        # and add it to our lsa list
-                        _logger.finer('WLSDPLY-06141', mbi_attribute_name, class_name=_class_name,
-                                      method_name=_method_name)
+                        missing_attributes.append(mbi_attribute_name)
+                # don't count on the item in the get required list in caller, just get the values
+                # and add them to our lsa list, with a single round-trip if possible
+                bulk_values = wlst_helper.get_attributes(missing_attributes)
+                for mbi_attribute_name in missing_attributes:
+                    _logger.finer('WLSDPLY-06141', mbi_attribute_name, class_name=_class_name,
+                                  method_name=_method_name)
+                    if mbi_attribute_name in bulk_values:
+                        lsa_attributes[mbi_attribute_name] = bulk_values[mbi_attribute_name]
+                    else:
                         lsa_attributes[mbi_attribute_name] = wlst_helper.get(mbi_attribute_name)
         except PyWLSTException, pe:
             name = location.get_model_folders()[-1]
@@ -181,7 +203,8 @@ class Discoverer(object):
         _method_name = '_get_required_attributes'
         attributes = []
         try:
-            attributes = self._alias_helper.get_wlst_get_required_attribute_names(location)
+            folder_descriptor = self._alias_helper.get_folder_descriptor(location)
+            attributes = folder_descriptor.get_wlst_get_required_attribute_names()
         except DiscoverException, de:
             name = location.get_model_folders()[-1]
             _logger.warning('WLSDPLY-06109', name, location.get_folder_path(), de.getLocalizedMessage(),
@@ -687,12 +710,139 @@ def convert_to_absolute_path(relative_to, file_name):
     return file_name
 
 
+def discover_concurrently(discoverers, model_context, thread_count, create_session, connect, disconnect):
+    """
+    Run the discoverers on a pool of threads, each discoverer with its own WLST session.  Each discoverer
+    populates its own section of the model, so the model is the same as when the discoverers run one after
+    another.  The archive file is shared, so its calls are serialized.
+    :param discoverers: the list of discoverers
+    :param model_context: the model context
+    :param thread_count: the maximum number of threads
+    :param create_session: the function that returns a new WLST session
+    :param connect: the function called with the model context to connect the session of the thread to the domain
+    :param disconnect: the function called to disconnect the session of the thread from the domain
+    :raises DiscoverException: if an error occurs during discovery
+    """
+    _method_name = 'discover_concurrently'
+    thread_count = min(thread_count, len(discoverers))
+    _logger.info('WLSDPLY-06024', len(discoverers), thread_count, class_name=_class_name, method_name=_method_name)
+
+    archive_file = model_context.get_archive_file()
+    if archive_file is not None:
+        model_context.set_archive_file(SynchronizedObject(archive_file))
+
+    executor = TaskExecutor(thread_count, 'discover')
+    try:
+        tasks = []
+        for section_discoverer in discoverers:
+            tasks.append(executor.submit(_discover_in_session, section_discoverer, model_context, create_session,
+                                         connect, disconnect))
+        task_executor.get_results(tasks)
+    finally:
+        executor.shutdown()
+        model_context.set_archive_file(archive_file)
+    return
+
+
+def _discover_in_session(section_discoverer, model_context, create_session, connect, disconnect):
+    """
+    Run the discoverer on the current thread, using a new WLST session connected to the domain.
+    :param section_discoverer: the discoverer
+    :param model_context: the model context
+    :param create_session: the function that returns a new WLST session
+    :param connect: the function called with the model context to connect the session to the domain
+    :param disconnect: the function called to disconnect the session from the domain
+    :raises DiscoverException: if an error occurs during discovery
+    """
+    wlst_helper.set_thread_session(create_session())
+    try:
+        connect(model_context)
+        try:
+            section_discoverer.discover()
+        finally:
+            disconnect()
+    finally:
+        wlst_helper.set_thread_session(None)
+    return
+
+
+def _get_required_names(wlst_names, wlst_get_names):
+    """
+    Get the attribute names that require a get() call to read their value.
+    :param wlst_names: the wlst attribute names at the location
+    :param wlst_get_names: the names of the attributes at the location that require get()
+    :return: the list of names in both lists
+    """
+    result = []
+    for wlst_name in wlst_names:
+        if wlst_name in wlst_get_names:
+            result.append(wlst_name)
+    return result
+
+
 def _get_mbi_attribute_list(path):
-    attribute_list = []
+    """
+    Get the names of the attributes in the MBeanInfo of the MBean at the path.
+    :param path: the wlst path of the MBean
+    :return: the set of attribute names
+    """
+    return _get_mbi_names(path)[0]
+
+
+def _get_mbi_names(path):
+    """
+    Get the attribute and containment folder names in the MBeanInfo of the MBean at the path. The MBeanInfo only
+    depends on the MBean type, so the names are fetched once for each type and kept for the rest of the run.
+    The callers have already changed to the path, so the type is read from the current MBean.
+    :param path: the wlst path of the MBean
+    :return: a tuple of the set of attribute names and the set of containment folder names
+    """
+    _method_name = '_get_mbi_names'
+    mbean_type = _get_current_mbean_type(path)
+    if mbean_type is not None:
+        _mbi_names_cache_lock.acquire()
+        try:
+            result = _mbi_names_cache.get(mbean_type)
+        finally:
+            _mbi_names_cache_lock.release()
+        if result is not None:
+            _logger.finest('WLSDPLY-06148', mbean_type, path, class_name=_class_name, method_name=_method_name)
+            return result
+
+    attribute_names = Set()
+    containment_names = Set()
     for mbean_attribute_info in wlst_helper.get_mbi(path).getAttributes():
         if _is_attribute(mbean_attribute_info):
-            attribute_list.append(mbean_attribute_info.getName())
-    return attribute_list
+            attribute_names.add(mbean_attribute_info.getName())
+        elif _is_containment(mbean_attribute_info):
+            containment_names.add(mbean_attribute_info.getName())
+    result = (attribute_names, containment_names)
+    if mbean_type is not None:
+        _mbi_names_cache_lock.acquire()
+        try:
+            _mbi_names_cache[mbean_type] = result
+        finally:
+            _mbi_names_cache_lock.release()
+    return result
+
+
+def _get_current_mbean_type(path):
+    """
+    Get the type of the MBean at the path, from the Type key of the ObjectName of the current MBean.  This does
+    not change to the path, so the type is only returned if the path is the current location.
+    :param path: the wlst path of the MBean
+    :return: the MBean type, or None if it is not known
+    """
+    try:
+        current_path = wlst_helper.get_current_path()
+        if path is None or current_path != path and current_path != path.rstrip('/'):
+            return None
+        cmo = wlst_helper.get_cmo()
+        if cmo is not None:
+            return cmo.getObjectName().getKeyProperty('Type')
+    except (PyWLSTException, AttributeError):
+        pass
+    return None
 
 
 def _is_attribute(attributes_info):
@@ -732,10 +882,7 @@ def _massage_online_folders(lsc_folders):
     _method_name = '_massage_online_folders'
     location = wlst_helper.get_pwd()
     folder_list = []
-    mbi_folder_list = []
-    for mbean_attribute_info in wlst_helper.get_mbi(location).getAttributes():
-        if _is_containment(mbean_attribute_info):
-            mbi_folder_list.append(mbean_attribute_info.getName())
+    mbi_folder_list = _get_mbi_names(location)[1]
     for lsc_folder in lsc_folders:
         if lsc_folder in mbi_folder_list:
             folder_list.append(lsc_folder)
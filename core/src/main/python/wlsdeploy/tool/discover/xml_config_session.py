@@ -0,0 +1,576 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+An offline discovery engine that reads the domain configuration files directly instead of using WLST.
+"""
+import javaos as os
+from sets import Set
+
+from java.io import File
+from java.io import FileInputStream
+from java.io import IOException
+from java.util import LinkedHashMap
+from javax.xml.stream import XMLInputFactory
+from javax.xml.stream import XMLStreamConstants
+from javax.xml.stream import XMLStreamException
+
+from oracle.weblogic.deploy.aliases import AliasException
+from oracle.weblogic.deploy.discover import DiscoverException
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.alias_constants import SECURITY_PROVIDER_NAME_MAP
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import discoverer
+
+_class_name = 'XmlConfigSession'
+_logger = PlatformLogger(discoverer.get_discover_logger_name())
+
+# the WLST name of the folder holding the contents of the descriptor file of each system resource element
+_DESCRIPTOR_FOLDER_TYPES = {
+    'jdbc-system-resource': 'JdbcResource',
+    'jms-system-resource': 'JmsResource',
+    'wldf-system-resource': 'WLDFResource'
+}
+_DESCRIPTOR_FILE_NAME = 'descriptor-file-name'
+_NAME = 'name'
+_XSI_TYPE = 'type'
+_XSI_NAMESPACE = 'http://www.w3.org/2001/XMLSchema-instance'
+# offline WLST names the instances of folders that have no name element NO_NAME_0, NO_NAME_1 and so on
+_NO_NAME = 'NO_NAME_'
+# the token used for all names while collecting the WLST names from the aliases
+_ALIAS_NAME_TOKEN = 'xml'
+
+
+class XmlConfigSession(object):
+    """
+    A replacement for the offline WLST session that reads config/config.xml, and the JDBC, JMS and WLDF
+    descriptors that it references, with a streaming StAX parser.  The configuration is kept as a tree of
+    folders with the same paths, folder types, names and attribute names as offline WLST, so that the
+    existing discoverers produce the same model when the session is installed with
+    wlst_helper.set_thread_session().  Only the WLST functions used by offline discovery are provided.
+
+    XML element names are mapped to WLST names with the folder types and attribute names in the aliases,
+    by comparing the names without hyphens and case.  The names of the folder type that contains the element
+    are preferred, since a few names differ in case between folder types, such as URL and Url.  Attributes that are not in config.xml have their
+    default values and are not returned by ls(), which only affects the defaults that discovery leaves
+    out of the model anyway.
+    """
+    # the WLST functions catch this exception type through the session
+    WLSTException = DiscoverException
+    connected = 'false'
+
+    def __init__(self, aliases):
+        """
+        Create the session.
+        :param aliases: the offline aliases for the WebLogic version, used to get the WLST names
+        """
+        self._aliases = aliases
+        self._wlst_names = None
+        self._folder_wlst_names = None
+        self._folder_types = None
+        self._root = None
+        self._current = None
+        self._current_path = '/'
+        self.cmo = None
+        self.WLS_ON = _Disconnected()
+        # the location tracked by wlst_helper for this session
+        self.current_path = None
+        return
+
+    def readDomain(self, domain_home):
+        """
+        Read the domain configuration files.
+        :param domain_home: the domain home directory
+        :raises: DiscoverException: if the configuration files cannot be read
+        """
+        _method_name = 'readDomain'
+        _logger.entering(domain_home, class_name=_class_name, method_name=_method_name)
+
+        if self._wlst_names is None:
+            self._wlst_names, self._folder_wlst_names, self._folder_types = _get_alias_wlst_names(self._aliases)
+        config_dir = os.path.join(domain_home, 'config')
+        self._root = self._read_file(config_dir, os.path.join(config_dir, 'config.xml'))
+        self._current = self._root
+        self._current_path = '/'
+        self.cmo = self._root
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return
+
+    def closeDomain(self):
+        """
+        Release the domain configuration that was read.
+        """
+        self._root = None
+        self._current = None
+        self._current_path = '/'
+        self.cmo = None
+        return
+
+    def cd(self, path):
+        """
+        Change to the folder at the path.
+        :param path: the absolute or relative WLST path
+        :return: the folder at the path
+        :raises: DiscoverException: if the folder does not exist
+        """
+        self._current_path, self._current = self._find(path)
+        self.cmo = self._current
+        return self._current
+
+    def pwd(self):
+        """
+        Get the current path, in the same form as online WLST so that wlst_helper.get_pwd() strips the prefix.
+        :return: the current path
+        """
+        return 'xml:' + self._current_path
+
+    def updateCmo(self):
+        return
+
+    def get(self, attribute):
+        """
+        Get the value of the attribute at the current folder.
+        :param attribute: the WLST attribute name
+        :return: the value, or None if the attribute is not set in the configuration
+        """
+        return self._current.get_attribute(attribute)
+
+    def ls(self, path=None, returnMap='false', returnType=None):
+        """
+        List the attributes or child folders of the current folder or of the folder at the path.
+        :param path: the path of the folder, or the returnType to list the current folder
+        :param returnMap: ignored, the result is always returned
+        :param returnType: 'a' for the attributes, 'c' for the child folders
+        :return: a map of attribute names and values, or a list of child folder names
+        :raises: DiscoverException: if the folder does not exist
+        """
+        folder = self._current
+        if path is not None and path != returnType:
+            folder = self._find(path)[1]
+        if returnType == 'a':
+            return folder.get_attribute_map()
+        return folder.get_child_names()
+
+    def _find(self, path):
+        """
+        Find the folder at the path.
+        :param path: the absolute or relative WLST path
+        :return: a tuple of the normalized absolute path and the folder
+        :raises: DiscoverException: if the folder does not exist
+        """
+        if self._root is None:
+            raise exception_helper.create_discover_exception('WLSDPLY-06028', path)
+
+        tokens = _split_path(path)
+        if not path.startswith('/'):
+            tokens = _split_path(self._current_path) + tokens
+
+        folder = self._root
+        path_tokens = []
+        for token in tokens:
+            if token == '..':
+                path_tokens = path_tokens[:-1]
+                folder = self._root
+                for path_token in path_tokens:
+                    folder = folder.get_child(path_token)
+                continue
+            folder = folder.get_child(token)
+            if folder is None:
+                raise exception_helper.create_discover_exception('WLSDPLY-06028', path)
+            path_tokens.append(token)
+        return '/' + '/'.join(path_tokens), folder
+
+    def _read_file(self, config_dir, file_name):
+        """
+        Read the configuration file into a folder tree, streaming its elements.
+        :param config_dir: the domain config directory, that descriptor file names are relative to
+        :param file_name: the configuration file
+        :return: the folder for the root element
+        :raises: DiscoverException: if the file cannot be read
+        """
+        _method_name = '_read_file'
+        _logger.finer('WLSDPLY-06029', file_name, class_name=_class_name, method_name=_method_name)
+
+        stream = None
+        try:
+            try:
+                stream = FileInputStream(File(file_name))
+                reader = XMLInputFactory.newInstance().createXMLStreamReader(stream)
+                root = None
+                elements = []
+                while reader.hasNext():
+                    event = reader.next()
+                    if event == XMLStreamConstants.START_ELEMENT:
+                        elements.append(_Element(reader))
+                    elif event == XMLStreamConstants.CHARACTERS or event == XMLStreamConstants.CDATA:
+                        elements[-1].add_text(reader.getText())
+                    elif event == XMLStreamConstants.END_ELEMENT:
+                        element = elements.pop()
+                        parent = None
+                        if len(elements) > 0:
+                            parent = elements[-1]
+                        folder = None
+                        if element.is_folder() or self._is_empty_folder(element, parent):
+                            folder = self._create_folder(config_dir, element)
+                        if parent is not None:
+                            parent.add_child(element, folder)
+                        else:
+                            root = folder
+                reader.close()
+            except (IOException, XMLStreamException), e:
+                ex = exception_helper.create_discover_exception('WLSDPLY-06030', file_name, e.getLocalizedMessage(),
+                                                                error=e)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+        finally:
+            if stream is not None:
+                stream.close()
+
+        if root is None:
+            root = _Folder(None)
+        return root
+
+    def _is_empty_folder(self, element, parent):
+        """
+        Determine if an element without text, such as <jta/>, is a folder.  It is a folder if its name is a WLST
+        folder type in the aliases, and not the name of an attribute of the parent folder type, such as the
+        Cluster reference of a Server.
+        :param element: the closed element
+        :param parent: the parent element, or None for the root element
+        :return: True if the element is a folder, False if it is an attribute
+        """
+        if parent is None or element.get_text() is not None:
+            return False
+        key = _get_name_key(element.get_local_name())
+        if key not in self._folder_types:
+            return False
+        parent_type = self._get_wlst_name(parent.get_local_name())
+        return parent_type not in self._folder_wlst_names or key not in self._folder_wlst_names[parent_type]
+
+    def _create_folder(self, config_dir, element):
+        """
+        Create the folder for the element, with its attributes and child folders.
+        :param config_dir: the domain config directory
+        :param element: the closed element
+        :return: the folder
+        """
+        folder = _Folder(element.get_provider_interface())
+        folder_type = self._get_wlst_name(element.get_local_name())
+        unnamed_counts = dict()
+        for child_element, child_folder in element.get_children():
+            local_name = child_element.get_local_name()
+            if child_folder is None:
+                folder.add_attribute(self._get_wlst_name(local_name, folder_type), child_element.get_text())
+                continue
+            name = child_element.get_name()
+            if name is None:
+                count = 0
+                if local_name in unnamed_counts:
+                    count = unnamed_counts[local_name]
+                unnamed_counts[local_name] = count + 1
+                name = _NO_NAME + str(count)
+            folder.add_child(self._get_wlst_name(local_name, folder_type), name, child_folder)
+
+        if element.get_name() is not None and folder.get_attribute('Name') is None:
+            folder.add_attribute('Name', element.get_name())
+
+        local_name = element.get_local_name()
+        descriptor_file = element.get_child_text(_DESCRIPTOR_FILE_NAME)
+        if local_name in _DESCRIPTOR_FOLDER_TYPES and descriptor_file is not None:
+            descriptor_path = os.path.join(config_dir, descriptor_file)
+            if os.path.exists(descriptor_path):
+                descriptor = self._read_file(config_dir, descriptor_path)
+                descriptor_name = descriptor.get_attribute('Name')
+                if descriptor_name is None:
+                    descriptor_name = _NO_NAME + '0'
+                folder.add_child(_DESCRIPTOR_FOLDER_TYPES[local_name], descriptor_name, descriptor)
+            else:
+                _logger.warning('WLSDPLY-06031', descriptor_path, element.get_name(), class_name=_class_name,
+                                method_name='_create_folder')
+        return folder
+
+    def _get_wlst_name(self, local_name, folder_type=None):
+        """
+        Get the WLST folder type or attribute name for an XML element name.
+        :param local_name: the element name, such as jdbc-system-resource
+        :param folder_type: the WLST folder type of the parent element, or None if it is not known
+        :return: the WLST name from the aliases, such as JDBCSystemResource, or a camel case name
+        """
+        key = _get_name_key(local_name)
+        if folder_type in self._folder_wlst_names and key in self._folder_wlst_names[folder_type]:
+            return self._folder_wlst_names[folder_type][key]
+        if key in self._wlst_names:
+            return self._wlst_names[key]
+        result = ''
+        for word in local_name.split('-'):
+            result += word[:1].upper() + word[1:]
+        return result
+
+
+class _Element(object):
+    """
+    An XML element that is open or whose parent is still open.
+    """
+
+    def __init__(self, reader):
+        self._local_name = reader.getLocalName()
+        self._name = reader.getAttributeValue(None, _NAME)
+        self._xsi_type = reader.getAttributeValue(_XSI_NAMESPACE, _XSI_TYPE)
+        self._text = ''
+        self._children = []
+        return
+
+    def get_local_name(self):
+        return self._local_name
+
+    def get_name(self):
+        """
+        Get the instance name of the element, from its name attribute or name child element.
+        :return: the name, or None if the element has no name
+        """
+        if self._name is None:
+            return self.get_child_text(_NAME)
+        return self._name
+
+    def get_text(self):
+        text = self._text.strip()
+        if len(text) == 0:
+            return None
+        return text
+
+    def get_child_text(self, local_name):
+        for child_element, child_folder in self._children:
+            if child_folder is None and child_element.get_local_name() == local_name:
+                return child_element.get_text()
+        return None
+
+    def get_children(self):
+        return self._children
+
+    def get_provider_interface(self):
+        """
+        Get the MBean interface of a security provider from the element type, such as wls:default-authenticatorType.
+        :return: the interface name, or None if the element is not a known security provider
+        """
+        if self._xsi_type is None:
+            return None
+        type_name = self._xsi_type[self._xsi_type.find(':') + 1:]
+        if type_name.endswith('Type'):
+            type_name = type_name[:-4]
+        key = _get_name_key(type_name)
+        for provider_name, provider_class in SECURITY_PROVIDER_NAME_MAP.iteritems():
+            if _get_name_key(provider_name) == key:
+                return provider_class + 'MBean'
+        return None
+
+    def is_folder(self):
+        """
+        Determine if the element is a folder from its content.  Empty elements are checked with the aliases.
+        :return: True if the element has child elements, a name or a type
+        """
+        return len(self._children) > 0 or self._name is not None or self._xsi_type is not None
+
+    def add_text(self, text):
+        self._text += text
+        return
+
+    def add_child(self, element, folder):
+        self._children.append((element, folder))
+        return
+
+
+class _Folder(object):
+    """
+    A folder in the configuration tree, with its attributes and its child folders by type and name.
+    A child folder type is represented by a _FolderType listing the names of its instances.
+    """
+
+    def __init__(self, provider_interface):
+        self._attributes = OrderedDict()
+        self._children = OrderedDict()
+        self._provider_interface = provider_interface
+        return
+
+    def add_attribute(self, name, value):
+        # repeated elements are array attributes
+        if name in self._attributes:
+            current = self._attributes[name]
+            if type(current) is not list:
+                current = [current]
+            current.append(value)
+            value = current
+        self._attributes[name] = value
+        return
+
+    def add_child(self, type_name, name, folder):
+        if type_name not in self._children:
+            self._children[type_name] = _FolderType()
+        self._children[type_name].add_child(name, folder)
+        return
+
+    def get_attribute(self, name):
+        if name in self._attributes:
+            return self._attributes[name]
+        return None
+
+    def get_attribute_map(self):
+        result = LinkedHashMap()
+        for name in self._attributes.keys():
+            result.put(name, self._attributes[name])
+        return result
+
+    def get_child(self, type_name):
+        if type_name in self._children:
+            return self._children[type_name]
+        return None
+
+    def get_child_names(self):
+        return list(self._children.keys())
+
+    def getClass(self):
+        # discovery uses the MBean interface to find the type of a security provider
+        return _FolderClass(self._provider_interface)
+
+
+class _FolderType(object):
+    """
+    The instances of a folder type under a folder.
+    """
+
+    def __init__(self):
+        self._children = OrderedDict()
+        return
+
+    def add_child(self, name, folder):
+        self._children[name] = folder
+        return
+
+    def get_attribute(self, name):
+        return None
+
+    def get_attribute_map(self):
+        return LinkedHashMap()
+
+    def get_child(self, name):
+        if name in self._children:
+            return self._children[name]
+        return None
+
+    def get_child_names(self):
+        return list(self._children.keys())
+
+    def getClass(self):
+        return _FolderClass(None)
+
+
+class _FolderClass(object):
+    def __init__(self, interface):
+        self._interface = interface
+        return
+
+    def getInterfaces(self):
+        if self._interface is None:
+            return []
+        return [self._interface]
+
+
+class _Disconnected(object):
+    def isConnected(self):
+        return False
+
+
+def _split_path(path):
+    """
+    Split the WLST path into folder type and name tokens.  Names containing a slash are in parentheses.
+    :param path: the WLST path
+    :return: the list of tokens
+    """
+    tokens = []
+    token = ''
+    depth = 0
+    for char in path:
+        if char == '(':
+            depth += 1
+            if depth == 1:
+                continue
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                continue
+        elif char == '/' and depth == 0:
+            if len(token) > 0:
+                tokens.append(token)
+            token = ''
+            continue
+        token += char
+    if len(token) > 0:
+        tokens.append(token)
+    return tokens
+
+
+def _get_name_key(name):
+    """
+    Get the key used to match XML element names with WLST names.
+    :param name: the XML element name or WLST name
+    :return: the name in lower case, without hyphens
+    """
+    return name.replace('-', '').lower()
+
+
+def _get_alias_wlst_names(aliases):
+    """
+    Collect the WLST folder types and attribute names of all the folders in the aliases.
+    :param aliases: the aliases
+    :return: a dictionary of the WLST names keyed by their name key, a dictionary of the WLST attribute names
+             of each folder type keyed by the folder type, and the set of the name keys of the folder types
+    """
+    result = dict()
+    folder_result = dict()
+    folder_types = Set()
+    _add_alias_wlst_names(aliases, LocationContext(), result, folder_result, folder_types)
+    for folder_name in aliases.get_model_top_level_folder_names():
+        location = LocationContext()
+        location.append_location(folder_name)
+        _add_alias_wlst_names(aliases, location, result, folder_result, folder_types)
+    return result, folder_result, folder_types
+
+
+def _add_alias_wlst_names(aliases, location, result, folder_result, folder_types):
+    """
+    Add the WLST names of the folder at the location and of all of its subfolders.
+    :param aliases: the aliases
+    :param location: the location, with name tokens for all of its parent folders
+    :param result: the dictionary of WLST names to add to
+    :param folder_result: the dictionary of WLST names by folder type to add to
+    :param folder_types: the set of folder type name keys to add to
+    """
+    folder_names = None
+    try:
+        if len(location.get_model_folders()) > 0:
+            name_token = aliases.get_name_token(location)
+            if name_token is not None:
+                location.add_name_token(name_token, _ALIAS_NAME_TOKEN)
+            mbean_type = aliases.get_wlst_mbean_type(location)
+            if mbean_type is not None:
+                result[_get_name_key(mbean_type)] = mbean_type
+                folder_types.add(_get_name_key(mbean_type))
+                if mbean_type not in folder_result:
+                    folder_result[mbean_type] = dict()
+                folder_names = folder_result[mbean_type]
+        wlst_names = aliases.get_folder_descriptor(location).get_wlst_to_model_name_map().keys()
+        subfolder_names = aliases.get_model_subfolder_names(location)
+    except AliasException:
+        return
+
+    for wlst_name in wlst_names:
+        result[_get_name_key(wlst_name)] = wlst_name
+        if folder_names is not None:
+            folder_names[_get_name_key(wlst_name)] = wlst_name
+    for subfolder_name in subfolder_names:
+        subfolder_location = LocationContext(location)
+        subfolder_location.append_location(subfolder_name)
+        _add_alias_wlst_names(aliases, subfolder_location, result, folder_result, folder_types)
+    return
@@ -664,6 +664,43 @@ class AliasHelper(object):
             raise ex
         return result
 
+    def get_folder_descriptor(self, location):
+        """
+        Get the descriptor with the attribute information for the folder type at the specified location.
+        :param location: the location
+        :return: the FolderDescriptor for the folder type
+        :raises: BundleAwareException of the specified type: if an error occurs
+        """
+        _method_name = 'get_folder_descriptor'
+        try:
+            result = self.__aliases.get_folder_descriptor(location)
+        except AliasException, ae:
+            ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19037', location.get_folder_path(),
+                                                   ae.getLocalizedMessage(), error=ae)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
+        return result
+
+    def attribute_values_are_equal(self, location, model_name, model_value, wlst_value):
+        """
+        Determine if the model value of an attribute is equal to its current WLST value.
+        :param location: the location
+        :param model_name: the model attribute name
+        :param model_value: the model attribute value
+        :param wlst_value: the current WLST attribute value
+        :return: True if the values are equal, False otherwise
+        :raises: BundleAwareException of the specified type: if an error occurs
+        """
+        _method_name = 'attribute_values_are_equal'
+        try:
+            result = self.__aliases.attribute_values_are_equal(location, model_name, model_value, wlst_value)
+        except AliasException, ae:
+            ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19038', model_name,
+                                                   location.get_folder_path(), ae.getLocalizedMessage(), error=ae)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
+        return result
+
     def get_model_restart_required_attribute_names(self, location):
         """
         Get the names of attributes at the specified location that require a restart if changed.
@@ -162,7 +162,8 @@ class ArchiveHelper(object):
 
     def get_file_hash(self, path):
         """
-        Get the Base64-encoded hash value for the file at the specified path within the archive.
+        Get the Base64-encoded hash value for the file at the specified path within the archive.  The hash is
+        read from the digest manifest of the archive when the manifest matches the entry, without reading the entry.
         :param path: the path in the archive
         :return: the Base64-encoded hash value
         :raises: BundleAwareException of the appropriate type: if an error occurs
@@ -902,15 +902,20 @@ class AttributeSetter(object):
 
         location = LocationContext(location).append_location(element_type)
         if self.__alias_helper.get_wlst_mbean_type(location) is not None:
-            existing_names = self.__get_existing_object_list(location)
-            if name in existing_names:
+            list_path = self.__alias_helper.get_wlst_list_path(location)
+            existing_index = self.__wlst_helper.get_existing_object_index(list_path)
+            if existing_index.contains(name):
                 location_type, location_name = self.__alias_helper.get_model_type_and_name(location)
                 self.__logger.fine('WLSDPLY-19204', element_type, name, location_type, location_name,
                                    class_name=self._class_name, method_name=method_name)
-                token = self.__alias_helper.get_name_token(location)
-                location.add_name_token(token, name)
-                path = self.__alias_helper.get_wlst_attributes_path(location)
-                return self.__wlst_helper.get_mbean_for_wlst_path(path)
+                mbean = existing_index.get_mbean(name)
+                if mbean is None:
+                    token = self.__alias_helper.get_name_token(location)
+                    location.add_name_token(token, name)
+                    path = self.__alias_helper.get_wlst_attributes_path(location)
+                    mbean = self.__wlst_helper.get_mbean_for_wlst_path(path)
+                    existing_index.put_mbean(name, mbean)
+                return mbean
 
         if required:
             ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19210', element_type, name,
@@ -2,17 +2,46 @@
 Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
+import threading
+from sets import Set
+
+from java.lang import ThreadLocal
 from oracle.weblogic.deploy.util import PyWLSTException
 
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.util import wlst_extended
 from wlsdeploy.util import wlst_helper
 
+_OFFLINE_TREE = 'offline'
+_SERVER_CONFIG_TREE = 'serverConfig'
+_EDIT_TREE = 'edit'
+_DOMAIN_RUNTIME_TREE = 'domainRuntime'
+_CUSTOM_TREE = 'custom'
+
+# the runtime trees change independently of the tool, so their directory listings are not cached
+_CACHED_TREES = [_OFFLINE_TREE, _SERVER_CONFIG_TREE, _EDIT_TREE]
+
+_LSA = 'a'
+_LSC = 'c'
+# get_existing_object_list() returns an empty list instead of failing for a path that does not exist, so its
+# results are cached separately from the lsc() results
+_EXISTING_OBJECTS = 'existing'
+
+_thread_list_cache = ThreadLocal()
+_list_caches = []
+_list_caches_lock = threading.Lock()
+
 
 class WlstHelper(object):
     """
     This class simply wraps the wlst_helper methods to catch exceptions and convert them into
     BundleAwareException of the specified types.
+
+    The lsa() and lsc() results are cached by WLST tree and path for the WLST session of the thread, since the
+    tools list the same directories many times.  The create(), delete(), set() and set_with_cmo() methods remove
+    the cached results of the current directory, its parent and its subdirectories, and the methods that change
+    the configuration in other ways, such as activate(), remove all the cached results.  The indexes of existing
+    MBean names returned by get_existing_object_index() are only removed when MBeans are created or deleted.
     """
     __class_name = 'WlstHelper'
 
@@ -32,6 +61,7 @@ class WlstHelper(object):
         """
 
         _method_name = 'assign'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.assign(source_type, source_name, target_type, target_name)
@@ -51,6 +81,7 @@ class WlstHelper(object):
         :raises: Exception specific to tool type
         """
         _method_name = 'apply_jrf'
+        _get_list_cache().clear()
 
         try:
             wlst_extended.apply_jrf(jrf_target, domain_home, should_update)
@@ -98,6 +129,16 @@ class WlstHelper(object):
             raise ex
         return result
 
+    def get_attributes(self, attribute_names):
+        """
+        Return the values of the attributes at the current location, read with a single bulk call when connected.
+        The result has no entry for an attribute that could not be read, and is empty when offline.
+
+        :param attribute_names: the list of wlst attribute names
+        :return: dictionary of wlst attribute name to value for the attributes that were read
+        """
+        return wlst_helper.get_attributes(attribute_names)
+
     def set(self, attribute_name, attribute_value, masked=False):
         """
         Set the configuration for the indicated attribute to the provided value.
@@ -108,6 +149,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'set'
+        self.__invalidate_list_cache()
 
         try:
             wlst_helper.set(attribute_name, attribute_value)
@@ -130,6 +172,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'set_with_cmo'
+        self.__invalidate_list_cache()
 
         try:
             wlst_helper.set_with_cmo(attribute_name, attribute_value, masked=masked)
@@ -153,6 +196,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'create'
+        self.__invalidate_list_cache(structure_changed=True)
 
         try:
             mbean = wlst_helper.create(wlst_name, wlst_type, base_provider_type)
@@ -175,6 +219,7 @@ class WlstHelper(object):
         :raises: PyWLSTException: if a WLST error occurs
         """
         _method_name = 'delete'
+        self.__invalidate_list_cache(structure_changed=True)
 
         try:
             wlst_helper.delete(wlst_name, wlst_type)
@@ -197,6 +242,10 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'create_and_cd'
+        if create_path is None:
+            self.__invalidate_list_cache(structure_changed=True)
+        else:
+            _get_list_cache().invalidate(_get_list_cache_path(create_path), structure_changed=True)
 
         try:
             if create_path is not None:
@@ -220,6 +269,12 @@ class WlstHelper(object):
         """
         _method_name = 'lsc'
 
+        cache = _get_list_cache()
+        cache_path = _get_list_cache_path(path)
+        result = cache.get(_LSC, cache_path)
+        if result is not None:
+            return list(result)
+
         try:
             result = wlst_helper.lsc(path=path, log_throwing=log_throwing)
         except PyWLSTException, pwe:
@@ -227,6 +282,8 @@ class WlstHelper(object):
                                                    pwe.getLocalizedMessage(), error=pwe)
             self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
             raise ex
+        if result is not None:
+            cache.put(_LSC, cache_path, list(result))
         return result
 
     def lsa(self, path=None, log_throwing=True):
@@ -239,6 +296,12 @@ class WlstHelper(object):
         """
         _method_name = 'lsa'
 
+        cache = _get_list_cache()
+        cache_path = _get_list_cache_path(path)
+        result = cache.get(_LSA, cache_path)
+        if result is not None:
+            return dict(result)
+
         try:
             result = wlst_helper.lsa(path=path, log_throwing=log_throwing)
         except PyWLSTException, pwe:
@@ -248,6 +311,7 @@ class WlstHelper(object):
                                                    pwe.getLocalizedMessage(), error=pwe)
             self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
             raise ex
+        cache.put(_LSA, cache_path, dict(result))
         return result
 
     def get_pwd(self):
@@ -267,6 +331,23 @@ class WlstHelper(object):
             raise ex
         return result
 
+    def get_current_path(self):
+        """
+        Get the current WLST directory path, without calling WLST when the location is already known.
+        :return: the WLST path
+        :raises: BundleAwareException of the specified type: if an error occurs
+        """
+        _method_name = 'get_current_path'
+
+        try:
+            result = wlst_helper.get_current_path()
+        except PyWLSTException, pwe:
+            ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19107',
+                                                   pwe.getLocalizedMessage(), error=pwe)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
+        return result
+
     def get_existing_object_list(self, wlst_path=None):
         """
         Get the existing directory list at the provided WLST path.
@@ -276,6 +357,12 @@ class WlstHelper(object):
         """
         _method_name = 'get_existing_object_list'
 
+        cache = _get_list_cache()
+        cache_path = _get_list_cache_path(wlst_path)
+        result = cache.get(_EXISTING_OBJECTS, cache_path)
+        if result is not None:
+            return list(result)
+
         try:
             result = wlst_helper.get_existing_object_list(wlst_path)
         except PyWLSTException, pwe:
@@ -283,6 +370,25 @@ class WlstHelper(object):
                                                    pwe.getLocalizedMessage(), error=pwe)
             self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
             raise ex
+        # an empty list is also returned for a directory that does not exist, so it is not cached
+        if result:
+            cache.put(_EXISTING_OBJECTS, cache_path, list(result))
+        return result
+
+    def get_existing_object_index(self, wlst_path):
+        """
+        Get the index of the existing MBean names at the provided WLST path, used to look up many names
+        at the same path without listing it each time.
+        :param wlst_path: the WLST path
+        :return: the ExistingObjectIndex for the path
+        :raises: BundleAwareException of the specified type: if an error occurs
+        """
+        cache = _get_list_cache()
+        cache_path = _get_list_cache_path(wlst_path)
+        result = cache.get_index(cache_path)
+        if result is None:
+            result = ExistingObjectIndex(self.get_existing_object_list(wlst_path))
+            cache.put_index(cache_path, result)
         return result
 
     def set_option_if_needed(self, option_name, option_value):
@@ -313,6 +419,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'set_server_groups'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.set_server_groups(server_name, server_groups_to_target)
@@ -355,6 +462,8 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'read_domain'
+        _get_list_cache().clear()
+        _get_list_cache().set_tree(_OFFLINE_TREE)
 
         try:
             wlst_helper.read_domain(domain_home)
@@ -371,6 +480,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'update_domain'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.update_domain()
@@ -404,6 +514,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'close_domain'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.close_domain()
@@ -421,6 +532,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'read_template'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.read_template(template_name)
@@ -438,6 +550,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'select_template'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.select_template(template_name)
@@ -455,6 +568,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'add_template'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.add_template(template_name)
@@ -471,6 +585,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'load_templates'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.load_templates()
@@ -487,6 +602,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'close_template'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.close_template()
@@ -503,6 +619,8 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'connect'
+        _get_list_cache().clear()
+        _get_list_cache().set_tree(_SERVER_CONFIG_TREE)
 
         try:
             wlst_helper.connect(admin_user, admin_pwd, admin_url)
@@ -519,6 +637,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'edit'
+        _get_list_cache().set_tree(_EDIT_TREE)
 
         try:
             wlst_helper.edit()
@@ -535,6 +654,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'start_edit'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.start_edit()
@@ -551,6 +671,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'stop_edit'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.stop_edit()
@@ -567,6 +688,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'undo'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.undo()
@@ -599,6 +721,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'activate'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.activate()
@@ -615,6 +738,7 @@ class WlstHelper(object):
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'disconnect'
+        _get_list_cache().clear()
 
         try:
             wlst_helper.disconnect()
@@ -645,6 +769,7 @@ class WlstHelper(object):
         :raises: CreateException: if an error occurs
         """
         _method_name = 'set_if_needed'
+        self.__invalidate_list_cache()
 
         if wlst_name is not None and wlst_value is not None:
             try:
@@ -758,6 +883,7 @@ class WlstHelper(object):
         :raises: BundleAwareException: if an error occurs
         """
         _method_name = 'start_application'
+        _get_list_cache().clear()
 
         try:
             result = wlst_helper.start_application(application_name, *args, **kwargs)
@@ -778,6 +904,7 @@ class WlstHelper(object):
         :raises: BundleAwareException: if an error occurs
         """
         _method_name = 'stop_application'
+        _get_list_cache().clear()
 
         try:
             result = wlst_helper.stop_application(application_name, *args, **kwargs)
@@ -798,6 +925,7 @@ class WlstHelper(object):
         :raises: BundleAwareException: if an error occurs
         """
         _method_name = 'deploy_application'
+        _get_list_cache().clear()
 
         try:
             result = wlst_helper.deploy_application(application_name, *args, **kwargs)
@@ -818,6 +946,7 @@ class WlstHelper(object):
         :raises: BundleAwareException: if an error occurs
         """
         _method_name = 'redeploy_application'
+        _get_list_cache().clear()
 
         try:
             result = wlst_helper.redeploy_application(application_name, args, kwargs)
@@ -838,6 +967,7 @@ class WlstHelper(object):
         :raises: BundleAwareException: if an error occurs
         """
         _method_name = 'undeploy_application'
+        _get_list_cache().clear()
 
         try:
             result = wlst_helper.redeploy_application(application_name, args, kwargs)
@@ -854,6 +984,7 @@ class WlstHelper(object):
         :raises: BundleAwareException: if an error occurs
         """
         _method_name = 'server_config'
+        _get_list_cache().set_tree(_SERVER_CONFIG_TREE)
 
         try:
             wlst_helper.server_config()
@@ -870,6 +1001,7 @@ class WlstHelper(object):
         :raises: BundleAwareException: if an error occurs
         """
         _method_name = 'domain_runtime'
+        _get_list_cache().set_tree(_DOMAIN_RUNTIME_TREE)
 
         try:
             wlst_helper.domain_runtime()
@@ -893,6 +1025,7 @@ class WlstHelper(object):
         :raises: BundleAwareException: if an error occurs
         """
         _method_name = 'domain_runtime'
+        _get_list_cache().set_tree(_CUSTOM_TREE)
 
         try:
             wlst_helper.custom()
@@ -902,3 +1035,215 @@ class WlstHelper(object):
             self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
             raise ex
         return
+
+    def get_list_cache_statistics(self):
+        """
+        Get the statistics for the cached lsa() and lsc() results of all threads.
+        :return: a dictionary with the hits and misses of the cache
+        """
+        hits = 0
+        misses = 0
+        _list_caches_lock.acquire()
+        try:
+            for cache in _list_caches:
+                hits += cache.hits
+                misses += cache.misses
+        finally:
+            _list_caches_lock.release()
+        return {'hits': hits, 'misses': misses}
+
+    def __invalidate_list_cache(self, structure_changed=False):
+        """
+        Remove the cached results for the current directory, before it is changed.
+        :param structure_changed: whether MBeans are created or deleted in the directory
+        """
+        try:
+            path = wlst_helper.get_current_path()
+        except PyWLSTException:
+            path = None
+        _get_list_cache().invalidate(path, structure_changed=structure_changed)
+        return
+
+
+class ExistingObjectIndex(object):
+    """
+    The names of the existing MBeans in a WLST directory, and the MBeans already looked up by name.
+    """
+
+    def __init__(self, names):
+        self._names = Set(names)
+        self._mbeans = dict()
+        return
+
+    def contains(self, name):
+        """
+        Determine if an MBean with the name exists.
+        :param name: the MBean name
+        :return: True if the MBean exists
+        """
+        return name in self._names
+
+    def get_mbean(self, name):
+        """
+        Get the MBean that was looked up for the name.
+        :param name: the MBean name
+        :return: the MBean, or None if it was not looked up yet
+        """
+        if name in self._mbeans:
+            return self._mbeans[name]
+        return None
+
+    def put_mbean(self, name, mbean):
+        """
+        Keep the MBean that was looked up for the name.
+        :param name: the MBean name
+        :param mbean: the MBean
+        """
+        self._mbeans[name] = mbean
+        return
+
+
+class _ListCache(object):
+    """
+    The cached lsa() and lsc() results of the WLST session of a thread, keyed by WLST tree, result type and path.
+    """
+
+    def __init__(self):
+        self.tree = _OFFLINE_TREE
+        self.hits = 0
+        self.misses = 0
+        self._entries = dict()
+        self._indexes = dict()
+        return
+
+    def set_tree(self, tree):
+        """
+        Set the WLST tree that the session changed to.
+        :param tree: the tree name
+        """
+        self.tree = tree
+        return
+
+    def get(self, ls_type, path):
+        """
+        Get the cached result.
+        :param ls_type: the result type, a, c or existing
+        :param path: the absolute path, or None if the path is not known
+        :return: the cached result, or None if it is not cached
+        """
+        if path is None or self.tree not in _CACHED_TREES:
+            return None
+        key = (self.tree, ls_type, path)
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, ls_type, path, result):
+        """
+        Cache the result.
+        :param ls_type: the result type, a, c or existing
+        :param path: the absolute path, or None if the path is not known
+        :param result: the result
+        """
+        if path is not None and self.tree in _CACHED_TREES:
+            self._entries[(self.tree, ls_type, path)] = result
+        return
+
+    def get_index(self, path):
+        """
+        Get the cached index of existing MBean names.
+        :param path: the absolute path, or None if the path is not known
+        :return: the cached ExistingObjectIndex, or None if it is not cached
+        """
+        if path is None or self.tree not in _CACHED_TREES:
+            return None
+        key = (self.tree, path)
+        if key in self._indexes:
+            return self._indexes[key]
+        return None
+
+    def put_index(self, path, index):
+        """
+        Cache the index of existing MBean names.
+        :param path: the absolute path, or None if the path is not known
+        :param index: the ExistingObjectIndex
+        """
+        if path is not None and self.tree in _CACHED_TREES:
+            self._indexes[(self.tree, path)] = index
+        return
+
+    def invalidate(self, path, structure_changed=False):
+        """
+        Remove the cached results for the directory, its parent and its subdirectories, in all trees.
+        :param path: the absolute path of the directory, or None to remove all the cached results
+        :param structure_changed: whether to also remove the name indexes for the directory and its subdirectories
+        """
+        if path is None:
+            self.clear()
+            return
+        parent = path[:path.rfind('/')]
+        if len(parent) == 0:
+            parent = '/'
+        prefix = path
+        if not prefix.endswith('/'):
+            prefix += '/'
+        for key in self._entries.keys():
+            key_path = key[2]
+            if key_path == path or key_path == parent or key_path.startswith(prefix):
+                del self._entries[key]
+        if structure_changed:
+            for key in self._indexes.keys():
+                key_path = key[1]
+                if key_path == path or key_path.startswith(prefix):
+                    del self._indexes[key]
+        return
+
+    def clear(self):
+        """
+        Remove all the cached results.
+        """
+        self._entries.clear()
+        self._indexes.clear()
+        return
+
+
+def _get_list_cache():
+    """
+    Get the cached lsa() and lsc() results of the current thread.
+    :return: the _ListCache for the thread
+    """
+    cache = _thread_list_cache.get()
+    if cache is None:
+        cache = _ListCache()
+        _thread_list_cache.set(cache)
+        _list_caches_lock.acquire()
+        try:
+            _list_caches.append(cache)
+        finally:
+            _list_caches_lock.release()
+    return cache
+
+
+def _get_list_cache_path(path):
+    """
+    Get the absolute path used to cache the results for the path.
+    :param path: the absolute or relative WLST path, or None for the current directory
+    :return: the absolute path without a trailing slash, or None if it cannot be determined
+    """
+    if path is None or not path.startswith('/'):
+        try:
+            current_path = wlst_helper.get_current_path()
+        except PyWLSTException:
+            return None
+        if path is None:
+            return current_path
+        if '..' in path or current_path is None:
+            return None
+        if not current_path.endswith('/'):
+            current_path += '/'
+        path = current_path + path
+    if len(path) > 1 and path.endswith('/'):
+        path = path[:-1]
+    return path
@@ -609,8 +609,9 @@ class Validator(object):
 
         _method_name = '__process_model_node'
 
-        valid_folder_keys = self._alias_helper.get_model_subfolder_names(validation_location)
-        valid_attr_infos = self._alias_helper.get_model_attribute_names_and_types(validation_location)
+        folder_descriptor = self._alias_helper.get_folder_descriptor(validation_location)
+        valid_folder_keys = folder_descriptor.get_subfolder_names()
+        valid_attr_infos = folder_descriptor.get_attribute_types()
         model_folder_path = self._alias_helper.get_model_folder_path(validation_location)
 
         self._logger.finest('5 model_node={0}', str(model_node), class_name=_class_name, method_name=_method_name)
@@ -660,8 +661,7 @@ class Validator(object):
                                                                    validation_result)
 
                 else:
-                    path_tokens_attr_keys = \
-                        self._alias_helper.get_model_uses_path_tokens_attribute_names(validation_location)
+                    path_tokens_attr_keys = folder_descriptor.get_uses_path_tokens_attribute_names()
 
                     validation_result = self.__validate_attribute(key,
                                                                   value,
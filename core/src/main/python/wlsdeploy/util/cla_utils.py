@@ -62,6 +62,7 @@ class CommandLineArgUtil(object):
     ATTRIBUTES_ONLY_SWITCH     = '-attributes_only'
     FOLDERS_ONLY_SWITCH        = '-folders_only'
     RECURSIVE_SWITCH           = '-recursive'
+    DISCOVER_ENGINE_SWITCH     = '-discover_engine'
     # overrides for the variable injector
     VARIABLE_INJECTOR_FILE_SWITCH   = '-variable_injector_file'
     VARIABLE_KEYWORDS_FILE_SWITCH   = '-variable_keywords_file'
@@ -336,6 +337,15 @@ class CommandLineArgUtil(object):
                     ex = self._get_out_of_args_exception(key)
                     self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
                     raise ex
+            elif self.is_discover_engine_switch(key):
+                idx += 1
+                if idx < args_len:
+                    self._validate_discover_engine_arg(args[idx])
+                    self._add_arg(key, args[idx].lower())
+                else:
+                    ex = self._get_out_of_args_exception(key)
+                    self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+                    raise ex
             elif self.is_attributes_only_switch(key):
                 self._add_arg(key, True)
             elif self.is_folders_only_switch(key):
@@ -882,6 +892,27 @@ class CommandLineArgUtil(object):
     def is_target_mode_switch(self, key):
         return self.TARGET_MODE_SWITCH == key
 
+    def get_discover_engine_switch(self):
+        return self.DISCOVER_ENGINE_SWITCH
+
+    def is_discover_engine_switch(self, key):
+        return self.DISCOVER_ENGINE_SWITCH == key
+
+    def _validate_discover_engine_arg(self, value):
+        method_name = '_validate_discover_engine_arg'
+
+        if value is None or len(value) == 0:
+            ex = exception_helper.create_cla_exception('WLSDPLY-01637')
+            ex.setExitCode(self.ARG_VALIDATION_ERROR_EXIT_CODE)
+            self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        elif value.lower() != 'wlst' and value.lower() != 'xml':
+            ex = exception_helper.create_cla_exception('WLSDPLY-01638', value)
+            ex.setExitCode(self.ARG_VALIDATION_ERROR_EXIT_CODE)
+            self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return
+
     def get_attributes_only_switch(self):
         return self.ATTRIBUTES_ONLY_SWITCH
 
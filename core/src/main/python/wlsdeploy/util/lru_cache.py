@@ -0,0 +1,124 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import threading
+
+# positions of the fields in each linked list entry
+_PREVIOUS = 0
+_NEXT = 1
+_KEY = 2
+_VALUE = 3
+
+
+class LruCache(object):
+    """
+    A bounded cache that evicts the least recently used entry when it is full.  The entries are kept in
+    a circular doubly-linked list so that lookups, insertions and evictions are constant time.
+    The cache counts the hits and misses of its lookups, and can be used by several threads.
+    """
+    def __init__(self, max_size):
+        """
+        Create a new cache.
+        :param max_size: the maximum number of entries kept in the cache
+        """
+        self._max_size = max_size
+        self._entries = dict()
+        self._root = [None, None, None, None]
+        self._root[_PREVIOUS] = self._root
+        self._root[_NEXT] = self._root
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        return
+
+    def get(self, key):
+        """
+        Get the value for the specified key, and mark it as the most recently used entry.
+        :param key: the key
+        :return: the value, or None if the key is not in the cache
+        """
+        self._lock.acquire()
+        try:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            entry = self._entries[key]
+            self.__unlink(entry)
+            self.__link_last(entry)
+            return entry[_VALUE]
+        finally:
+            self._lock.release()
+
+    def put(self, key, value):
+        """
+        Add or replace the value for the specified key, evicting the least recently used entry if the cache is full.
+        :param key: the key
+        :param value: the value
+        """
+        self._lock.acquire()
+        try:
+            if key in self._entries:
+                entry = self._entries[key]
+                entry[_VALUE] = value
+                self.__unlink(entry)
+            else:
+                if len(self._entries) >= self._max_size:
+                    oldest = self._root[_NEXT]
+                    self.__unlink(oldest)
+                    del self._entries[oldest[_KEY]]
+                entry = [None, None, key, value]
+                self._entries[key] = entry
+            self.__link_last(entry)
+        finally:
+            self._lock.release()
+        return
+
+    def clear(self):
+        """
+        Remove all entries from the cache.  The hit and miss counts are not reset.
+        """
+        self._lock.acquire()
+        try:
+            self._entries.clear()
+            self._root[_PREVIOUS] = self._root
+            self._root[_NEXT] = self._root
+        finally:
+            self._lock.release()
+        return
+
+    def get_hits(self):
+        """
+        Get the number of lookups that found the key in the cache.
+        :return: the hit count
+        """
+        return self._hits
+
+    def get_misses(self):
+        """
+        Get the number of lookups that did not find the key in the cache.
+        :return: the miss count
+        """
+        return self._misses
+
+    def size(self):
+        """
+        Get the number of entries in the cache.
+        :return: the number of entries
+        """
+        return len(self._entries)
+
+    def __unlink(self, entry):
+        entry[_PREVIOUS][_NEXT] = entry[_NEXT]
+        entry[_NEXT][_PREVIOUS] = entry[_PREVIOUS]
+        return
+
+    def __link_last(self, entry):
+        last = self._root[_PREVIOUS]
+        entry[_PREVIOUS] = last
+        entry[_NEXT] = self._root
+        last[_NEXT] = entry
+        self._root[_PREVIOUS] = entry
+        return
@@ -60,6 +60,7 @@ class ModelContext(object):
         self._recursive = False
         self._attributes_only = False
         self._folders_only = False
+        self._discover_engine = 'wlst'
 
         if CommandLineArgUtil.ORACLE_HOME_SWITCH in arg_map:
             self._oracle_home = arg_map[CommandLineArgUtil.ORACLE_HOME_SWITCH]
@@ -108,6 +109,9 @@ class ModelContext(object):
         if CommandLineArgUtil.RECURSIVE_SWITCH in arg_map:
             self._recursive = arg_map[CommandLineArgUtil.RECURSIVE_SWITCH]
 
+        if CommandLineArgUtil.DISCOVER_ENGINE_SWITCH in arg_map:
+            self._discover_engine = arg_map[CommandLineArgUtil.DISCOVER_ENGINE_SWITCH]
+
         if CommandLineArgUtil.VARIABLE_FILE_SWITCH in arg_map:
             self._variable_file_name = arg_map[CommandLineArgUtil.VARIABLE_FILE_SWITCH]
 
@@ -271,6 +275,14 @@ class ModelContext(object):
         """
         return self._archive_file
 
+    def set_archive_file(self, archive_file):
+        """
+        Set the archive file.
+        :param archive_file: the archive file
+        """
+        self._archive_file = archive_file
+        return
+
     def get_model_file(self):
         """
         Get the model file.
@@ -316,6 +328,13 @@ class ModelContext(object):
         """
         return self._recursive
 
+    def get_discover_engine(self):
+        """
+        Get the engine used to discover the domain offline.
+        :return: wlst to walk the domain with WLST, or xml to read the domain configuration files
+        """
+        return self._discover_engine
+
     def get_variable_file(self):
         """
         Get the variable file.
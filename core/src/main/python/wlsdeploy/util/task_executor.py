@@ -0,0 +1,175 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+A small pool of worker threads used to run independent tool tasks concurrently.
+"""
+import sys
+import threading
+
+from java.lang import Runtime
+from java.lang import Thread
+from java.util.concurrent import Callable
+from java.util.concurrent import Executors
+from java.util.concurrent import ThreadFactory
+
+
+class TaskExecutor(object):
+    """
+    Run Python functions on a fixed number of daemon worker threads.  The daemon threads never
+    prevent the tool from exiting, so tasks that are not waited for are simply abandoned at exit.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix):
+        """
+        Create the executor and its worker threads.
+        :param max_workers: the maximum number of worker threads
+        :param thread_name_prefix: the prefix of the worker thread names
+        """
+        self._executor = Executors.newFixedThreadPool(max_workers, _DaemonThreadFactory(thread_name_prefix))
+        return
+
+    def submit(self, function, *args):
+        """
+        Submit a function call to be run on a worker thread.
+        :param function: the function to call
+        :param args: the arguments of the function call
+        :return: the Task for the call, used to get its result
+        """
+        task = Task(function, args)
+        task.set_future(self._executor.submit(task))
+        return task
+
+    def shutdown(self):
+        """
+        Stop accepting new tasks.  The tasks already submitted continue to run.
+        """
+        self._executor.shutdown()
+        return
+
+
+class Task(Callable):
+    """
+    A function call submitted to a TaskExecutor.
+    """
+
+    def __init__(self, function, args):
+        self._function = function
+        self._args = args
+        self._future = None
+        self._result = None
+        self._error = None
+        return
+
+    def set_future(self, future):
+        self._future = future
+        return
+
+    def call(self):
+        """
+        Run the function call, keeping its result or error for get_result().  This method is called
+        by the worker thread.
+        """
+        try:
+            self._result = self._function(*self._args)
+        except:
+            self._error = sys.exc_info()
+        return None
+
+    def wait(self):
+        """
+        Wait for the function call to complete.
+        """
+        self._future.get()
+        return
+
+    def get_result(self):
+        """
+        Wait for the function call to complete and get its result.
+        :return: the value returned by the function
+        :raises: the exception raised by the function, if any
+        """
+        self.wait()
+        if self._error is not None:
+            raise self._error[0], self._error[1], self._error[2]
+        return self._result
+
+
+def get_results(tasks):
+    """
+    Wait for all the tasks to complete and get their results, in the order of the tasks.  All tasks
+    are allowed to complete before the first error, in task order, is raised.
+    :param tasks: the list of tasks
+    :return: the list of task results
+    :raises: the exception raised by the first failed task, if any
+    """
+    for task in tasks:
+        task.wait()
+
+    results = list()
+    for task in tasks:
+        results.append(task.get_result())
+    return results
+
+
+def get_default_worker_count():
+    """
+    Get the default number of worker threads, which is the number of available processors.
+    :return: the number of worker threads
+    """
+    return Runtime.getRuntime().availableProcessors()
+
+
+class SynchronizedObject(object):
+    """
+    Forward the method calls of several threads to an object that is not thread-safe, one call at a time.
+    Attributes that are not methods are returned as they are.
+    """
+
+    def __init__(self, target):
+        """
+        Wrap the target object.
+        :param target: the object that is not thread-safe
+        """
+        self._target = target
+        self._lock = threading.RLock()
+        return
+
+    def get_target(self):
+        """
+        Get the wrapped object.
+        :return: the target object
+        """
+        return self._target
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if not callable(value):
+            return value
+
+        lock = self._lock
+
+        def synchronized_method(*args, **kwargs):
+            lock.acquire()
+            try:
+                return value(*args, **kwargs)
+            finally:
+                lock.release()
+        return synchronized_method
+
+
+class _DaemonThreadFactory(ThreadFactory):
+    """
+    Create named daemon threads for the executor.
+    """
+
+    def __init__(self, thread_name_prefix):
+        self._thread_name_prefix = thread_name_prefix
+        self._thread_count = 0
+        return
+
+    def newThread(self, runnable):
+        self._thread_count += 1
+        thread = Thread(runnable, '%s-%d' % (self._thread_name_prefix, self._thread_count))
+        thread.setDaemon(True)
+        return thread
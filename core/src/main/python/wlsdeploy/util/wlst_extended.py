@@ -7,6 +7,7 @@ import wlstModule as wlst
 
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import wlst_helper
 
 _logger = PlatformLogger('wlsdeploy.wlst')
 _class_name = 'wlst_extended'
@@ -28,6 +29,7 @@ def apply_jrf(jrf_target, domain_dir, should_update=False):
     _method_name = 'apply_jrf'
     _logger.finest('WLSDPLY-00073', jrf_target, domain_dir, class_name=_class_name, method_name=_method_name)
     applyJRF = _load_global('applyJRF')
+    wlst_helper.clear_current_path()
     try:
         applyJRF(jrf_target, domainDir=domain_dir, shouldUpdateDomain=should_update)
     except (wlst.WLSTException, offlineWLSTException, Exception), e:
@@ -3,8 +3,12 @@ Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 import com.oracle.cie.domain.script.jython.WLSTException as offlineWLSTException
+from java.lang import Exception as JException
+from java.lang import String
+from java.lang import ThreadLocal
+from org.python.modules import jarray
 
-import wlstModule as wlst
+import wlstModule
 
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
@@ -13,6 +17,68 @@ from oracle.weblogic.deploy.util import PyWLSTException
 _logger = PlatformLogger('wlsdeploy.wlst')
 _class_name = 'wlst_helper'
 
+# Whether ls() can list a path other than the current location, or None if it has not been checked yet
+_path_ls_supported = None
+
+
+class _WlstModuleSession(object):
+    """
+    The WLST session of the interpreter running the tool, used by all threads that have no session of their own.
+    """
+
+    def __init__(self):
+        # The WLST location in get_pwd() format, as tracked from the cd() calls made through this module,
+        # or None if it is not known.  Any function that may move WLST to another location clears it.
+        self.current_path = None
+        return
+
+    def __getattr__(self, name):
+        return getattr(wlstModule, name)
+
+
+class WlstSession(object):
+    """
+    A separate WLST interpreter, with its own connection and location.  A thread that calls set_thread_session()
+    with a WlstSession runs all the functions of this module in that interpreter, so that several threads can
+    use WLST online at the same time.
+    """
+
+    def __init__(self):
+        from weblogic.management.scripting.utils import WLSTInterpreter
+        self._interpreter = WLSTInterpreter()
+        self.current_path = None
+        return
+
+    def __getattr__(self, name):
+        namespace = self._interpreter.getLocals()
+        if namespace.has_key(name):
+            return namespace[name]
+        # classes such as the WLST exceptions are the same in every interpreter
+        return getattr(wlstModule, name)
+
+
+class _WlstProxy(object):
+    """
+    Resolve the WLST names used by this module in the WLST session of the current thread.
+    """
+
+    def __getattr__(self, name):
+        return getattr(_get_session(), name)
+
+
+_default_session = _WlstModuleSession()
+_thread_session = ThreadLocal()
+wlst = _WlstProxy()
+
+
+def set_thread_session(session):
+    """
+    Run the functions of this module called by the current thread in the specified WLST session.
+    :param session: the WlstSession for the thread, or None to use the WLST session of the tool again
+    """
+    _thread_session.set(session)
+    return
+
 
 def assign(source_type, source_name, target_type, target_name):
     """
@@ -52,11 +118,24 @@ def cd(path):
     _method_name = 'cd'
     _logger.finest('WLSDPLY-00001', path, class_name=_class_name, method_name=_method_name)
 
+    session = _get_session()
+    target_path = _normalize_path(path)
+    if target_path is not None and target_path == session.current_path:
+        _logger.finest('WLSDPLY-00074', path, class_name=_class_name, method_name=_method_name)
+        return get_cmo()
+
+    # a descendant of the current location is reached with a relative path, so WLST does not walk from the root
+    wlst_path = _get_relative_path(session.current_path, target_path)
+    if wlst_path is None:
+        wlst_path = path
+
     try:
-        result = wlst.cd(path)
+        result = wlst.cd(wlst_path)
     except (wlst.WLSTException, offlineWLSTException), e:
+        session.current_path = None
         raise exception_helper.create_pywlst_exception('WLSDPLY-00002', path, _get_exception_mode(e),
                                                        _format_exception(e), error=e)
+    session.current_path = target_path
     _logger.finest('WLSDPLY-00003', path, result, class_name=_class_name, method_name=_method_name)
     return result
 
@@ -83,6 +162,36 @@ def get(attribute):
     return result
 
 
+def get_attributes(attributes):
+    """
+    Return the values of the attributes at the current location, read with a single JMX getAttributes()
+    call on the current MBean instead of one get() call per attribute.  This is only done when connected.
+    The result contains no entry for an attribute that could not be read in bulk, and is empty if the
+    bulk read failed or WLST is offline, so the caller should use get() for any attribute not in the result.
+
+    :param attributes: the list of wlst attribute names
+    :return: dictionary of wlst attribute name to value for the attributes that were read
+    """
+    _method_name = 'get_attributes'
+    _logger.finest('WLSDPLY-00076', attributes, class_name=_class_name, method_name=_method_name)
+
+    result = dict()
+    if attributes is None or len(attributes) == 0 or not is_connected():
+        return result
+
+    try:
+        object_name = get_cmo().getObjectName()
+        attribute_list = wlst.mbs.getAttributes(object_name, jarray.array(attributes, String))
+        for attribute in attribute_list:
+            result[attribute.getName()] = attribute.getValue()
+    except (PyWLSTException, JException, AttributeError), e:
+        _logger.finer('WLSDPLY-00077', attributes, _format_exception(e), class_name=_class_name,
+                      method_name=_method_name)
+        result = dict()
+    _logger.finest('WLSDPLY-00078', len(result), len(attributes), class_name=_class_name, method_name=_method_name)
+    return result
+
+
 def set(attribute, value):
     """
     Set the configuration for the indicated attribute to the provided value.
@@ -305,11 +414,14 @@ def path_exists(path):
     _logger.finest('WLSDPLY-00025', path, class_name=_class_name, method_name=_method_name)
 
     exists = True
-    try:
-        wlst.ls(path)
-    except (wlst.WLSTException, offlineWLSTException), e:
-        _logger.finest('WLSDPLY-00026', path, e.getLocalizedMessage(), class_name=_class_name, method_name=_method_name)
-        exists = False
+    current_path = _get_session().current_path
+    if current_path is None or _normalize_path(path) != current_path:
+        try:
+            wlst.ls(path)
+        except (wlst.WLSTException, offlineWLSTException), e:
+            _logger.finest('WLSDPLY-00026', path, e.getLocalizedMessage(), class_name=_class_name,
+                           method_name=_method_name)
+            exists = False
     _logger.finest('WLSDPLY-00027', path, exists, class_name=_class_name, method_name=_method_name)
     return exists
 
@@ -327,10 +439,20 @@ def _ls(method_name, ls_type, path=None, log_throwing=True):
     _method_name = method_name
     _logger.finest('WLSDPLY-00028', method_name, ls_type, path, class_name=_class_name, method_name=_method_name)
 
-    if path is not None:
+    result = None
+    if path is not None and _is_path_ls_supported():
+        current_path = path
+        try:
+            result = wlst.ls(path, returnMap='true', returnType=ls_type)
+        except (wlst.WLSTException, offlineWLSTException), e:
+            _logger.finest('WLSDPLY-00075', path, ls_type, _format_exception(e), class_name=_class_name,
+                           method_name=_method_name)
+
+    if path is not None and result is None:
         # ls(path, returnMap='true') is busted in earlier versions of WLST so go ahead and
-        # change directories to the specified path to workaround this
-        current_path = get_pwd()
+        # change directories to the specified path to workaround this.  The cd() calls are
+        # skipped when the path is already the current location.
+        current_path = get_current_path()
         cd(path)
         try:
             result = wlst.ls(ls_type, returnMap='true', returnType=ls_type)
@@ -342,8 +464,10 @@ def _ls(method_name, ls_type, path=None, log_throwing=True):
             cd(current_path)
             raise pwe
         cd(current_path)
-    else:
-        current_path = get_pwd()
+        if ls_type == 'c' and _path_ls_supported is None:
+            _check_path_ls(path, current_path, result)
+    elif path is None:
+        current_path = get_current_path()
         try:
             result = wlst.ls(ls_type, returnMap='true', returnType=ls_type)
         except (wlst.WLSTException, offlineWLSTException), e:
@@ -410,10 +534,20 @@ def get_pwd():
         path = path[second_slash:]
     else:
         path = '/'
+    _get_session().current_path = _normalize_path(path)
     _logger.finest('WLSDPLY-00035', path, class_name=_class_name, method_name=_method_name)
     return path
 
 
+def clear_current_path():
+    """
+    Forget the tracked WLST location, so that the next cd() is always passed to WLST.  Call this after
+    running a WLST command outside of this module that may change the current location.
+    """
+    _get_session().current_path = None
+    return
+
+
 def get_cmo():
     """
     update the Current Management Object (cmo) to current mbean in wlst.
@@ -458,7 +592,7 @@ def get_mbean_for_wlst_path(path):
     _method_name = 'get_mbean_for_wlst_path'
     _logger.entering(path, class_name=_class_name, method_name=_method_name)
 
-    current_dir = get_pwd()
+    current_dir = get_current_path()
     the_object = cd(path)
     cd(current_dir)
     _logger.exiting(_class_name, _method_name, the_object)
@@ -474,6 +608,7 @@ def read_template(template):
     _method_name = 'read_template'
     _logger.entering(template, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.readTemplate(template)
     except offlineWLSTException, e:
@@ -492,6 +627,7 @@ def add_template(template):
     _method_name = 'add_template'
     _logger.entering(template, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.addTemplate(template)
     except offlineWLSTException, e:
@@ -509,6 +645,7 @@ def close_template():
     _method_name = 'close_template'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.closeTemplate()
     except offlineWLSTException, e:
@@ -528,6 +665,7 @@ def select_template(template):
     _method_name = 'select_template'
     _logger.entering(template, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.selectTemplate(template)
     except offlineWLSTException, e:
@@ -545,6 +683,7 @@ def load_templates():
     _method_name = 'load_templates'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.loadTemplates()
     except offlineWLSTException, e:
@@ -563,6 +702,7 @@ def read_domain(domain_home):
     _method_name = 'read_domain'
     _logger.entering(domain_home, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.readDomain(domain_home)
     except offlineWLSTException, e:
@@ -582,6 +722,7 @@ def write_domain(domain_home):
     _method_name = 'write_domain'
     _logger.entering(domain_home, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.setOption('OverwriteDomain', 'true')
     except offlineWLSTException, e:
@@ -606,6 +747,7 @@ def update_domain():
     _method_name = 'update_domain'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.updateDomain()
     except offlineWLSTException, e:
@@ -623,6 +765,7 @@ def close_domain():
     _method_name = 'close_domain'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.closeDomain()
     except offlineWLSTException, e:
@@ -655,6 +798,7 @@ def connect(username, password, url):
     _method_name = 'connect'
     _logger.entering(username, url, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.connect(username=username, password=password, url=url)
     except (wlst.WLSTException, offlineWLSTException), e:
@@ -673,6 +817,7 @@ def disconnect():
     _method_name = 'disconnect'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.disconnect()
     except wlst.WLSTException, e:
@@ -690,6 +835,7 @@ def edit():
     _method_name = 'edit'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.edit()
     except wlst.WLSTException, e:
@@ -707,6 +853,7 @@ def start_edit():
     _method_name = 'start_edit'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.startEdit()
     except wlst.WLSTException, e:
@@ -724,6 +871,7 @@ def stop_edit():
     _method_name = 'stop_edit'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.stopEdit('y')
     except wlst.WLSTException, e:
@@ -741,6 +889,7 @@ def undo():
     _method_name = 'undo'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.undo('true', 'y')
     except wlst.WLSTException, e:
@@ -758,6 +907,7 @@ def save():
     _method_name = 'save'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.save()
     except wlst.WLSTException, e:
@@ -775,6 +925,7 @@ def activate():
     _method_name = 'activate'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         wlst.activate()
     except wlst.WLSTException, e:
@@ -804,7 +955,7 @@ def get_existing_object_list(wlst_objects_path):
     """
     _method_name = 'get_existing_object_list'
     _logger.finest('WLSDPLY-00054', wlst_objects_path, class_name=_class_name, method_name=_method_name)
-    current_dir = get_pwd()
+    current_dir = get_current_path()
 
     try:
         result = lsc(wlst_objects_path, log_throwing=False)
@@ -828,6 +979,7 @@ def start_application(application_name, *args, **kwargs):
     _method_name = 'start_application'
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         result = wlst.startApplication(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
@@ -851,6 +1003,7 @@ def stop_application(application_name, *args, **kwargs):
     _method_name = 'stop_application'
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         result = wlst.stopApplication(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
@@ -874,6 +1027,7 @@ def deploy_application(application_name, *args, **kwargs):
     _method_name = 'deploy_application'
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         result = wlst.deploy(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
@@ -897,6 +1051,7 @@ def undeploy_application(application_name, *args, **kwargs):
     _method_name = 'undeploy_application'
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         result = wlst.undeploy(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
@@ -920,6 +1075,7 @@ def redeploy_application(application_name, *args, **kwargs):
     _method_name = 'redeploy_application'
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
+    clear_current_path()
     try:
         result = wlst.redeploy(application_name, *args, **kwargs)
     except wlst.WLSTException, e:
@@ -1016,6 +1172,7 @@ def server_config():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'server_config'
+    clear_current_path()
     try:
         wlst.serverConfig()
     except wlst.WLSTException, e:
@@ -1032,6 +1189,7 @@ def domain_runtime():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'domain_runtime'
+    clear_current_path()
     try:
         wlst.domainRuntime()
     except wlst.WLSTException, e:
@@ -1048,6 +1206,7 @@ def custom():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'custom'
+    clear_current_path()
     try:
         wlst.custom()
     except wlst.WLSTException, e:
@@ -1100,11 +1259,115 @@ def _cd_back(return_directory):
     """
     if return_directory is not None:
         try:
-            wlst.cd(return_directory)
-        except (wlst.WLSTException, offlineWLSTException), ex:
+            cd(return_directory)
+        except PyWLSTException, ex:
             _logger.warning('WLSDPLY-00068', return_directory, ex.getLocalizedMessage(), error=ex)
 
 
+def _normalize_path(path):
+    """
+    Get the path in the format returned by get_pwd(), so that it can be compared with the tracked location.
+    :param path: the WLST path
+    :return: the path without a trailing slash, or None if the path is not absolute
+    """
+    if path is None or not path.startswith('/'):
+        return None
+    if len(path) > 1 and path.endswith('/'):
+        path = path[:-1]
+    return path
+
+
+def _get_relative_path(current_path, target_path):
+    """
+    Get the path of the target location relative to the current location, if the target is below it.
+    :param current_path: the tracked current location, or None if it is not known
+    :param target_path: the normalized target path, or None if it is not absolute
+    :return: the relative path, or None if the target is not below the current location
+    """
+    if current_path is None or target_path is None:
+        return None
+    if current_path == '/':
+        prefix = current_path
+    else:
+        prefix = current_path + '/'
+    if len(target_path) > len(prefix) and target_path.startswith(prefix):
+        return target_path[len(prefix):]
+    return None
+
+
+def get_current_path():
+    """
+    Get the current WLST location, using the tracked location to avoid a pwd() call when it is known.
+    :return: the current location, in get_pwd() format
+    :raises: PyWLSTException: if a WLST error occurs
+    """
+    current_path = _get_session().current_path
+    if current_path is not None:
+        return current_path
+    return get_pwd()
+
+
+def _get_session():
+    """
+    Get the WLST session used by the current thread.
+    :return: the session set for the thread, or the WLST session of the tool
+    """
+    session = _thread_session.get()
+    if session is None:
+        return _default_session
+    return session
+
+
+def _is_path_ls_supported():
+    """
+    Determine if ls() is known to return the map for a path other than the current location.  Until this has
+    been checked by _check_path_ls(), the path is changed to first.
+    :return: True if ls() can be called with a path, False otherwise
+    """
+    return _path_ls_supported is True
+
+
+def _check_path_ls(path, current_path, expected):
+    """
+    Check whether ls() can list a path other than the current location, by listing the child folders of the path
+    from the current location and comparing them with the folders listed after changing to the path.  Earlier
+    versions of WLST list the current location instead, or fail.  The check is only conclusive when the path is
+    not the current location and has child folders, otherwise it is left for a later listing.
+    :param path: the path that was listed
+    :param current_path: the current location, in get_pwd() format
+    :param expected: the child folders listed after changing to the path
+    """
+    global _path_ls_supported
+    _method_name = '_check_path_ls'
+
+    if not expected or _normalize_path(path) is None or _normalize_path(path) == _normalize_path(current_path):
+        return
+
+    try:
+        result = wlst.ls(path, returnMap='true', returnType='c')
+        supported = result is not None and _get_sorted_names(result) == _get_sorted_names(expected)
+    except (wlst.WLSTException, offlineWLSTException, TypeError), e:
+        _logger.finest('WLSDPLY-00075', path, 'c', _format_exception(e), class_name=_class_name,
+                       method_name=_method_name)
+        supported = False
+
+    # listing the path must not move the current location
+    if get_pwd() != current_path:
+        supported = False
+        cd(current_path)
+    _path_ls_supported = supported
+    _logger.fine('WLSDPLY-00079', supported, path, class_name=_class_name, method_name=_method_name)
+    return
+
+
+def _get_sorted_names(names):
+    result = list()
+    for name in names:
+        result.append(str(name))
+    result.sort()
+    return result
+
+
 def _get_wlst_mode():
     """
     Get the text to describe the current WLST mode.
@@ -1125,7 +1388,7 @@ def get_mbi(path=None):
     """
     current_path = None
     if path is not None:
-        current_path = get_pwd()
+        current_path = get_current_path()
         cd(path)
 
     result = wlst.getMBI()
@@ -289,4 +289,23 @@ public class VersionUtilsTest {
         answer = VersionUtils.isVersionInRange(VERSION_18, RANGE_BETWEEN_1212_AND_12213);
         Assert.assertFalse("expected " + VERSION_18 + " to not be in range " + RANGE_BETWEEN_1212_AND_12213, answer);
     }
+
+    @Test
+    public void testGetVersionRange() throws Exception {
+        VersionRange range = VersionUtils.getVersionRange(RANGE_BETWEEN_1212_AND_12213);
+        Assert.assertSame(range, VersionUtils.getVersionRange(RANGE_BETWEEN_1212_AND_12213));
+        Assert.assertEquals("12.1.1", range.getLowerVersion());
+        Assert.assertEquals("12.2.1.3", range.getUpperVersion());
+        Assert.assertFalse(range.includes(VERSION_1211));
+        Assert.assertTrue(range.includes(VERSION_12213));
+
+        range = VersionUtils.getVersionRange(RANGE_ALL_VERSIONS);
+        Assert.assertNull(range.getUpperVersion());
+        Assert.assertTrue(range.includes(VERSION_18));
+
+        range = VersionUtils.getVersionRange("[" + VERSION_1213 + "]");
+        Assert.assertTrue(range.isSingleVersion());
+        Assert.assertTrue(range.includes(VERSION_1213));
+        Assert.assertFalse(range.includes(VERSION_1221));
+    }
 }
@@ -5,6 +5,9 @@
 package oracle.weblogic.deploy.util;
 
 import java.io.File;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.attribute.PosixFilePermissions;
 import java.text.MessageFormat;
 
 import org.junit.Assert;
@@ -48,6 +51,7 @@ public class FileUtilsTest {
     private static final String ARCHIVE_FILE_NAME = "src/test/resources/DemoDomain.zip";
     private static final String APP_PATH = "wlsdeploy/applications/simpleear.ear";
     private static final String APP_FILE_NAME = "src/test/resources/simpleear.ear";
+    private static final String PRIVATE_DIR_NAME = "target/unit-tests/private-dir";
 
     @Test
     public void testNormalFile_parseFileName() throws Exception {
@@ -104,6 +108,36 @@ public class FileUtilsTest {
         Assert.assertEquals(appHash, archiveHash);
     }
 
+    @Test
+    public void testGetResourceJarFile() throws Exception {
+        File jarFile = FileUtils.getResourceJarFile("org/junit/Test.class");
+        Assert.assertNotNull(jarFile);
+        Assert.assertTrue(jarFile.isFile());
+        Assert.assertTrue(jarFile.getName().endsWith(".jar"));
+
+        Assert.assertNull(FileUtils.getResourceJarFile("oracle/weblogic/deploy/util/FileUtils.class"));
+        Assert.assertNull(FileUtils.getResourceJarFile("no/such/resource.txt"));
+    }
+
+    @Test
+    public void testPrivateDirectory() throws Exception {
+        File parent = new File(PRIVATE_DIR_NAME);
+        FileUtils.deleteDirectory(parent);
+        File directory = new File(parent, "child");
+        Assert.assertTrue(FileUtils.createPrivateDirectory(directory));
+        Assert.assertTrue(directory.isDirectory());
+        Assert.assertTrue(FileUtils.isPrivateDirectory(directory));
+        Assert.assertTrue(FileUtils.isPrivateDirectory(parent));
+        Assert.assertFalse(FileUtils.isPrivateDirectory(new File(parent, "missing")));
+
+        Path path = directory.toPath();
+        if (path.getFileSystem().supportedFileAttributeViews().contains("posix")) {
+            Assert.assertEquals(PosixFilePermissions.fromString("rwx------"), Files.getPosixFilePermissions(path));
+            Files.setPosixFilePermissions(path, PosixFilePermissions.fromString("rwxrwxrwx"));
+            Assert.assertFalse(FileUtils.isPrivateDirectory(directory));
+        }
+    }
+
 
     private void assertMatch(String name, String got, String expected) {
         Assert.assertTrue(MessageFormat.format(FILE_ERR_FORMAT, name, got, expected),
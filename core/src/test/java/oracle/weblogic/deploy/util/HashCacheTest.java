@@ -0,0 +1,96 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * The Universal Permissive License (UPL), Version 1.0
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.File;
+
+import org.junit.Assert;
+import org.junit.Before;
+import org.junit.Test;
+
+public class HashCacheTest {
+    private static final String UNIT_TEST_TARGET_DIR = "target" + File.separator + "unit-tests";
+    private static final String APP_FILE_NAME = "src/test/resources/simpleear.ear";
+
+    private File cacheFile;
+
+    @Before
+    public void init() {
+        File folder = new File(UNIT_TEST_TARGET_DIR);
+        if (!folder.exists()) {
+            Assert.assertTrue("Could not create directory " + folder.getPath(), folder.mkdirs());
+        }
+        cacheFile = new File(folder, "hash-cache-test.properties");
+        if (cacheFile.exists()) {
+            Assert.assertTrue("Could not delete file " + cacheFile.getPath(), cacheFile.delete());
+        }
+    }
+
+    @Test
+    public void testFileHashIsPersisted() {
+        HashCache hashCache = new HashCache(cacheFile);
+        Assert.assertNull(hashCache.getFileHash("/apps/app.ear", 100, 200));
+
+        hashCache.putFileHash("/apps/app.ear", 100, 200, "abc=");
+        Assert.assertEquals("abc=", hashCache.getFileHash("/apps/app.ear", 100, 200));
+        Assert.assertFalse(cacheFile.exists());
+
+        hashCache.flush();
+        Assert.assertTrue(cacheFile.isFile());
+
+        HashCache reloadedCache = new HashCache(cacheFile);
+        Assert.assertEquals("abc=", reloadedCache.getFileHash("/apps/app.ear", 100, 200));
+        Assert.assertNull(reloadedCache.getFileHash("/apps/app.ear", 101, 200));
+        Assert.assertNull(reloadedCache.getFileHash("/apps/app.ear", 100, 201));
+    }
+
+    @Test
+    public void testFlushWritesOnlyNewHashes() {
+        HashCache hashCache = new HashCache(cacheFile);
+        hashCache.putFileHash("/apps/app.ear", 100, 200, "abc=");
+        hashCache.flush();
+        Assert.assertTrue(cacheFile.delete());
+
+        // storing the same hash again does not need another write
+        hashCache.putFileHash("/apps/app.ear", 100, 200, "abc=");
+        hashCache.flush();
+        Assert.assertFalse(cacheFile.exists());
+    }
+
+    @Test
+    public void testArchiveEntryHashUsesCrcAndSize() {
+        HashCache hashCache = new HashCache(cacheFile);
+        hashCache.putArchiveEntryHash("/archive.zip", "wlsdeploy/applications/app.ear", 12345, 100, "def=");
+
+        Assert.assertEquals("def=",
+            hashCache.getArchiveEntryHash("/archive.zip", "wlsdeploy/applications/app.ear", 12345, 100));
+        Assert.assertNull(hashCache.getArchiveEntryHash("/archive.zip", "wlsdeploy/applications/app.ear", 12346, 100));
+        Assert.assertNull(hashCache.getArchiveEntryHash("/other.zip", "wlsdeploy/applications/app.ear", 12345, 100));
+    }
+
+    @Test
+    public void testDisabledCache() {
+        HashCache hashCache = new HashCache(null);
+        hashCache.putFileHash("/apps/app.ear", 100, 200, "abc=");
+        Assert.assertNull(hashCache.getFileHash("/apps/app.ear", 100, 200));
+        hashCache.flush();
+    }
+
+    @Test
+    public void testStreamingHashMatchesByteArrayHash() throws Exception {
+        File appFile = FileUtils.getCanonicalFile(new File(APP_FILE_NAME));
+        byte[] appBytes = FileUtils.readFileToByteArray(appFile);
+        Assert.assertEquals(FileUtils.computeHash(appBytes), FileUtils.computeHash(appFile));
+    }
+
+    @Test
+    public void testCachedHashMatchesHash() throws Exception {
+        File appFile = FileUtils.getCanonicalFile(new File(APP_FILE_NAME));
+        String expected = FileUtils.computeHash(appFile);
+        Assert.assertEquals(expected, FileUtils.computeHashCached(appFile));
+        // the second call may use the cached hash
+        Assert.assertEquals(expected, FileUtils.computeHashCached(appFile.getPath()));
+    }
+}
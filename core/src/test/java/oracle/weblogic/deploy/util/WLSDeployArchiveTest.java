@@ -8,6 +8,10 @@ import java.io.File;
 import java.io.FileInputStream;
 import java.io.FileOutputStream;
 import java.io.IOException;
+import java.io.InputStream;
+import java.util.Properties;
+import java.util.zip.ZipEntry;
+import java.util.zip.ZipFile;
 
 import org.junit.Assert;
 import org.junit.Before;
@@ -34,6 +38,8 @@ public class WLSDeployArchiveTest {
     private static final String APP_DIR_ENTRY_NAME = "wlsdeploy/applications/my-app/";
     private static final String INVALID_DIR_ENTRY_NAME = "wlsdeploy/applications/does-not-exist/";
 
+    private static final String DIGEST_ARCHIVE_FILE_NAME = "target/unit-tests/digestArchive.zip";
+
     private static final String ZIP_FILE_EXISTING_EMPTY_FILE = "my-empty-zip.zip";
     private static final String ZIP_FILE_EXISTING_BINARIES_FILE = "DiscoveredDemoDomain.zip";
     private static final String EMPTY_MODEL_ZIP_TARGET_NAME = WLSDeployZipFileTest.UNIT_TEST_TARGET_DIR +
@@ -136,4 +142,36 @@ public class WLSDeployArchiveTest {
         Assert.assertFalse("expected appName to be not empty", StringUtils.isEmpty(appName));
         archive.close();
     }
+
+    @Test
+    public void testDigestManifest() throws Exception {
+        File archiveFile = new File(DIGEST_ARCHIVE_FILE_NAME);
+        if (archiveFile.exists()) {
+            Assert.assertTrue("expected archive file to be deleted", archiveFile.delete());
+        }
+
+        WLSDeployArchive archive = new WLSDeployArchive(DIGEST_ARCHIVE_FILE_NAME);
+        String appName = archive.addApplication(new File(APP1_TO_ADD));
+        archive.close();
+
+        archive = new WLSDeployArchive(DIGEST_ARCHIVE_FILE_NAME);
+        Assert.assertTrue("expected digest manifest in archive",
+            archive.containsFile(WLSDeployArchive.ARCHIVE_DIGEST_MANIFEST));
+        Assert.assertEquals("unexpected hash for " + appName, FileUtils.computeHash(APP1_TO_ADD),
+            archive.getFileHash(appName));
+        archive.close();
+
+        // the manifest records the uncompressed size and CRC of the entry with its hash
+        try (ZipFile zipFile = new ZipFile(archiveFile)) {
+            Properties manifest = new Properties();
+            try (InputStream inputStream = zipFile.getInputStream(
+                zipFile.getEntry(WLSDeployArchive.ARCHIVE_DIGEST_MANIFEST))) {
+                manifest.load(inputStream);
+            }
+            ZipEntry zipEntry = zipFile.getEntry(appName);
+            String expected = zipEntry.getSize() + "|" + zipEntry.getCrc() + "|" + FileUtils.computeHash(APP1_TO_ADD);
+            Assert.assertEquals("unexpected digest for " + appName, expected, manifest.getProperty(appName));
+            Assert.assertEquals("unexpected size for " + appName, new File(APP1_TO_ADD).length(), zipEntry.getSize());
+        }
+    }
 }
@@ -13,6 +13,7 @@ import java.util.Arrays;
 import java.util.Iterator;
 import java.util.List;
 import java.util.Map;
+import java.util.zip.ZipEntry;
 
 import org.junit.Assert;
 import org.junit.Before;
@@ -196,6 +197,12 @@ public class WLSDeployZipFileTest {
         FileInputStream inputStream = new FileInputStream(logPropertiesFile);
         boolean added = zf.addZipEntry("model/logging/log.properties", inputStream);
         Assert.assertTrue("expected entry to be added", added);
+        ZipEntry addedEntry = zf.getAddedZipEntry("model/logging/log.properties");
+        Assert.assertNotNull("expected the written entry to be returned", addedEntry);
+        Assert.assertEquals("unexpected size for the written entry", logPropertiesFile.length(),
+            addedEntry.getSize());
+        Assert.assertTrue("expected the written entry to have a CRC", addedEntry.getCrc() >= 0);
+        Assert.assertNull("expected no entry for a name that was not added", zf.getAddedZipEntry("model/"));
         Map<String, InputStream> map = zf.getZipEntries("model/logging");
         Assert.assertNotNull("expected map to be returned", map);
         Assert.assertEquals("expected 1 entry to be returned", 1, map.size());
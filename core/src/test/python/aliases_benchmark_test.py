@@ -0,0 +1,282 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Micro-benchmarks for the alias knowledge base.  The benchmarks are skipped unless the alias-benchmark
+system property is set to true (mvn -Dalias-benchmark=true test), since they load every category for
+several WebLogic versions in both WLST modes.
+"""
+import os
+import unittest
+
+from java.lang import Exception as JException
+from java.lang import System
+from java.lang import Thread
+from java.lang.management import ManagementFactory
+
+from oracle.weblogic.deploy.aliases import AliasException
+
+from wlsdeploy.aliases import alias_cache
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.json.json_translator import JsonToPython
+from wlsdeploy.json.json_translator import PythonToJson
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+GET_WLST_ATTRIBUTES_PATH = 'get_wlst_attributes_path'
+GET_MODEL_SUBFOLDER_NAMES = 'get_model_subfolder_names'
+GET_WLST_ATTRIBUTE_NAME_AND_VALUE = 'get_wlst_attribute_name_and_value'
+GET_MODEL_ATTRIBUTE_NAME_AND_VALUE = 'get_model_attribute_name_and_value'
+
+
+class AliasesBenchmarkTestCase(unittest.TestCase):
+    """
+    Load the alias knowledge base and time the most frequently called Aliases methods over every folder,
+    writing the results and the heap retained by the aliases to a JSON file, and failing if they are worse
+    than the thresholds.
+    """
+    _execution_dir = '../../unit-tests/'
+    _resources_dir = '../../test-classes/'
+    _thresholds_file = os.path.join(_resources_dir, 'alias-benchmark-thresholds.json')
+    _results_file = os.path.join(_execution_dir, 'alias-benchmark.json')
+
+    _wls_versions = ['10.3.6', '12.1.3', '12.2.1.3']
+    _wlst_modes = [WlstModes.OFFLINE, WlstModes.ONLINE]
+    _iterations = 3
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+    model_context = ModelContext('test', arg_map)
+
+    def setUp(self):
+        if not os.path.exists(self._execution_dir):
+            os.makedirs(self._execution_dir)
+
+    def testAliasBenchmarks(self):
+        if System.getProperty('alias-benchmark') != 'true':
+            return
+
+        thresholds = JsonToPython(self._thresholds_file).parse()
+
+        # measure the cost of resolving the categories, not reading them from the alias cache
+        cache_disabled = os.environ.get(alias_cache.CACHE_DISABLED_ENV_VARIABLE)
+        os.environ[alias_cache.CACHE_DISABLED_ENV_VARIABLE] = 'true'
+        try:
+            results = dict()
+            for wls_version in self._wls_versions:
+                version_results = dict()
+                for wlst_mode in self._wlst_modes:
+                    version_results[WlstModes.from_value(wlst_mode)] = self._run_benchmarks(wls_version, wlst_mode)
+                results[wls_version] = version_results
+        finally:
+            if cache_disabled is None:
+                del os.environ[alias_cache.CACHE_DISABLED_ENV_VARIABLE]
+            else:
+                os.environ[alias_cache.CACHE_DISABLED_ENV_VARIABLE] = cache_disabled
+
+        PythonToJson(results).write_to_json_file(self._results_file)
+
+        for wls_version in results:
+            for mode_name in results[wls_version]:
+                mode_results = results[wls_version][mode_name]
+                self.assertTrue(mode_results['loadSeconds'] <= thresholds['maxLoadSeconds'],
+                                'Loading the aliases for %s %s took %s seconds'
+                                % (wls_version, mode_name, mode_results['loadSeconds']))
+                for api_name in mode_results['apis']:
+                    errors = mode_results['apis'][api_name]['errors']
+                    self.assertEqual(errors, 0, '%s for %s %s failed %s times on valid folders'
+                                     % (api_name, wls_version, mode_name, errors))
+                for api_name, min_ops in thresholds['minOpsPerSecond'].iteritems():
+                    ops_per_second = mode_results['apis'][api_name]['opsPerSecond']
+                    self.assertTrue(ops_per_second >= min_ops, '%s for %s %s ran %s ops/sec, expected at least %s'
+                                    % (api_name, wls_version, mode_name, ops_per_second, min_ops))
+
+    def _run_benchmarks(self, wls_version, wlst_mode):
+        """
+        Load the aliases for the version and mode, and time each API over every folder.
+        :param wls_version: the WebLogic version
+        :param wlst_mode: the WLST mode
+        :return: the results dictionary for the version and mode
+        """
+        start_heap_bytes = _get_used_heap_bytes()
+        start = System.nanoTime()
+        aliases = Aliases(model_context=self.model_context, wlst_mode=wlst_mode, wls_version=wls_version)
+        self._load_categories(aliases)
+        load_seconds = (System.nanoTime() - start) / 1000000000.0
+        heap_bytes = _get_used_heap_bytes() - start_heap_bytes
+
+        locations = list()
+        self._add_locations(aliases, LocationContext(), locations)
+        for folder_name in aliases.get_model_top_level_folder_names():
+            location = LocationContext()
+            location.append_location(folder_name)
+            self._add_locations(aliases, location, locations)
+
+        attributes = self._get_attribute_values(aliases, locations)
+
+        apis = dict()
+        apis[GET_WLST_ATTRIBUTES_PATH] = \
+            self._time_api(locations, lambda location: _count_call(aliases.get_wlst_attributes_path, location))
+        apis[GET_MODEL_SUBFOLDER_NAMES] = \
+            self._time_api(locations, lambda location: _count_call(aliases.get_model_subfolder_names, location))
+        apis[GET_WLST_ATTRIBUTE_NAME_AND_VALUE] = \
+            self._time_api(locations, lambda location: _call_for_attributes(
+                aliases.get_wlst_attribute_name_and_value, location, attributes[id(location)][0]))
+        apis[GET_MODEL_ATTRIBUTE_NAME_AND_VALUE] = \
+            self._time_api(locations, lambda location: _call_for_attributes(
+                aliases.get_model_attribute_name_and_value, location, attributes[id(location)][1]))
+
+        result = dict()
+        result['folders'] = len(locations)
+        result['loadSeconds'] = load_seconds
+        result['heapBytes'] = heap_bytes
+        result['apis'] = apis
+        return result
+
+    def _load_categories(self, aliases):
+        """
+        Load every alias category, by getting the subfolder names of the domain and each top-level folder.
+        :param aliases: the aliases
+        """
+        aliases.get_model_subfolder_names(LocationContext())
+        for folder_name in aliases.get_model_top_level_folder_names():
+            location = LocationContext()
+            location.append_location(folder_name)
+            aliases.get_model_subfolder_names(location)
+        return
+
+    def _add_locations(self, aliases, location, locations):
+        """
+        Add the location and all of its subfolder locations that are valid for the version and mode.
+        :param aliases: the aliases
+        :param location: the location, with name tokens for all of its folders
+        :param locations: the list of locations to add to
+        """
+        try:
+            name_token = aliases.get_name_token(location)
+            if name_token is not None:
+                location.add_name_token(name_token, 'benchmark')
+            aliases.get_wlst_attributes_path(location)
+            subfolder_names = aliases.get_model_subfolder_names(location)
+        except AliasException:
+            return
+
+        locations.append(location)
+        for subfolder_name in subfolder_names:
+            subfolder_location = LocationContext(location)
+            subfolder_location.append_location(subfolder_name)
+            self._add_locations(aliases, subfolder_location, locations)
+        return
+
+    def _get_attribute_values(self, aliases, locations):
+        """
+        Get the model and WLST attribute values used to call the attribute APIs for each location.
+        :param aliases: the aliases
+        :param locations: the locations
+        :return: a dictionary keyed by location id, with a tuple of model and WLST (name, value) lists
+        """
+        result = dict()
+        for location in locations:
+            model_values = list()
+            wlst_values = list()
+            password_names = aliases.get_model_password_type_attribute_names(location)
+            for model_name in aliases.get_model_attribute_names(location):
+                if model_name in password_names:
+                    continue
+                # only benchmark the attributes whose default values can be converted
+                try:
+                    model_value = aliases.get_model_attribute_default_value(location, model_name)
+                    if model_value is None:
+                        continue
+                    wlst_name, wlst_value = aliases.get_wlst_attribute_name_and_value(location, model_name,
+                                                                                      model_value)
+                except AliasException:
+                    continue
+                model_values.append((model_name, model_value))
+                if wlst_name is not None:
+                    wlst_values.append((wlst_name, wlst_value))
+            result[id(location)] = (model_values, wlst_values)
+        return result
+
+    def _time_api(self, locations, function):
+        """
+        Call the function for every location for a number of iterations, and compute the statistics.
+        :param locations: the locations
+        :param function: the function, returning the number of operations and errors for the location
+        :return: the statistics dictionary for the API
+        """
+        operations = 0
+        errors = 0
+        start_bytes = _get_allocated_bytes()
+        start = System.nanoTime()
+        for iteration in range(self._iterations):
+            for location in locations:
+                location_operations, location_errors = function(location)
+                operations += location_operations
+                errors += location_errors
+        elapsed_seconds = (System.nanoTime() - start) / 1000000000.0
+        end_bytes = _get_allocated_bytes()
+
+        result = dict()
+        result['operations'] = operations
+        result['errors'] = errors
+        result['seconds'] = elapsed_seconds
+        if elapsed_seconds > 0:
+            result['opsPerSecond'] = operations / elapsed_seconds
+        else:
+            result['opsPerSecond'] = float(operations)
+        if start_bytes >= 0 and end_bytes >= 0 and operations > 0:
+            result['bytesPerOperation'] = (end_bytes - start_bytes) / operations
+        else:
+            result['bytesPerOperation'] = -1
+        return result
+
+
+def _count_call(function, location):
+    try:
+        function(location)
+    except AliasException:
+        return 1, 1
+    return 1, 0
+
+
+def _call_for_attributes(function, location, name_value_pairs):
+    errors = 0
+    for name, value in name_value_pairs:
+        try:
+            function(location, name, value)
+        except AliasException:
+            errors += 1
+    return len(name_value_pairs), errors
+
+
+def _get_used_heap_bytes():
+    """
+    Get the number of heap bytes in use after a garbage collection, to measure the memory retained by the aliases.
+    :return: the number of bytes
+    """
+    System.gc()
+    System.gc()
+    return ManagementFactory.getMemoryMXBean().getHeapMemoryUsage().getUsed()
+
+
+def _get_allocated_bytes():
+    """
+    Get the number of bytes allocated by the current thread, if the JVM supports measuring it.
+    :return: the number of bytes, or -1 if it cannot be measured
+    """
+    thread_bean = ManagementFactory.getThreadMXBean()
+    if not hasattr(thread_bean, 'getThreadAllocatedBytes'):
+        return -1
+    try:
+        return thread_bean.getThreadAllocatedBytes(Thread.currentThread().getId())
+    except JException:
+        return -1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,7 @@ from java.util import Properties
 from oracle.weblogic.deploy.aliases import AliasException
 from oracle.weblogic.deploy.aliases import TypeUtils
 
+from wlsdeploy.aliases.alias_entries import AliasEntries
 from wlsdeploy.aliases.aliases import Aliases
 from wlsdeploy.aliases.location_context import LocationContext
 import wlsdeploy.aliases.model_constants as FOLDERS
@@ -439,6 +440,33 @@ class AliasesTestCase(unittest.TestCase):
         self.assertEqual(model_attribute_value, boolean_values[1])
         return
 
+    def testAttributeValuesAreEqual(self):
+        location = LocationContext()
+        location.append_location(FOLDERS.JDBC_SYSTEM_RESOURCE)
+        token = self.aliases.get_name_token(location)
+        if token:
+            location.add_name_token(token, 'my-datasource')
+        location.append_location(FOLDERS.JDBC_RESOURCE)
+        location.append_location(FOLDERS.JDBC_DATASOURCE_PARAMS)
+
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'RowPrefetch', 'true', 1), True)
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'RowPrefetch', 'true', 0), False)
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'RowPrefetchSize', 123, '123'),
+                         True)
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'RowPrefetchSize', 123, None),
+                         False)
+
+        online_list = jarray.zeros(2, String)
+        online_list[0] = 'com.bea.datasource1'
+        online_list[1] = 'com.bea.datasource2'
+        model_value = 'com.bea.datasource1, com.bea.datasource2'
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'JNDIName', model_value,
+                                                                        online_list), True)
+        online_list[1] = 'com.bea.datasource3'
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'JNDIName', model_value,
+                                                                        online_list), False)
+        return
+
     def testGetWlstAttributeName(self):
         location = LocationContext()
         location.append_location(FOLDERS.JDBC_SYSTEM_RESOURCE)
@@ -1342,6 +1370,87 @@ class AliasesTestCase(unittest.TestCase):
             self.aliases.get_wlst_attribute_name_and_value(location, FOLDERS.CONSTRAINED_CANDIDATE_SERVER, model_value)
         self.assertEquals(wlst_value_expected, wlst_value)
 
+    def testQueryCacheIgnoresNameTokens(self):
+        aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=self.wls_version)
+        location = LocationContext()
+        location.append_location(FOLDERS.SERVER)
+        token = aliases.get_name_token(location)
+        location.add_name_token(token, 'MS-1')
+        first_result = aliases.get_model_attribute_names_and_types(location)
+
+        location.add_name_token(token, 'MS-2')
+        second_result = aliases.get_model_attribute_names_and_types(location)
+        self.assertEqual(first_result, second_result)
+
+        statistics = aliases.get_query_cache_statistics()
+        self.assertEqual(statistics['misses'], 1)
+        self.assertEqual(statistics['hits'], 1)
+        self.assertEqual(statistics['size'], 1)
+
+    def testQueryCacheResultsAreCopies(self):
+        aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=self.wls_version)
+        location = LocationContext()
+        location.append_location(FOLDERS.SERVER)
+        location.add_name_token(aliases.get_name_token(location), 'MS-1')
+
+        expected = list(aliases.get_model_subfolder_names(location))
+        first_result = aliases.get_model_subfolder_names(location)
+        first_result.sort()
+        first_result.append('NotAFolder')
+        self.assertEqual(expected, aliases.get_model_subfolder_names(location))
+
+        restart_names = aliases.get_model_restart_required_attribute_names(location)
+        expected = list(restart_names)
+        restart_names.append('NotAnAttribute')
+        self.assertEqual(expected, aliases.get_model_restart_required_attribute_names(location))
+
+    def testFolderDescriptor(self):
+        location = LocationContext()
+        location.append_location(FOLDERS.SERVER)
+        location.add_name_token(self.aliases.get_name_token(location), 'MS-1')
+        descriptor = self.aliases.get_folder_descriptor(location)
+
+        self.assertEqual(descriptor.get_attribute_types(), self.aliases.get_model_attribute_names_and_types(location))
+        self.assertEqual(descriptor.get_restart_required_attribute_names(),
+                         self.aliases.get_model_restart_required_attribute_names(location))
+        self.assertEqual(descriptor.get_wlst_to_model_name_map()['ListenPort'], 'ListenPort')
+        self.assertEqual(descriptor.get_model_folder_path(), FOLDERS.SERVER)
+        self.assertTrue(FOLDERS.SSL in descriptor.get_subfolder_names())
+        self.assertTrue(descriptor.get_attribute_entry_by_wlst_name('ListenPort') is
+                        descriptor.get_attribute_entry('ListenPort'))
+        self.assertEqual(descriptor.get_attribute_entry('NoSuchAttribute'), None)
+
+    def testServerTemplateSharesServerAttributes(self):
+        alias_entries = self.aliases._alias_entries
+        server_location = LocationContext()
+        server_location.append_location(FOLDERS.SERVER)
+        server_location.add_name_token(self.aliases.get_name_token(server_location), 'MS-1')
+        template_location = LocationContext()
+        template_location.append_location(FOLDERS.SERVER_TEMPLATE)
+        template_location.add_name_token(self.aliases.get_name_token(template_location), 'TEMPLATE-1')
+
+        server_entry = alias_entries.get_alias_attribute_entry_by_model_name(server_location, 'Notes')
+        template_entry = alias_entries.get_alias_attribute_entry_by_model_name(template_location, 'Notes')
+        self.assertTrue(server_entry is template_entry)
+
+    def testShareAliasValues(self):
+        alias_entries = AliasEntries(wlst_mode=WlstModes.ONLINE, wls_version=self.wls_version)
+        first = {'attributes': {'Notes': {'wlst_name': 'Notes', 'default': 'None'}}, 'folders': {}}
+        second = {'attributes': {'Notes': {'wlst_name': 'Notes', 'default': 'None'}}, 'folders': {}}
+        shared_first = alias_entries._AliasEntries__share_alias_values(first)
+        shared_second = alias_entries._AliasEntries__share_alias_values(second)
+        self.assertTrue(shared_first is first)
+        self.assertTrue(shared_second is first)
+
+        # scalar values of different types are not equal, even if Python compares them as equal
+        third = {'attributes': {'Notes': {'wlst_name': 'Notes', 'default': 1}}, 'folders': {}}
+        fourth = {'attributes': {'Notes': {'wlst_name': 'Notes', 'default': True}}, 'folders': {}}
+        shared_third = alias_entries._AliasEntries__share_alias_values(third)
+        shared_fourth = alias_entries._AliasEntries__share_alias_values(fourth)
+        self.assertTrue(shared_third is third)
+        self.assertTrue(shared_fourth is fourth)
+        self.assertTrue(shared_third['folders'] is shared_first['folders'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,177 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from java.lang import System
+
+from oracle.weblogic.deploy.deploy import DeployException
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.model_constants import DEPLOYMENT_ORDER
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.tool.deploy import applications_deployer
+from wlsdeploy.tool.deploy.applications_deployer import ApplicationsDeployer
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model import Model
+from wlsdeploy.util.model_context import ModelContext
+
+
+class ApplicationsDeployerTestCase(unittest.TestCase):
+    """
+    Test the grouping of applications into deployment order tiers, the concurrent deployment of a tier,
+    and the waiting for the running operations of a tier.
+    """
+    wls_version = '12.2.1.3'
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+    model_context = ModelContext('test', arg_map)
+    aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.ONLINE, wls_version=wls_version)
+
+    def setUp(self):
+        self.deployer = ApplicationsDeployer(Model({'appDeployments': {}}), self.model_context, self.aliases,
+                                             wlst_mode=WlstModes.ONLINE)
+
+    def testTiersWithMixedOrders(self):
+        apps = {
+            'app1': {DEPLOYMENT_ORDER: 200},
+            'app2': {},
+            'app3': {DEPLOYMENT_ORDER: 100},
+            'app4': {DEPLOYMENT_ORDER: 200},
+            'app5': {}
+        }
+        ordered_list = self.deployer._ApplicationsDeployer__get_deployment_ordering(apps)
+        self.assertEqual(ordered_list, ['app3', 'app1', 'app4', 'app2', 'app5'])
+
+        tiers = applications_deployer._get_deployment_tiers(apps, ordered_list)
+        self.assertEqual(tiers, [['app3'], ['app1', 'app4'], ['app2', 'app5']])
+
+    def testTiersWithoutDeploymentOrder(self):
+        apps = {
+            'app2': {},
+            'app1': {}
+        }
+        ordered_list = self.deployer._ApplicationsDeployer__get_deployment_ordering(apps)
+        self.assertEqual(applications_deployer._get_deployment_tiers(apps, ordered_list), [['app1', 'app2']])
+
+    def testTiersWithSingleApp(self):
+        apps = {'app1': {DEPLOYMENT_ORDER: 100}}
+        self.assertEqual(applications_deployer._get_deployment_tiers(apps, ['app1']), [['app1']])
+        self.assertEqual(applications_deployer._get_deployment_tiers({}, []), [])
+
+    def testTierFailuresAreAggregated(self):
+        wlst_helper = _StubWlstHelper(['app2'], ['app3'])
+        self.deployer.wlst_helper = wlst_helper
+        deployments = []
+        for name in ['app1', 'app2', 'app3', 'app4']:
+            deployments.append((name, {'targets': 'AdminServer'}))
+
+        try:
+            self.deployer._ApplicationsDeployer__deploy_tier_online(deployments, 100, 2)
+            self.fail('Expected a DeployException for the failed deployments')
+        except DeployException, de:
+            message = de.getLocalizedMessage()
+            self.assertTrue('app2' in message, message)
+            self.assertTrue('app3' in message, message)
+            self.assertTrue('app1' not in message, message)
+
+        # the failures did not stop the rest of the tier from being deployed
+        self.assertEqual(wlst_helper.deployed_names, ['app1', 'app2', 'app3', 'app4'])
+        for kwargs in wlst_helper.deployed_kwargs:
+            self.assertEqual(kwargs['block'], 'false')
+
+    def testWaitPastDeadline(self):
+        # the operation never finishes, and its deadline has passed
+        running = [('app1', _StubProgress(-1), System.currentTimeMillis() - 1)]
+        failures = []
+        self.deployer._ApplicationsDeployer__wait_for_progress(running, failures, 0, 1000)
+        self.assertEqual(running, [])
+        self.assertEqual(failures, ['app1'])
+
+    def testWaitForFailedOperation(self):
+        running = [('app1', _StubProgress(2, failed=True), None), ('app2', _StubProgress(1), None)]
+        failures = []
+        self.deployer._ApplicationsDeployer__wait_for_progress(running, failures, 0, None)
+        self.assertEqual(running, [])
+        self.assertEqual(failures, ['app1'])
+
+    def testWaitLimitsRunningOperations(self):
+        # without a deadline, the running operations are waited for until enough of them finish
+        never_finishes = _StubProgress(-1)
+        running = [('app1', never_finishes, None), ('app2', _StubProgress(2), None),
+                   ('app3', never_finishes, None)]
+        failures = []
+        self.deployer._ApplicationsDeployer__wait_for_progress(running, failures, 2, None)
+        self.assertEqual(running, [('app1', never_finishes, None), ('app3', never_finishes, None)])
+        self.assertEqual(failures, [])
+
+        # there is no need to wait when no more than the maximum are running
+        self.deployer._ApplicationsDeployer__wait_for_progress(running, failures, 2, None)
+        self.assertEqual(len(running), 2)
+
+    def testWaitForUnfinishedOperationBeforeDeadline(self):
+        deadline = System.currentTimeMillis() + 60000
+        running = [('app1', _StubProgress(1), deadline)]
+        failures = []
+        self.deployer._ApplicationsDeployer__wait_for_progress(running, failures, 0, 60000)
+        self.assertEqual(running, [])
+        self.assertEqual(failures, [])
+
+
+class _StubProgress(object):
+    """
+    A WLST progress object that runs for a number of polls, and then completes or fails.  It runs forever
+    if the number of polls is negative.
+    """
+
+    def __init__(self, running_polls=0, failed=False, command_type='deploy'):
+        self._running_polls = running_polls
+        self._failed = failed
+        self._command_type = command_type
+        return
+
+    def isRunning(self):
+        if self._running_polls == 0:
+            return False
+        if self._running_polls > 0:
+            self._running_polls -= 1
+        return True
+
+    def isFailed(self):
+        return self._failed
+
+    def getCommandType(self):
+        return self._command_type
+
+    def getMessage(self):
+        return 'stub failure'
+
+
+class _StubWlstHelper(object):
+    """
+    Records the deployments, failing the deployments that are named to fail when they are started or when
+    they complete.
+    """
+
+    def __init__(self, fail_to_start_names, fail_names):
+        self._fail_to_start_names = fail_to_start_names
+        self._fail_names = fail_names
+        self.deployed_names = []
+        self.deployed_kwargs = []
+        return
+
+    def deploy_application(self, application_name, *args, **kwargs):
+        self.deployed_names.append(application_name)
+        self.deployed_kwargs.append(kwargs)
+        if application_name in self._fail_to_start_names:
+            raise exception_helper.create_deploy_exception('WLSDPLY-09335', application_name, 'stub failure')
+        return _StubProgress(1, application_name in self._fail_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import javaos as os
+import unittest
+
+from oracle.weblogic.deploy.util import WLSDeployArchive
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover.deployments_discoverer import DeploymentsDiscoverer
+from wlsdeploy.tool.discover.topology_discoverer import TopologyDiscoverer
+from wlsdeploy.tool.discover.xml_config_session import XmlConfigSession
+from wlsdeploy.tool.util.wlst_helper import WlstHelper
+from wlsdeploy.util import wlst_helper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model import Model
+from wlsdeploy.util.model_context import ModelContext
+
+
+class ConcurrentDiscoveryTestCase(unittest.TestCase):
+    """
+    Run two discoverers concurrently, each on its own WLST session, and verify that the merged model and the
+    archive are the same as when the discoverers run one after another on a single session.  The sessions read
+    the domain configuration files, so that no Admin Server is needed.
+    """
+    _resources_dir = '../../test-classes'
+    _execution_dir = '../../unit-tests'
+    _domain_home = _resources_dir + '/concurrent-discover-domain'
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+    aliases = Aliases(model_context=ModelContext('test', arg_map), wlst_mode=WlstModes.OFFLINE,
+                      wls_version='12.2.1.3')
+
+    def setUp(self):
+        if not os.path.exists(self._execution_dir):
+            os.makedirs(self._execution_dir)
+
+    def testConcurrentDiscoveryMatchesSequential(self):
+        sequential_model, sequential_archive = self._discover('sequential', False)
+        concurrent_model, concurrent_archive = self._discover('concurrent', True)
+
+        self.assertEqual(_to_dict(concurrent_model.get_model()), _to_dict(sequential_model.get_model()))
+
+        sequential_entries = _get_file_entries(sequential_archive)
+        self.assertEqual(_get_file_entries(concurrent_archive), sequential_entries)
+        for entry in sequential_entries:
+            self.assertEqual(concurrent_archive.getFileHash(entry), sequential_archive.getFileHash(entry), entry)
+
+        # both discoverers added their files to the archive
+        server = concurrent_model.get_model_topology()['Server']['AdminServer']
+        self.assertTrue(server['CustomIdentityKeyStoreFileName'] in sequential_entries)
+        application = concurrent_model.get_model_app_deployments()['Application']['my-app']
+        self.assertTrue(application['SourcePath'] in sequential_entries)
+
+        sequential_archive.close()
+        concurrent_archive.close()
+
+    def _discover(self, run_name, concurrent):
+        """
+        Discover the topology and application deployments of the test domain.
+        :param run_name: the name of the run, used for the archive file name
+        :param concurrent: whether to run the discoverers concurrently
+        :return: the discovered model, and the archive
+        """
+        archive_file_name = os.path.join(self._execution_dir, 'discover-' + run_name + '.zip')
+        if os.path.exists(archive_file_name):
+            os.remove(archive_file_name)
+        archive = WLSDeployArchive(archive_file_name)
+
+        arg_map = {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH: self._domain_home,
+            CommandLineArgUtil.DOMAIN_TYPEDEF: _WlsDomainTypedef(),
+            CommandLineArgUtil.ARCHIVE_FILE: archive
+        }
+        model_context = ModelContext('test', arg_map)
+        model = Model()
+        discoverers = [
+            TopologyDiscoverer(model_context, model.get_model_topology(), LocationContext(),
+                               wlst_mode=WlstModes.OFFLINE, aliases=self.aliases),
+            DeploymentsDiscoverer(model_context, model.get_model_app_deployments(), LocationContext(),
+                                  wlst_mode=WlstModes.OFFLINE, aliases=self.aliases)
+        ]
+
+        if concurrent:
+            discoverer.discover_concurrently(discoverers, model_context, len(discoverers), self._create_session,
+                                             _read_domain, _close_domain)
+        else:
+            wlst_helper.set_thread_session(self._create_session())
+            try:
+                _read_domain(model_context)
+                for section_discoverer in discoverers:
+                    section_discoverer.discover()
+                _close_domain()
+            finally:
+                wlst_helper.set_thread_session(None)
+        return model, archive
+
+    def _create_session(self):
+        return XmlConfigSession(self.aliases)
+
+
+def _read_domain(model_context):
+    # read the domain through WlstHelper, so that no lsa() or lsc() results of other tests are used
+    WlstHelper(PlatformLogger('wlsdeploy.discover'), ExceptionType.DISCOVER).read_domain(
+        model_context.get_domain_home())
+
+
+def _close_domain():
+    wlst_helper.close_domain()
+
+
+def _get_file_entries(archive):
+    """
+    Get the sorted names of the files in the archive, without the digest manifest.  The manifest is
+    rewritten as the files are added, so its contents depend on the order in which the files were added.
+    :param archive: the archive
+    :return: the list of file entry names
+    """
+    result = list()
+    for entry in archive.getArchiveEntries():
+        if not entry.endswith('/') and entry != WLSDeployArchive.ARCHIVE_DIGEST_MANIFEST:
+            result.append(entry)
+    result.sort()
+    return result
+
+
+class _WlsDomainTypedef(object):
+    """
+    The domain typedef of a WLS domain, which has no system resources or applications.
+    """
+
+    def get_domain_type(self):
+        return 'WLS'
+
+    def _is_system_name(self, name):
+        return False
+
+    is_system_app = _is_system_name
+    is_system_coherence_cluster = _is_system_name
+    is_system_datasource = _is_system_name
+    is_system_file_store = _is_system_name
+    is_system_jms = _is_system_name
+    is_system_jms_server = _is_system_name
+    is_system_shared_library = _is_system_name
+    is_system_shutdown_class = _is_system_name
+    is_system_startup_class = _is_system_name
+    is_system_wldf = _is_system_name
+
+
+def _to_dict(value):
+    """
+    Convert the ordered dictionaries of a discovered model to plain dictionaries, to compare them.
+    :param value: the model value
+    :return: the value, with its dictionaries converted
+    """
+    if hasattr(value, 'iteritems'):
+        result = dict()
+        for key, item in value.iteritems():
+            result[key] = _to_dict(item)
+        return result
+    return value
+
+
+if __name__ == '__main__':
+    unittest.main()
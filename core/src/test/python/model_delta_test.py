@@ -0,0 +1,139 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.wlst_modes import WlstModes
+import wlsdeploy.logging.platform_logger as platform_logger
+from wlsdeploy.tool.deploy.model_delta import ModelDelta
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class ModelDeltaTestCase(unittest.TestCase):
+    """
+    Test the computation of the changes between a previous model and the current model.
+    """
+    wls_version = '12.2.1.3'
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+
+    logger = platform_logger.PlatformLogger('wlsdeploy.unittest')
+    model_context = ModelContext('test', arg_map)
+    aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.ONLINE, wls_version=wls_version)
+
+    def testUnchangedModel(self):
+        model_delta = ModelDelta(_get_model(), _get_model(), self.aliases, self.logger)
+        changed_model = model_delta.get_changed_model()
+
+        self.assertEqual(len(changed_model['topology']), 0)
+        self.assertEqual(len(changed_model['resources']), 0)
+        self.assertEqual(changed_model['appDeployments'], _get_model()['appDeployments'])
+        self.assertEqual(model_delta.changed_attributes, 0)
+        return
+
+    def testChangedAttributes(self):
+        model = _get_model()
+        model['topology']['Server']['s1']['ListenPort'] = 8101
+        model['resources']['JDBCSystemResource']['ds1']['Target'] = 'c1'
+
+        model_delta = ModelDelta(_get_model(), model, self.aliases, self.logger)
+        changed_model = model_delta.get_changed_model()
+
+        topology = changed_model['topology']
+        self.assertEqual(topology.keys(), ['Server'])
+        self.assertEqual(topology['Server'].keys(), ['s1'])
+        self.assertEqual(topology['Server']['s1'], {'ListenPort': 8101})
+
+        resources = changed_model['resources']
+        self.assertEqual(resources['JDBCSystemResource'], {'ds1': {'Target': 'c1'}})
+        self.assertEqual(model_delta.changed_attributes, 2)
+        return
+
+    def testAddedAndRemovedFolders(self):
+        model = _get_model()
+        model['topology']['Server']['s3'] = {'ListenPort': 8301}
+        del model['topology']['Server']['s2']
+        del model['topology']['Server']['s1']['SSL']
+
+        model_delta = ModelDelta(_get_model(), model, self.aliases, self.logger)
+        changed_model = model_delta.get_changed_model()
+
+        self.assertEqual(changed_model['topology']['Server'], {'s3': {'ListenPort': 8301}})
+        self.assertEqual(model_delta.added_folders, 1)
+        self.assertEqual(model_delta.removed_folders, 2)
+        return
+
+    def testUnchangedTokens(self):
+        # the variable values may have changed, even though the unsubstituted models are the same
+        previous_model = _get_model()
+        previous_model['topology']['Server']['s1']['ListenPort'] = '@@PROP:s1.port@@'
+        previous_model['topology']['Server']['@@ENV:SERVER_NAME@@'] = {'ListenPort': 8401}
+        previous_model['resources']['JDBCSystemResource']['ds1']['JdbcResource']['JDBCDriverParams'] = \
+            {'DriverName': 'oracle.jdbc.OracleDriver', 'PasswordEncrypted': '@@SECRET:ds1:password@@'}
+        model = _get_model()
+        model['topology']['Server']['s1']['ListenPort'] = '@@PROP:s1.port@@'
+        model['topology']['Server']['@@ENV:SERVER_NAME@@'] = {'ListenPort': 8401}
+        model['resources']['JDBCSystemResource']['ds1']['JdbcResource']['JDBCDriverParams'] = \
+            {'DriverName': 'oracle.jdbc.OracleDriver', 'PasswordEncrypted': '@@SECRET:ds1:password@@'}
+
+        model_delta = ModelDelta(previous_model, model, self.aliases, self.logger)
+        changed_model = model_delta.get_changed_model()
+
+        servers = changed_model['topology']['Server']
+        self.assertEqual(servers['s1'], {'ListenPort': '@@PROP:s1.port@@'})
+        self.assertEqual(servers['@@ENV:SERVER_NAME@@'], {'ListenPort': 8401})
+        self.assertEqual('s2' in servers, False)
+
+        resource = changed_model['resources']['JDBCSystemResource']['ds1']
+        self.assertEqual(resource, {'JdbcResource': {'JDBCDriverParams':
+                                                     {'PasswordEncrypted': '@@SECRET:ds1:password@@'}}})
+        return
+
+
+def _get_model():
+    return {
+        'topology': {
+            'Name': 'base_domain',
+            'Server': {
+                's1': {
+                    'ListenPort': 8001,
+                    'SSL': {
+                        'Enabled': 'true',
+                        'ListenPort': 8002
+                    }
+                },
+                's2': {
+                    'ListenPort': 8201
+                }
+            }
+        },
+        'resources': {
+            'JDBCSystemResource': {
+                'ds1': {
+                    'Target': 's1',
+                    'JdbcResource': {
+                        'JDBCDataSourceParams': {
+                            'JNDIName': 'jdbc/ds1'
+                        }
+                    }
+                }
+            }
+        },
+        'appDeployments': {
+            'Application': {
+                'app1': {
+                    'SourcePath': 'wlsdeploy/applications/app1.war'
+                }
+            }
+        }
+    }
+
+
+if __name__ == '__main__':
+    unittest.main()
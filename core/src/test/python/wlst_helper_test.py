@@ -0,0 +1,116 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.tool.util import wlst_helper
+from wlsdeploy.tool.util.wlst_helper import ExistingObjectIndex
+
+
+class ListCacheTestCase(unittest.TestCase):
+    """
+    Verify which cached lsa() and lsc() results and name indexes are removed when a directory changes.
+    """
+
+    def setUp(self):
+        self.cache = wlst_helper._ListCache()
+
+    def testInvalidateCurrentPath(self):
+        self.cache.put('a', '/Server/s1', {'ListenPort': 7001})
+        self.cache.put('c', '/Server/s1', ['SSL'])
+        self.cache.put('a', '/Server/s2', {'ListenPort': 7002})
+
+        self.cache.invalidate('/Server/s1')
+        self.assertEqual(self.cache.get('a', '/Server/s1'), None)
+        self.assertEqual(self.cache.get('c', '/Server/s1'), None)
+        self.assertEqual(self.cache.get('a', '/Server/s2'), {'ListenPort': 7002})
+
+    def testInvalidateParentAndDescendants(self):
+        self.cache.put('c', '/', ['Server'])
+        self.cache.put('c', '/Server', ['s1', 's10'])
+        self.cache.put('a', '/Server/s1/SSL/s1', {'Enabled': 'true'})
+        self.cache.put('a', '/Server/s10', {'ListenPort': 7010})
+
+        self.cache.invalidate('/Server/s1')
+        self.assertEqual(self.cache.get('c', '/Server'), None)
+        self.assertEqual(self.cache.get('a', '/Server/s1/SSL/s1'), None)
+        # a sibling whose name starts with the same characters is not a descendant
+        self.assertEqual(self.cache.get('a', '/Server/s10'), {'ListenPort': 7010})
+        self.assertEqual(self.cache.get('c', '/'), ['Server'])
+
+    def testInvalidateTopLevelFolder(self):
+        self.cache.put('c', '/', ['Server'])
+        self.cache.put('c', '/Server', ['s1'])
+
+        self.cache.invalidate('/Server')
+        self.assertEqual(self.cache.get('c', '/'), None)
+        self.assertEqual(self.cache.get('c', '/Server'), None)
+
+    def testInvalidateAllTrees(self):
+        self.cache.set_tree('edit')
+        self.cache.put('a', '/Server/s1', {'ListenPort': 7001})
+        self.cache.set_tree('serverConfig')
+        self.cache.put('a', '/Server/s1', {'ListenPort': 7001})
+
+        self.cache.invalidate('/Server/s1')
+        self.assertEqual(self.cache.get('a', '/Server/s1'), None)
+        self.cache.set_tree('edit')
+        self.assertEqual(self.cache.get('a', '/Server/s1'), None)
+
+    def testStructureChangedRemovesIndexes(self):
+        self.cache.put_index('/Server', ExistingObjectIndex(['s1']))
+        self.cache.put_index('/Server/s1/Log', ExistingObjectIndex(['s1']))
+        self.cache.put_index('/Server/s2/Log', ExistingObjectIndex(['s2']))
+
+        self.cache.invalidate('/Server/s1')
+        self.assertNotEqual(self.cache.get_index('/Server/s1/Log'), None)
+
+        self.cache.invalidate('/Server/s1', structure_changed=True)
+        self.assertEqual(self.cache.get_index('/Server/s1/Log'), None)
+        self.assertNotEqual(self.cache.get_index('/Server'), None)
+        self.assertNotEqual(self.cache.get_index('/Server/s2/Log'), None)
+
+    def testInvalidateUnknownPathClearsAll(self):
+        self.cache.put('c', '/Server', ['s1'])
+        self.cache.put_index('/Server', ExistingObjectIndex(['s1']))
+
+        self.cache.invalidate(None)
+        self.assertEqual(self.cache.get('c', '/Server'), None)
+        self.assertEqual(self.cache.get_index('/Server'), None)
+
+    def testRuntimeTreesAreNotCached(self):
+        for tree in ['domainRuntime', 'custom']:
+            self.cache.set_tree(tree)
+            self.cache.put('c', '/Server', ['s1'])
+            self.cache.put_index('/Server', ExistingObjectIndex(['s1']))
+            self.assertEqual(self.cache.get('c', '/Server'), None)
+            self.assertEqual(self.cache.get_index('/Server'), None)
+
+        # the results were not kept for a cached tree either
+        self.cache.set_tree('serverConfig')
+        self.assertEqual(self.cache.get('c', '/Server'), None)
+        self.assertEqual(self.cache.hits, 0)
+
+    def testExistingObjectListIsCachedSeparately(self):
+        self.cache.put('c', '/Server', ['s1'])
+        self.cache.put('existing', '/Server', ['s1', 's2'])
+        self.assertEqual(self.cache.get('c', '/Server'), ['s1'])
+        self.assertEqual(self.cache.get('existing', '/Server'), ['s1', 's2'])
+
+        self.cache.invalidate('/Server/s2')
+        self.assertEqual(self.cache.get('c', '/Server'), None)
+        self.assertEqual(self.cache.get('existing', '/Server'), None)
+
+    def testCachedResultIsReturned(self):
+        self.cache.set_tree('offline')
+        self.cache.put('c', '/Server', ['s1'])
+        self.assertEqual(self.cache.get('c', '/Server'), ['s1'])
+        self.assertEqual(self.cache.get('a', '/Server'), None)
+        self.assertEqual(self.cache.get('c', None), None)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
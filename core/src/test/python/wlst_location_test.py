@@ -0,0 +1,220 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from oracle.weblogic.deploy.util import PyWLSTException
+
+from wlsdeploy.util import wlst_helper
+
+
+class WlstLocationTestCase(unittest.TestCase):
+    """
+    Test the tracking of the WLST location that is used to skip cd() calls, and the check that decides whether
+    ls() can list a path other than the current location.
+    """
+
+    def setUp(self):
+        self._path_ls_supported = wlst_helper._path_ls_supported
+        wlst_helper._path_ls_supported = None
+        self.wlst = _StubWlst()
+        wlst_helper.set_thread_session(self.wlst)
+
+    def tearDown(self):
+        wlst_helper.set_thread_session(None)
+        wlst_helper._path_ls_supported = self._path_ls_supported
+
+    def testCdToCurrentPathIsSkipped(self):
+        wlst_helper.cd('/Server/s1')
+        wlst_helper.cd('/Server/s1/')
+        self.assertEqual(self.wlst.cd_calls, ['/Server/s1'])
+
+        # a descendant of the current location is reached with a relative path
+        wlst_helper.cd('/Server/s1/SSL/s1')
+        self.assertEqual(self.wlst.cd_calls, ['/Server/s1', 'SSL/s1'])
+        self.assertEqual(wlst_helper.get_pwd(), '/Server/s1/SSL/s1')
+
+    def testFailedCdClearsTrackedPath(self):
+        wlst_helper.cd('/Server/s1')
+        self.assertRaises(PyWLSTException, wlst_helper.cd, '/Server/missing')
+        self.assertEqual(self.wlst.current_path, None)
+
+        wlst_helper.cd('/Server/s1')
+        self.assertEqual(self.wlst.cd_calls, ['/Server/s1', '/Server/missing', '/Server/s1'])
+
+    def testCommandsClearTrackedPath(self):
+        commands = [
+            (wlst_helper.edit, ()),
+            (wlst_helper.start_edit, ()),
+            (wlst_helper.save, ()),
+            (wlst_helper.activate, ()),
+            (wlst_helper.server_config, ()),
+            (wlst_helper.domain_runtime, ()),
+            (wlst_helper.custom, ()),
+            (wlst_helper.read_template, ('template.jar',)),
+            (wlst_helper.add_template, ('template.jar',)),
+            (wlst_helper.read_domain, ('/domain',)),
+            (wlst_helper.update_domain, ()),
+        ]
+        for command, args in commands:
+            wlst_helper.cd('/Server/s1')
+            command(*args)
+            self.assertEqual(self.wlst.current_path, None, command.__name__)
+
+            # WLST moved to the root, so the next cd() must not be skipped
+            self.wlst.cd_calls = []
+            wlst_helper.cd('/Server/s1')
+            self.assertEqual(self.wlst.cd_calls, ['/Server/s1'], command.__name__)
+
+    def testPathListingIsChecked(self):
+        wlst_helper.cd('/')
+        self.assertEqual(wlst_helper.lsc('/Server'), ['s1', 's2'])
+        self.assertEqual(wlst_helper._path_ls_supported, True)
+        self.assertEqual(wlst_helper.get_pwd(), '/')
+
+        # once supported, the path is listed without changing to it
+        self.wlst.cd_calls = []
+        self.assertEqual(wlst_helper.lsc('/Server/s1'), ['SSL'])
+        self.assertEqual(self.wlst.cd_calls, [])
+
+    def testPathListingOfCurrentLocationIsNotSupported(self):
+        # earlier versions of WLST list the current location instead of the path
+        self.wlst.path_ls = _LIST_CURRENT
+        wlst_helper.cd('/')
+        self.assertEqual(wlst_helper.lsc('/Server'), ['s1', 's2'])
+        self.assertEqual(wlst_helper._path_ls_supported, False)
+
+        self.wlst.cd_calls = []
+        self.assertEqual(wlst_helper.lsc('/Server/s1'), ['SSL'])
+        self.assertEqual(self.wlst.cd_calls, ['Server/s1', '/'])
+
+    def testPathListingErrorIsNotSupported(self):
+        self.wlst.path_ls = _TYPE_ERROR
+        wlst_helper.cd('/')
+        self.assertEqual(wlst_helper.lsc('/Server'), ['s1', 's2'])
+        self.assertEqual(wlst_helper._path_ls_supported, False)
+
+    def testPathListingThatMovesLocationIsNotSupported(self):
+        self.wlst.path_ls = _MOVE
+        wlst_helper.cd('/')
+        self.assertEqual(wlst_helper.lsc('/Server'), ['s1', 's2'])
+        self.assertEqual(wlst_helper._path_ls_supported, False)
+        self.assertEqual(self.wlst.location, '/')
+
+    def testPathListingCheckNeedsAnotherLocation(self):
+        # listing the current location, or a folder without children, does not show whether the path is used
+        wlst_helper.cd('/Server')
+        self.assertEqual(wlst_helper.lsc('/Server'), ['s1', 's2'])
+        self.assertEqual(wlst_helper.lsc('/Server/s2'), [])
+        self.assertEqual(wlst_helper._path_ls_supported, None)
+
+    def testFailedPathListingFallsBackToCd(self):
+        wlst_helper._path_ls_supported = True
+        self.wlst.path_ls = _WLST_ERROR
+        wlst_helper.cd('/')
+        self.wlst.cd_calls = []
+        self.assertEqual(wlst_helper.lsc('/Server/s1'), ['SSL'])
+        self.assertEqual(self.wlst.cd_calls, ['Server/s1', '/'])
+        self.assertEqual(self.wlst.location, '/')
+
+    def testMissingPathKeepsLocation(self):
+        wlst_helper.cd('/Server')
+        self.assertRaises(PyWLSTException, wlst_helper.lsc, '/Server/missing')
+        self.assertEqual(self.wlst.location, '/Server')
+
+
+# ways the stub lists a path other than the current location
+_LIST_PATH = 'path'
+_LIST_CURRENT = 'current'
+_TYPE_ERROR = 'type-error'
+_WLST_ERROR = 'wlst-error'
+_MOVE = 'move'
+
+
+class _StubWlstException(Exception):
+    pass
+
+
+class _StubWlst(object):
+    """
+    A WLST session for a small domain, that records the cd() calls.
+    """
+    WLSTException = _StubWlstException
+
+    _folders = {
+        '/': ['Server'],
+        '/Server': ['s1', 's2'],
+        '/Server/s1': ['SSL'],
+        '/Server/s1/SSL': ['s1'],
+        '/Server/s1/SSL/s1': [],
+        '/Server/s2': []
+    }
+
+    def __init__(self):
+        # the location tracked by wlst_helper
+        self.current_path = None
+        self.connected = 'true'
+        self.location = '/'
+        self.cd_calls = []
+        self.path_ls = _LIST_PATH
+        return
+
+    def _get_cmo(self):
+        return 'cmo:' + self.location
+
+    cmo = property(_get_cmo)
+
+    def cd(self, path):
+        self.cd_calls.append(path)
+        self.location = self._resolve(path)
+        return self.cmo
+
+    def pwd(self):
+        if self.location == '/':
+            return '/base_domain'
+        return '/base_domain' + self.location
+
+    def ls(self, path, returnMap='false', returnType='c'):
+        if path == returnType:
+            return list(self._folders[self.location])
+        if self.path_ls == _LIST_CURRENT:
+            return list(self._folders[self.location])
+        if self.path_ls == _TYPE_ERROR:
+            raise TypeError('ls() got an unexpected keyword argument')
+        if self.path_ls == _WLST_ERROR:
+            raise _StubWlstException('ls failed for ' + path)
+        if self.path_ls == _MOVE:
+            self.location = self._resolve(path)
+        return list(self._folders[self._resolve(path)])
+
+    def _resolve(self, path):
+        if not path.startswith('/'):
+            if self.location == '/':
+                path = '/' + path
+            else:
+                path = self.location + '/' + path
+        if len(path) > 1 and path.endswith('/'):
+            path = path[:-1]
+        if path not in self._folders:
+            raise _StubWlstException('no such location ' + path)
+        return path
+
+    def _move_to_root(self, *args):
+        self.location = '/'
+
+    edit = _move_to_root
+    startEdit = _move_to_root
+    save = _move_to_root
+    activate = _move_to_root
+    serverConfig = _move_to_root
+    domainRuntime = _move_to_root
+    custom = _move_to_root
+    readTemplate = _move_to_root
+    addTemplate = _move_to_root
+    readDomain = _move_to_root
+    updateDomain = _move_to_root
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,226 @@
+"""
+Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import javaos as os
+import unittest
+
+from oracle.weblogic.deploy.discover import DiscoverException
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover.resources_discoverer import ResourcesDiscoverer
+from wlsdeploy.tool.discover.topology_discoverer import TopologyDiscoverer
+from wlsdeploy.tool.discover.xml_config_session import XmlConfigSession
+from wlsdeploy.tool.util.wlst_helper import WlstHelper
+from wlsdeploy.util import wlst_helper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class XmlConfigSessionTestCase(unittest.TestCase):
+    """
+    Read a small domain configuration and verify that it is listed with the offline WLST paths and names.
+    """
+    _resources_dir = '../../test-classes'
+    _execution_dir = '../../unit-tests'
+    _domain_home = _resources_dir + '/xml-discover-domain'
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+    model_context = ModelContext('test', arg_map)
+    aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.OFFLINE, wls_version='12.2.1.3')
+
+    def setUp(self):
+        self.session = XmlConfigSession(self.aliases)
+        self.session.readDomain(self._domain_home)
+
+    def tearDown(self):
+        self.session.closeDomain()
+
+    def testDomainAttributes(self):
+        self.session.cd('/')
+        self.assertEqual(self.session.get('Name'), 'base_domain')
+        self.assertEqual(self.session.get('AdminServerName'), 'AdminServer')
+        self.assertEqual(self.session.get('ProductionModeEnabled'), None)
+        self.assertEqual(self.session.pwd(), 'xml:/')
+
+        attributes = self.session.ls('a', returnMap='true', returnType='a')
+        self.assertEqual(attributes.get('DomainVersion'), '12.2.1.3.0')
+
+    def testFolders(self):
+        folders = self.session.ls('/', returnMap='true', returnType='c')
+        self.assertEqual(folders, ['SecurityConfiguration', 'Server', 'Cluster', 'JDBCSystemResource'])
+        self.assertEqual(self.session.ls('/Server', returnMap='true', returnType='c'), ['AdminServer', 'managed/1'])
+
+        self.session.cd('/Server/(managed/1)')
+        self.assertEqual(self.session.pwd(), 'xml:/Server/managed/1')
+        self.assertEqual(self.session.get('ListenPort'), '8001')
+        self.assertEqual(self.session.get('Cluster'), 'mycluster')
+
+        self.session.cd('../AdminServer/SSL/AdminServer')
+        self.assertEqual(self.session.get('ListenPort'), '7002')
+        self.assertEqual(self.session.cmo.get_attribute('Enabled'), 'true')
+
+    def testMissingPath(self):
+        self.assertRaises(DiscoverException, self.session.cd, '/Server/nosuchserver')
+        self.assertRaises(DiscoverException, self.session.ls, '/NoSuchFolder', 'true', 'c')
+
+    def testSecurityProviders(self):
+        realm_path = '/SecurityConfiguration/base_domain/Realm/myrealm'
+        self.assertEqual(self.session.ls(realm_path + '/AuthenticationProvider', 'true', 'c'),
+                         ['DefaultAuthenticator', 'DefaultIdentityAsserter'])
+
+        provider = self.session.cd(realm_path + '/AuthenticationProvider/DefaultAuthenticator')
+        self.assertEqual(provider.getClass().getInterfaces(),
+                         ['weblogic.security.providers.authentication.DefaultAuthenticatorMBean'])
+        self.assertEqual(self.session.get('ControlFlag'), 'SUFFICIENT')
+
+        self.session.cd('../DefaultIdentityAsserter')
+        self.assertEqual(self.session.get('ActiveType'), ['AuthenticatedUser', 'weblogic-jwt-token'])
+
+    def testSystemResourceDescriptor(self):
+        resource_path = '/JDBCSystemResource/myds/JdbcResource/myds'
+        self.session.cd(resource_path)
+        self.assertEqual(self.session.get('DatasourceType'), 'GENERIC')
+
+        self.session.cd('JDBCDriverParams/NO_NAME_0')
+        self.assertEqual(self.session.get('DriverName'), 'oracle.jdbc.OracleDriver')
+        # offline JDBCDriverParams uses URL, while other folder types use Url
+        self.assertEqual(self.session.get('URL'), 'jdbc:oracle:thin:@//localhost:1521/orclpdb')
+        self.assertEqual(self.session.ls('Properties/NO_NAME_0/Property', 'true', 'c'), ['user'])
+
+        self.session.cd(resource_path + '/JDBCDataSourceParams/NO_NAME_0')
+        self.assertEqual(self.session.get('JNDIName'), 'jdbc/myds')
+
+    def testEmptyFolders(self):
+        domain_home = os.path.join(self._execution_dir, 'xml-discover-empty-folders')
+        config_dir = os.path.join(domain_home, 'config')
+        if not os.path.exists(config_dir):
+            os.makedirs(config_dir)
+        config_file = open(os.path.join(config_dir, 'config.xml'), 'w')
+        try:
+            config_file.write(_EMPTY_FOLDERS_CONFIG)
+        finally:
+            config_file.close()
+
+        session = XmlConfigSession(self.aliases)
+        session.readDomain(domain_home)
+        try:
+            # empty and unnamed folder elements are folders, named like the other unnamed folders
+            self.assertEqual(session.ls('/', 'true', 'c'), ['JTA', 'Server'])
+            self.assertEqual(session.ls('/JTA', 'true', 'c'), ['NO_NAME_0'])
+            self.assertEqual(session.ls('/JTA/NO_NAME_0', 'true', 'a').size(), 0)
+            self.assertEqual(session.ls('/Server/s1', 'true', 'c'), ['SSL'])
+            self.assertEqual(session.ls('/Server/s1/SSL', 'true', 'c'), ['NO_NAME_0'])
+
+            # empty attribute elements are still attributes, including a reference named like a folder type
+            attributes = session.ls('/Server/s1', 'true', 'a')
+            self.assertTrue(attributes.containsKey('ListenAddress'))
+            self.assertTrue(attributes.containsKey('Cluster'))
+            self.assertEqual(attributes.get('Cluster'), None)
+        finally:
+            session.closeDomain()
+
+    def testDiscoveredModel(self):
+        # discover the domain with offline WLST, and with the configuration files
+        wlst_topology, wlst_resources = self._discover(None)
+        topology, resources = self._discover(XmlConfigSession(self.aliases))
+
+        self.assertEqual(_to_dict(topology), _to_dict(wlst_topology))
+        self.assertEqual(_to_dict(resources), _to_dict(wlst_resources))
+
+        # the models are not empty
+        self.assertEqual(topology['Cluster']['mycluster']['FrontendHTTPPort'], 7080)
+        self.assertEqual(resources['JDBCSystemResource']['myds']['JdbcResource']['JDBCDriverParams']['URL'],
+                         'jdbc:oracle:thin:@//localhost:1521/orclpdb')
+
+    def _discover(self, session):
+        """
+        Discover the topology and resources of the test domain.
+        :param session: the session that reads the domain, or None to use offline WLST
+        :return: the topology and resources sections of the model
+        """
+        domain_home = os.path.abspath(self._domain_home)
+        arg_map = {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH: domain_home,
+            CommandLineArgUtil.DOMAIN_TYPEDEF: _WlsDomainTypedef()
+        }
+        model_context = ModelContext('test', arg_map)
+        topology = OrderedDict()
+        resources = OrderedDict()
+
+        wlst_helper.set_thread_session(session)
+        try:
+            # read the domain through WlstHelper, so that no lsa() or lsc() results of other tests are used
+            WlstHelper(PlatformLogger('wlsdeploy.discover'), ExceptionType.DISCOVER).read_domain(domain_home)
+            try:
+                TopologyDiscoverer(model_context, topology, LocationContext(), wlst_mode=WlstModes.OFFLINE,
+                                   aliases=self.aliases).discover()
+                ResourcesDiscoverer(model_context, resources, LocationContext(), wlst_mode=WlstModes.OFFLINE,
+                                    aliases=self.aliases).discover()
+            finally:
+                wlst_helper.close_domain()
+        finally:
+            wlst_helper.set_thread_session(None)
+        return topology, resources
+
+
+class _WlsDomainTypedef(object):
+    """
+    The domain typedef of a WLS domain, which has no system resources.
+    """
+
+    def get_domain_type(self):
+        return 'WLS'
+
+    def _is_system_name(self, name):
+        return False
+
+    is_system_coherence_cluster = _is_system_name
+    is_system_datasource = _is_system_name
+    is_system_file_store = _is_system_name
+    is_system_jms = _is_system_name
+    is_system_jms_server = _is_system_name
+    is_system_shutdown_class = _is_system_name
+    is_system_startup_class = _is_system_name
+    is_system_wldf = _is_system_name
+
+
+_EMPTY_FOLDERS_CONFIG = """<?xml version="1.0" encoding="UTF-8"?>
+<domain xmlns="http://xmlns.oracle.com/weblogic/domain">
+  <name>base_domain</name>
+  <jta/>
+  <server>
+    <name>s1</name>
+    <listen-address></listen-address>
+    <cluster/>
+    <ssl></ssl>
+  </server>
+</domain>
+"""
+
+
+def _to_dict(value):
+    """
+    Convert the ordered dictionaries of a discovered model to plain dictionaries, to compare them.
+    :param value: the model value
+    :return: the value, with its dictionaries converted
+    """
+    if hasattr(value, 'iteritems'):
+        result = dict()
+        for key, item in value.iteritems():
+            result[key] = _to_dict(item)
+        return result
+    return value
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -325,6 +325,7 @@ ECHO              -archive_file ^<archive-file^>
 ECHO              [-model_file ^<model-file^>]
 ECHO              [-domain_type ^<domain-type^>]
 ECHO              [-wlst_path ^<wlst-path^>]
+ECHO              [-discover_engine ^<discover-engine^>]
 ECHO              [-admin_url ^<admin-url^>
 ECHO               -admin_user ^<admin-user^>
 ECHO              ]
@@ -345,6 +346,10 @@ ECHO.
 ECHO         wlst-path      - the Oracle Home subdirectory of the wlst.cmd
 ECHO                          script to use (e.g., ^<ORACLE_HOME^>\soa)
 ECHO.
+ECHO         discover-engine - wlst (the default) to discover the domain with WLST,
+ECHO                          or xml to read the domain configuration files directly.
+ECHO                          Only used for offline discovery
+ECHO.
 ECHO         admin-url      - the admin server URL (used for online discovery)
 ECHO.
 ECHO         admin-user     - the admin username (used for online discovery)
@@ -57,6 +57,7 @@ usage() {
   echo "          [-model_file <model-file>]"
   echo "          [-domain_type <domain-type>]"
   echo "          [-wlst_path <wlst-path>]"
+  echo "          [-discover_engine <discover-engine>]"
   echo "          [-admin_url <admin-url>"
   echo "           -admin_user <admin-user>"
   echo "          ]"
@@ -77,6 +78,10 @@ usage() {
   echo "        wlst-path       - the Oracle Home subdirectory of the wlst.cmd"
   echo "                          script to use (e.g., <ORACLE_HOME>/soa)"
   echo ""
+  echo "        discover-engine - wlst (the default) to discover the domain with WLST,"
+  echo "                          or xml to read the domain configuration files directly."
+  echo "                          Only used for offline discovery"
+  echo ""
   echo "        admin-url       - the admin server URL (used for online deploy)"
   echo ""
   echo "        admin-user      - the admin username (used for online deploy)"